@@ -5,7 +5,6 @@ Basic MEV Simulation Example
 Demonstrates basic MEV simulation setup and execution.
 """
 
-import asyncio
 import sys
 import os
 from pathlib import Path
@@ -14,6 +13,9 @@ from pathlib import Path
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+from src.utils.helpers import run_async
+
+
 def create_basic_config():
     """Create a basic simulation configuration"""
     return {
@@ -141,7 +143,7 @@ async def run_basic_simulation():
 def main():
     """Main entry point"""
     try:
-        success = asyncio.run(run_basic_simulation())
+        success = run_async(run_basic_simulation())
         if success:
             print("\nBasic simulation configuration test passed!")
             print("To run full simulation:")
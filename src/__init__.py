@@ -8,22 +8,34 @@ __version__ = "0.1.0"
 __author__ = "Circle Research"
 __email__ = "paul.kwon@circle.com"
 
-# Core imports
-from .core.simulator import MEVSimulator
-from .core.mev_bot import MEVBot
-from .core.pool_manager import PoolManager
-from .core.latency_simulator import LatencySimulator
+from ._lazy import lazy_module_attrs
 
-# Deployment
-from .deployment.deployer import ContractDeployer
+# Public names are resolved lazily (PEP 562) so that importing a single
+# submodule, e.g. ``src.deployment.uniswap_v3_abis``, does not pull in
+# pandas/matplotlib through the analysis package.
+_LAZY_IMPORTS = {
+    # Core
+    "MEVSimulator": ".core.simulator",
+    "MEVBot": ".core.mev_bot",
+    "PoolManager": ".core.pool_manager",
+    "LatencySimulator": ".core.latency_simulator",
 
-# Analysis
-from .analysis.analyzer import MEVAnalyzer
-from .analysis.visualizer import MEVVisualizer
+    # Deployment
+    "ContractDeployer": ".deployment.deployer",
+
+    # Analysis
+    "MEVAnalyzer": ".analysis.analyzer",
+    "MEVVisualizer": ".analysis.visualizer",
+
+    # Utils
+    "BlockchainClient": ".utils.blockchain",
+    "setup_logging": ".utils.helpers",
+    "format_currency": ".utils.helpers",
+    "calculate_slippage": ".utils.helpers",
+}
+
+__getattr__, __dir__ = lazy_module_attrs(__name__, globals(), _LAZY_IMPORTS)
 
-# Utils
-from .utils.blockchain import BlockchainClient
-from .utils.helpers import setup_logging, format_currency, calculate_slippage
 
 __all__ = [
     "__version__",
@@ -46,6 +58,10 @@ __all__ = [
 import logging
 
 def _setup_default_logging():
+    # Respect logging configured by the host application (or a previous import)
+    if logging.root.handlers:
+        return
+    
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
@@ -67,6 +83,3 @@ PACKAGE_INFO = {
     "url": "https://github.com/paul-research/arc_mev_simulator",
     "keywords": ["MEV", "frontrun", "blockchain", "Arc Testnet"]
 }
-
-
-
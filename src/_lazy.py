@@ -0,0 +1,38 @@
+"""
+Lazy attribute loading for package __init__ modules (PEP 562)
+
+Kept outside src.utils on purpose: importing anything from that package runs
+its __init__, which loads web3 and structlog eagerly.
+"""
+
+import importlib
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_module_attrs(package: str,
+                      namespace: Dict[str, Any],
+                      lazy_imports: Dict[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build the module-level __getattr__/__dir__ pair for a lazily importing package
+
+    Args:
+        package: The package's __name__, anchoring the relative module paths
+        namespace: The package's globals(); resolved names are cached there
+        lazy_imports: Public name -> relative path of the module defining it
+
+    Returns:
+        Tuple of (__getattr__, __dir__) to assign at package level
+    """
+    def __getattr__(name: str) -> Any:
+        module_path = lazy_imports.get(name)
+        if module_path is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        value = getattr(importlib.import_module(module_path, package), name)
+        namespace[name] = value  # Cache so __getattr__ is only hit once per name
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(lazy_imports))
+
+    return __getattr__, __dir__
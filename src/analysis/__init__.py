@@ -8,9 +8,17 @@ This module provides comprehensive analysis tools for MEV simulation results:
 - Export utilities for research papers
 """
 
-from .analyzer import MEVAnalyzer
-from .visualizer import MEVVisualizer
-from .reporter import MEVReporter
+from .._lazy import lazy_module_attrs
+
+# Loaded on first access so that importing the package does not pull in
+# pandas/scipy/matplotlib until an analysis class is actually used.
+_LAZY_IMPORTS = {
+    "MEVAnalyzer": ".analyzer",
+    "MEVVisualizer": ".visualizer",
+    "MEVReporter": ".reporter",
+}
+
+__getattr__, __dir__ = lazy_module_attrs(__name__, globals(), _LAZY_IMPORTS)
 
 __all__ = [
     "MEVAnalyzer",
@@ -6,39 +6,344 @@ Statistical analysis tools for MEV simulation results.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union
 import logging
 from scipy import stats
 
+try:
+    import numba
+except ImportError:  # Optional: per-bot stats fall back to pandas groupby
+    numba = None
+
+try:
+    import polars as pl
+except ImportError:  # Optional: only needed for backend='polars'
+    pl = None
+
 logger = logging.getLogger(__name__)
 
 
+if numba is not None:
+    @numba.njit(cache=True, parallel=True)
+    def _gb_moments(codes, n_groups, x):
+        """
+        Per-group count, sum, sum of squares, min and max of one column
+        
+        Compiled once and reused for every per-bot metric. Each thread
+        accumulates into its own slice so the scatter-add has no write
+        races; slices are reduced at the end.
+        
+        Args:
+            codes: Group code per row (from pd.factorize, -1 rows are skipped)
+            n_groups: Number of distinct groups
+            x: Column values (numeric)
+            
+        Returns:
+            Tuple of (count, sum, sumsq, min, max) arrays of length n_groups
+        """
+        n_threads = numba.get_num_threads()
+        n_rows = codes.size
+        chunk = (n_rows + n_threads - 1) // n_threads
+        
+        c = np.zeros((n_threads, n_groups), np.int64)
+        s = np.zeros((n_threads, n_groups))
+        sq = np.zeros((n_threads, n_groups))
+        mn = np.full((n_threads, n_groups), np.inf)
+        mx = np.full((n_threads, n_groups), -np.inf)
+        
+        for t in numba.prange(n_threads):
+            for i in range(t * chunk, min((t + 1) * chunk, n_rows)):
+                k = codes[i]
+                if k < 0:
+                    continue
+                v = x[i]
+                c[t, k] += 1
+                s[t, k] += v
+                sq[t, k] += v * v
+                if v < mn[t, k]:
+                    mn[t, k] = v
+                if v > mx[t, k]:
+                    mx[t, k] = v
+        
+        for t in range(1, n_threads):
+            for k in range(n_groups):
+                c[0, k] += c[t, k]
+                s[0, k] += s[t, k]
+                sq[0, k] += sq[t, k]
+                mn[0, k] = min(mn[0, k], mn[t, k])
+                mx[0, k] = max(mx[0, k], mx[t, k])
+        
+        return c[0], s[0], sq[0], mn[0], mx[0]
+
+
 class MEVAnalyzer:
     """Core analysis engine for MEV simulation results"""
     
-    def __init__(self, data: pd.DataFrame):
+    # Row count above which per-bot stats use the numba kernel (when installed)
+    NUMBA_MIN_ROWS = 100_000
+    
+    # Identifier columns stored as pandas categoricals
+    CATEGORICAL_COLUMNS = ('bot_id', 'victim_type', 'victim_id')
+    
+    # Columns read by each analysis (used to load only what's needed from parquet)
+    ANALYSIS_COLUMNS = {
+        'mev': {'success', 'net_profit', 'victim_loss', 'gas_costs', 'bot_id', 'total_latency_ms'},
+        'victim': {'victim_loss', 'victim_id', 'victim_type'},
+        'latency': {'total_latency_ms', 'net_profit', 'success'},
+        'stats': {'net_profit', 'bot_id'}
+    }
+    
+    def __init__(self, data: Union[pd.DataFrame, 'pl.DataFrame'], backend: str = 'pandas'):
         """
         Initialize analyzer with simulation data
         
         Args:
-            data: DataFrame with MEV simulation results
+            data: DataFrame with MEV simulation results (pandas, or polars)
+            backend: 'pandas', or 'polars' to run the grouped aggregations
+                on a multi-threaded polars frame
         """
-        self.data = data
+        if backend not in ('pandas', 'polars'):
+            raise ValueError(f"Unknown backend: {backend}")
+        if backend == 'polars' and pl is None:
+            raise ImportError("polars is required for backend='polars'")
+        
+        self.backend = backend
+        self._pl = None
+        if pl is not None and isinstance(data, pl.DataFrame):
+            self._pl = data
+            data = data.to_pandas()
+        elif backend == 'polars':
+            self._pl = pl.from_pandas(data)
+        
         self.results = {}
+        self._data_version = 0
+        self._col_cache: Dict[str, np.ndarray] = {}
+        self._col_signature: Optional[tuple] = None
+        self._quality_cache: Optional[Dict[str, Any]] = None
+        self._quality_signature: Optional[tuple] = None
+        self._result_signatures: Dict[str, tuple] = {}
+        self._scan_cache: Optional[Dict[str, Any]] = None
+        self._scan_signature: Optional[tuple] = None
+        self._findings_cache: Optional[tuple] = None
+        
+        # Shallow copy so dtype conversions below don't touch the caller's frame
+        self.data = data.copy(deep=False)
+        
+        # Bind the log call once; when INFO is off, calls skip logger dispatch entirely
+        self._log_info = logger.info if logger.isEnabledFor(logging.INFO) else (lambda *args, **kwargs: None)
+        
+        # Group keys as categoricals: int codes instead of Python strings
+        for c in self.CATEGORICAL_COLUMNS:
+            if c in self.data.columns and self.data[c].dtype == object:
+                self.data[c] = self.data[c].astype('category')
+        
+    @classmethod
+    def from_polars(cls, df: 'pl.DataFrame') -> 'MEVAnalyzer':
+        """
+        Create an analyzer that runs its aggregations on a polars frame
+        
+        Args:
+            df: Polars DataFrame with MEV simulation results
+            
+        Returns:
+            MEVAnalyzer using the polars backend
+        """
+        return cls(df, backend='polars')
+    
+    @classmethod
+    def from_parquet(cls, path: str, analyses: tuple = ('mev', 'victim', 'latency'),
+                     backend: str = 'pandas') -> 'MEVAnalyzer':
+        """
+        Create an analyzer from a parquet file, reading only needed columns
+        
+        Args:
+            path: Path to the simulation results parquet file
+            analyses: Keys of ANALYSIS_COLUMNS that will be run
+            backend: 'pandas' or 'polars'
+            
+        Returns:
+            MEVAnalyzer over the selected columns
+        """
+        import pyarrow.parquet as pq
+        
+        wanted = set().union(*(cls.ANALYSIS_COLUMNS[a] for a in analyses))
+        columns = [c for c in pq.read_schema(path).names if c in wanted]
+        
+        data = pd.read_parquet(path, columns=columns, memory_map=True)
+        return cls(data, backend=backend)
+    
+    @property
+    def data(self) -> pd.DataFrame:
+        """Simulation results being analyzed"""
+        return self._data
+    
+    @data.setter
+    def data(self, value: pd.DataFrame) -> None:
+        self._data = value
+        self.invalidate()
+    
+    def invalidate(self) -> None:
+        """
+        Drop all cached columns, scans, quality counts and analysis results
         
+        Assigning a new frame to ``data`` does this automatically. Call it
+        after editing ``data`` in place (e.g. ``analyzer.data.loc[...] = ...``),
+        which the caches cannot detect on their own.
+        """
+        self._data_version += 1
+        self._col_cache.clear()
+        self._scan_cache = None
+        self._quality_cache = None
+    
+    def _col(self, name: str) -> np.ndarray:
+        """
+        Get a column as a NumPy array, cached after the first lookup
+        
+        Args:
+            name: Column name in the simulation data
+            
+        Returns:
+            Array view of the column
+        """
+        cache = self._column_cache()
+        arr = cache.get(name)
+        if arr is None:
+            arr = self.data[name].to_numpy(copy=False)
+            cache[name] = arr
+        return arr
+    
+    def _column_cache(self) -> Dict[str, np.ndarray]:
+        """
+        Column array cache for the current data
+        
+        Cached arrays and the fused scan are dropped when the data signature
+        changes, so no pass mixes columns of the old and new frames.
+        
+        Returns:
+            Dict of column name to array, valid for the current data
+        """
+        signature = self._data_signature()
+        if self._col_signature != signature:
+            self._col_cache.clear()
+            self._scan_cache = None
+            self._scan_signature = None
+            self._col_signature = signature
+        return self._col_cache
+    
+    def _data_signature(self) -> tuple:
+        """Version (bumped by invalidate), row count and columns of the current data"""
+        return (self._data_version, len(self.data), tuple(self.data.columns))
+    
+    def _cached_result(self, name: str) -> Optional[Dict[str, Any]]:
+        """Return a stored analysis result if the data hasn't changed since it ran"""
+        if self._result_signatures.get(name) == self._data_signature():
+            return self.results.get(name)
+        return None
+    
+    def _store_result(self, name: str, results: Dict[str, Any]) -> None:
+        """Store an analysis result with the data signature it was computed on"""
+        self.results[name] = results
+        self._result_signatures[name] = self._data_signature()
+    
+    def _fused_scan(self) -> Dict[str, Any]:
+        """
+        Compute every whole-column scalar the analyses need in one place
+        
+        Each metric column is loaded once and all of its reductions
+        (sum, sum of squares, min/max) are taken together. The
+        performance, latency and statistical-test passes read from this
+        shared result instead of re-reducing the same columns.
+        
+        Returns:
+            Dict of counts, sums and sums of squares (float64)
+        """
+        signature = self._data_signature()
+        if self._scan_cache is not None and self._scan_signature == signature:
+            return self._scan_cache
+        
+        profit = self._col('net_profit').astype(np.float64, copy=False)
+        scan = {
+            'n': len(self.data),
+            'success_count': int(np.count_nonzero(self._col('success'))),
+            'profit_sum': profit.sum(),
+            'profit_sumsq': np.dot(profit, profit),
+            'victim_loss_sum': self._col('victim_loss').sum(dtype=np.float64),
+            'gas_sum': self._col('gas_costs').sum(dtype=np.float64)
+        }
+        
+        if 'total_latency_ms' in self.data.columns:
+            lat = self._col('total_latency_ms').astype(np.float64, copy=False)
+            scan.update({
+                'latency_sum': lat.sum(),
+                'latency_sumsq': np.dot(lat, lat),
+                'latency_min': np.minimum.reduce(lat),
+                'latency_max': np.maximum.reduce(lat)
+            })
+        
+        self._scan_cache = scan
+        self._scan_signature = signature
+        return scan
+    
+    @staticmethod
+    def _std_from_moments(n: int, total: float, sumsq: float) -> float:
+        """Sample std (ddof=1) from count, sum and sum of squares"""
+        if n < 2:
+            return float('nan')
+        return float(np.sqrt(max(sumsq - total * total / n, 0.0) / (n - 1)))
+    
+    def _nunique(self, name: str, mask: Optional[np.ndarray] = None) -> int:
+        """
+        Count distinct non-null values in a column, optionally over masked rows
+        
+        Categorical columns are counted from their integer codes, so no
+        values are hashed.
+        
+        Args:
+            name: Column name in the simulation data
+            mask: Boolean row mask (all rows if None)
+            
+        Returns:
+            Number of distinct values
+        """
+        col = self.data[name]
+        if isinstance(col.dtype, pd.CategoricalDtype):
+            codes = col.cat.codes.to_numpy()
+            if mask is not None:
+                codes = codes[mask]
+            codes = codes[codes >= 0]
+            return int(np.count_nonzero(np.bincount(codes, minlength=len(col.cat.categories))))
+        
+        arr = col.to_numpy() if mask is None else col.to_numpy()[mask]
+        return len(pd.unique(arr[pd.notna(arr)]))
+    
     def analyze_mev_performance(self) -> Dict[str, Any]:
         """Analyze MEV bot performance metrics"""
-        logger.info("Analyzing MEV performance...")
+        cached = self._cached_result('mev_performance')
+        if cached is not None:
+            return cached
+        
+        self._log_info("Analyzing MEV performance...")
+        
+        if self.backend == 'polars':
+            total_attacks, successful_attacks, total_profit, total_victim_loss, total_gas_costs = self._pl.select(
+                pl.len(),
+                pl.col('success').cast(pl.Int64).sum(),
+                pl.col('net_profit').cast(pl.Float64).sum(),
+                pl.col('victim_loss').cast(pl.Float64).sum(),
+                pl.col('gas_costs').cast(pl.Float64).sum()
+            ).row(0)
+        else:
+            scan = self._fused_scan()
+            total_attacks = scan['n']
+            successful_attacks = scan['success_count']
+            total_profit = scan['profit_sum']
+            total_victim_loss = scan['victim_loss_sum']
+            total_gas_costs = scan['gas_sum']
         
         # Basic statistics
-        total_attacks = len(self.data)
-        successful_attacks = len(self.data[self.data['success'] == True])
         success_rate = successful_attacks / total_attacks if total_attacks > 0 else 0
         
         # Financial metrics
-        total_profit = self.data['net_profit'].sum()
-        total_victim_loss = self.data['victim_loss'].sum()
-        total_gas_costs = self.data['gas_costs'].sum()
         value_destroyed = total_victim_loss - total_profit
         
         # Efficiency metrics
@@ -63,32 +368,49 @@ class MEVAnalyzer:
         if 'bot_id' in self.data.columns:
             results['bot_performance'] = self._analyze_bot_performance()
         
-        self.results['mev_performance'] = results
+        self._store_result('mev_performance', results)
         return results
     
     def analyze_victim_impact(self) -> Dict[str, Any]:
         """Analyze impact on victim traders"""
-        logger.info("Analyzing victim impact...")
+        cached = self._cached_result('victim_impact')
+        if cached is not None:
+            return cached
         
-        victim_data = self.data[self.data['victim_loss'] > 0]
+        self._log_info("Analyzing victim impact...")
         
-        if victim_data.empty:
+        if self.backend == 'polars':
+            results = self._analyze_victim_impact_polars()
+            if 'error' not in results:
+                self._store_result('victim_impact', results)
+            return results
+        
+        # Mask the arrays instead of copying every column of the frame
+        vloss = self._col('victim_loss')
+        victim_mask = vloss > 0
+        victim_losses = vloss[victim_mask]
+        
+        if victim_losses.size == 0:
             return {'error': 'No victim data available'}
         
+        has_victim_id = 'victim_id' in self.data.columns
+        
         results = {
             'summary': {
-                'total_victims': victim_data['victim_id'].nunique() if 'victim_id' in victim_data.columns else 0,
-                'total_victim_trades': len(victim_data),
-                'total_victim_loss': victim_data['victim_loss'].sum(),
-                'avg_loss_per_trade': victim_data['victim_loss'].mean()
+                'total_victims': self._nunique('victim_id', victim_mask) if has_victim_id else 0,
+                'total_victim_trades': int(victim_losses.size),
+                'total_victim_loss': victim_losses.sum(dtype=np.float64),
+                'avg_loss_per_trade': victim_losses.mean(dtype=np.float64)
             }
         }
         
-        # By victim type if available
-        if 'victim_type' in victim_data.columns:
+        # By victim type if available (copy only the columns it groups on)
+        if 'victim_type' in self.data.columns:
+            cols = ['victim_type', 'victim_loss'] + (['victim_id'] if has_victim_id else [])
+            victim_data = self.data.loc[victim_mask, cols]
             results['by_victim_type'] = self._analyze_by_victim_type(victim_data)
         
-        self.results['victim_impact'] = results
+        self._store_result('victim_impact', results)
         return results
     
     def analyze_latency_impact(self) -> Dict[str, Any]:
@@ -96,46 +418,75 @@ class MEVAnalyzer:
         if 'total_latency_ms' not in self.data.columns:
             return {'error': 'Latency data not available'}
         
-        logger.info("Analyzing latency impact...")
-        
-        # Correlation analysis
-        latency_profit_corr = self.data['total_latency_ms'].corr(self.data['net_profit'])
-        latency_success_corr = self.data['total_latency_ms'].corr(self.data['success'].astype(int))
-        
-        # Performance by latency quartiles
-        self.data['latency_quartile'] = pd.qcut(self.data['total_latency_ms'], 4, labels=['Q1', 'Q2', 'Q3', 'Q4'])
-        quartile_performance = self.data.groupby('latency_quartile').agg({
-            'success': 'mean',
-            'net_profit': 'mean',
-            'total_latency_ms': 'mean'
-        }).round(6)
+        cached = self._cached_result('latency_impact')
+        if cached is not None:
+            return cached
+        
+        self._log_info("Analyzing latency impact...")
+        scan = self._fused_scan()
+        n = scan['n']
+        
+        # Correlation analysis (all pairs from one corrcoef call)
+        latency = self._col('total_latency_ms')
+        corr = np.corrcoef(np.stack([
+            latency.astype(np.float64, copy=False),
+            self._col('net_profit').astype(np.float64, copy=False),
+            self._col('success').astype(np.float64)
+        ]))
+        latency_profit_corr = corr[0, 1]
+        latency_success_corr = corr[0, 2]
+        
+        # Performance by latency quartiles (bins match pd.qcut's right-closed edges)
+        edges = np.quantile(latency, [0.25, 0.5, 0.75])
+        bins = np.searchsorted(edges, latency, side='left')
+        counts = np.bincount(bins, minlength=4)
+        sums = {
+            'success': np.bincount(bins, weights=self._col('success').astype(np.float64), minlength=4),
+            'net_profit': np.bincount(bins, weights=self._col('net_profit'), minlength=4),
+            'total_latency_ms': np.bincount(bins, weights=latency, minlength=4)
+        }
+        with np.errstate(divide='ignore', invalid='ignore'):
+            quartile_performance = {
+                f'Q{i + 1}': {name: round(float(total[i] / counts[i]), 6) for name, total in sums.items()}
+                for i in range(4)
+            }
         
         results = {
             'correlations': {
                 'latency_vs_profit': latency_profit_corr,
                 'latency_vs_success': latency_success_corr
             },
-            'quartile_analysis': quartile_performance.to_dict('index'),
+            'quartile_analysis': quartile_performance,
             'latency_stats': {
-                'mean': self.data['total_latency_ms'].mean(),
-                'median': self.data['total_latency_ms'].median(),
-                'std': self.data['total_latency_ms'].std(),
-                'min': self.data['total_latency_ms'].min(),
-                'max': self.data['total_latency_ms'].max()
+                'mean': scan['latency_sum'] / n,
+                'median': np.median(latency),
+                'std': self._std_from_moments(n, scan['latency_sum'], scan['latency_sumsq']),
+                'min': scan['latency_min'],
+                'max': scan['latency_max']
             }
         }
         
-        self.results['latency_impact'] = results
+        self._store_result('latency_impact', results)
         return results
     
     def run_statistical_tests(self) -> Dict[str, Any]:
         """Run statistical significance tests"""
-        logger.info("Running statistical tests...")
+        cached = self._cached_result('statistical_tests')
+        if cached is not None:
+            return cached
+        
+        self._log_info("Running statistical tests...")
         
         tests = {}
         
-        # Test if MEV is profitable on average
-        t_stat, p_value = stats.ttest_1samp(self.data['net_profit'], 0)
+        # Test if MEV is profitable on average (t from the cached moments, no extra pass)
+        scan = self._fused_scan()
+        n = scan['n']
+        profit_mean = scan['profit_sum'] / n
+        profit_std = self._std_from_moments(n, scan['profit_sum'], scan['profit_sumsq'])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t_stat = np.float64(profit_mean) / (profit_std / np.sqrt(n))
+        p_value = 2 * stats.t.sf(abs(t_stat), df=n - 1)
         tests['profitability_test'] = {
             'test': 'One-sample t-test (H0: profit = 0)',
             't_statistic': t_stat,
@@ -145,9 +496,9 @@ class MEVAnalyzer:
         }
         
         # Compare bot performance if multiple bots
-        if 'bot_id' in self.data.columns and len(self.data['bot_id'].unique()) > 1:
-            bot_groups = [group['net_profit'].values for name, group in self.data.groupby('bot_id')]
-            f_stat, p_value_anova = stats.f_oneway(*bot_groups)
+        bot_perf = self.analyze_mev_performance().get('bot_performance', {})
+        if len(bot_perf) > 1:
+            f_stat, p_value_anova = self._anova_from_bot_stats(bot_perf)
             
             tests['bot_comparison_test'] = {
                 'test': 'One-way ANOVA (H0: equal bot performance)',
@@ -157,82 +508,252 @@ class MEVAnalyzer:
                 'conclusion': 'Significant difference between bots' if p_value_anova < 0.05 else 'No significant difference'
             }
         
-        self.results['statistical_tests'] = tests
+        self._store_result('statistical_tests', tests)
         return tests
     
+    @staticmethod
+    def _anova_from_bot_stats(bot_perf: Dict[str, Any]) -> tuple:
+        """
+        One-way ANOVA on net profit from per-bot count, mean and std
+        
+        Gives the same F as stats.f_oneway on the raw groups without
+        splitting the data by bot again.
+        
+        Args:
+            bot_perf: Per-bot stats from _analyze_bot_performance
+            
+        Returns:
+            Tuple of (F statistic, p-value)
+        """
+        counts = np.array([b['total_attacks'] for b in bot_perf.values()], dtype=np.float64)
+        means = np.array([b['avg_profit_per_attack'] for b in bot_perf.values()], dtype=np.float64)
+        stds = np.array([b['profit_volatility'] for b in bot_perf.values()], dtype=np.float64)
+        
+        k = len(counts)
+        n = counts.sum()
+        grand_mean = (counts * means).sum() / n
+        
+        ss_between = (counts * (means - grand_mean) ** 2).sum()
+        ss_within = np.nansum(stds ** 2 * (counts - 1))
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            f_stat = (ss_between / (k - 1)) / (ss_within / (n - k))
+        p_value = stats.f.sf(f_stat, k - 1, n - k)
+        return f_stat, p_value
+    
     def _analyze_bot_performance(self) -> Dict[str, Any]:
         """Analyze individual bot performance"""
+        has_latency = 'total_latency_ms' in self.data.columns
+        
+        if self.backend == 'polars':
+            return self._analyze_bot_performance_polars(has_latency)
+        
+        if numba is not None and len(self.data) >= self.NUMBA_MIN_ROWS:
+            return self._analyze_bot_performance_numba(has_latency)
+        
+        # One grouped pass instead of a boolean mask per bot
+        agg_map = {
+            'success': ['size', 'sum', 'mean'],
+            'net_profit': ['sum', 'mean', 'std'],
+            'gas_costs': 'sum',
+            'victim_loss': 'sum'
+        }
+        if has_latency:
+            agg_map['total_latency_ms'] = 'mean'
+        
+        grouped = self.data.groupby('bot_id', sort=False, observed=True).agg(agg_map)
+        grouped.columns = ['_'.join(col) for col in grouped.columns]
+        
         bot_stats = {}
+        for bot_id, row in grouped.to_dict('index').items():
+            bot_stats[bot_id] = {
+                'total_attacks': int(row['success_size']),
+                'successful_attacks': int(row['success_sum']),
+                'success_rate': row['success_mean'],
+                'total_profit': row['net_profit_sum'],
+                'avg_profit_per_attack': row['net_profit_mean'],
+                'profit_volatility': row['net_profit_std'],
+                'total_gas_costs': row['gas_costs_sum'],
+                'victim_damage_caused': row['victim_loss_sum'],
+                'avg_latency': row['total_latency_ms_mean'] if has_latency else None
+            }
         
-        for bot_id in self.data['bot_id'].unique():
-            bot_data = self.data[self.data['bot_id'] == bot_id]
-            
+        return bot_stats
+    
+    def _analyze_bot_performance_numba(self, has_latency: bool) -> Dict[str, Any]:
+        """Per-bot stats from the compiled reduction kernel, for large datasets"""
+        codes, bot_ids = pd.factorize(self.data['bot_id'])
+        n_bots = len(bot_ids)
+        
+        # Same compiled kernel for every metric, no group split in between
+        counts, success_sum, _, _, _ = _gb_moments(codes, n_bots, self._col('success').astype(np.float64))
+        _, profit_sum, profit_sumsq, _, _ = _gb_moments(codes, n_bots, self._col('net_profit'))
+        _, gas_sum, _, _, _ = _gb_moments(codes, n_bots, self._col('gas_costs'))
+        _, vloss_sum, _, _, _ = _gb_moments(codes, n_bots, self._col('victim_loss'))
+        if has_latency:
+            _, latency_sum, _, _, _ = _gb_moments(codes, n_bots, self._col('total_latency_ms'))
+        
+        # Sample std (ddof=1) from the moments; NaN for single-row bots as in pandas
+        with np.errstate(divide='ignore', invalid='ignore'):
+            profit_std = np.sqrt(np.maximum(profit_sumsq - profit_sum ** 2 / counts, 0) / (counts - 1))
+        profit_std[counts < 2] = np.nan
+        
+        bot_stats = {}
+        for i, bot_id in enumerate(bot_ids):
+            n = counts[i]
             bot_stats[bot_id] = {
-                'total_attacks': len(bot_data),
-                'successful_attacks': len(bot_data[bot_data['success'] == True]),
-                'success_rate': (bot_data['success'].sum() / len(bot_data)) if len(bot_data) > 0 else 0,
-                'total_profit': bot_data['net_profit'].sum(),
-                'avg_profit_per_attack': bot_data['net_profit'].mean(),
-                'profit_volatility': bot_data['net_profit'].std(),
-                'total_gas_costs': bot_data['gas_costs'].sum(),
-                'victim_damage_caused': bot_data['victim_loss'].sum(),
-                'avg_latency': bot_data['total_latency_ms'].mean() if 'total_latency_ms' in bot_data.columns else None
+                'total_attacks': int(n),
+                'successful_attacks': int(success_sum[i]),
+                'success_rate': success_sum[i] / n,
+                'total_profit': profit_sum[i],
+                'avg_profit_per_attack': profit_sum[i] / n,
+                'profit_volatility': profit_std[i],
+                'total_gas_costs': gas_sum[i],
+                'victim_damage_caused': vloss_sum[i],
+                'avg_latency': latency_sum[i] / n if has_latency else None
             }
         
         return bot_stats
     
+    def _analyze_bot_performance_polars(self, has_latency: bool) -> Dict[str, Any]:
+        """Per-bot stats from a polars group_by (aggregations run in parallel)"""
+        aggs = [
+            pl.len().alias('total_attacks'),
+            pl.col('success').cast(pl.Int64).sum().alias('successful_attacks'),
+            pl.col('success').cast(pl.Float64).mean().alias('success_rate'),
+            pl.col('net_profit').sum().alias('total_profit'),
+            pl.col('net_profit').mean().alias('avg_profit_per_attack'),
+            pl.col('net_profit').std().alias('profit_volatility'),
+            pl.col('gas_costs').sum().alias('total_gas_costs'),
+            pl.col('victim_loss').sum().alias('victim_damage_caused')
+        ]
+        if has_latency:
+            aggs.append(pl.col('total_latency_ms').mean().alias('avg_latency'))
+        
+        grouped = self._pl.drop_nulls('bot_id').group_by('bot_id', maintain_order=True).agg(aggs)
+        
+        bot_stats = {}
+        for row in grouped.iter_rows(named=True):
+            bot_id = row.pop('bot_id')
+            if not has_latency:
+                row['avg_latency'] = None
+            bot_stats[bot_id] = row
+        
+        return bot_stats
+    
+    def _analyze_victim_impact_polars(self) -> Dict[str, Any]:
+        """Victim impact summary and per-type breakdown on the polars frame"""
+        victims = self._pl.filter(pl.col('victim_loss') > 0)
+        
+        if victims.height == 0:
+            return {'error': 'No victim data available'}
+        
+        has_victim_id = 'victim_id' in victims.columns
+        
+        total_victims, total_loss, avg_loss = victims.select(
+            pl.col('victim_id').drop_nulls().n_unique() if has_victim_id else pl.lit(0),
+            pl.col('victim_loss').cast(pl.Float64).sum(),
+            pl.col('victim_loss').cast(pl.Float64).mean()
+        ).row(0)
+        
+        results = {
+            'summary': {
+                'total_victims': total_victims,
+                'total_victim_trades': victims.height,
+                'total_victim_loss': total_loss,
+                'avg_loss_per_trade': avg_loss
+            }
+        }
+        
+        if 'victim_type' in victims.columns:
+            grouped = victims.drop_nulls('victim_type').group_by('victim_type', maintain_order=True).agg(
+                pl.len().alias('attack_count'),
+                pl.col('victim_loss').sum().alias('total_loss'),
+                pl.col('victim_loss').mean().alias('avg_loss'),
+                pl.col('victim_loss').max().alias('max_loss'),
+                (pl.col('victim_id').drop_nulls().n_unique() if has_victim_id else pl.lit(None)).alias('victims_affected')
+            )
+            results['by_victim_type'] = {
+                row.pop('victim_type'): row for row in grouped.iter_rows(named=True)
+            }
+        
+        return results
+    
     def _analyze_by_victim_type(self, victim_data: pd.DataFrame) -> Dict[str, Any]:
         """Analyze victim impact by victim type"""
-        type_stats = {}
+        has_victim_id = 'victim_id' in victim_data.columns
         
-        for victim_type in victim_data['victim_type'].unique():
-            type_data = victim_data[victim_data['victim_type'] == victim_type]
-            
+        agg_map = {'victim_loss': ['size', 'sum', 'mean', 'max']}
+        if has_victim_id:
+            agg_map['victim_id'] = 'nunique'
+        
+        grouped = victim_data.groupby('victim_type', sort=False, observed=True).agg(agg_map)
+        grouped.columns = ['_'.join(col) for col in grouped.columns]
+        
+        type_stats = {}
+        for victim_type, row in grouped.to_dict('index').items():
             type_stats[victim_type] = {
-                'attack_count': len(type_data),
-                'total_loss': type_data['victim_loss'].sum(),
-                'avg_loss': type_data['victim_loss'].mean(),
-                'max_loss': type_data['victim_loss'].max(),
-                'victims_affected': type_data['victim_id'].nunique() if 'victim_id' in type_data.columns else None
+                'attack_count': int(row['victim_loss_size']),
+                'total_loss': row['victim_loss_sum'],
+                'avg_loss': row['victim_loss_mean'],
+                'max_loss': row['victim_loss_max'],
+                'victims_affected': int(row['victim_id_nunique']) if has_victim_id else None
             }
         
         return type_stats
     
-    def generate_summary_report(self) -> Dict[str, Any]:
-        """Generate comprehensive summary report"""
-        logger.info("Generating summary report...")
+    def generate_summary_report(self, include_findings: bool = True) -> Dict[str, Any]:
+        """
+        Generate comprehensive summary report
         
-        # Run all analyses if not already done
-        if 'mev_performance' not in self.results:
-            self.analyze_mev_performance()
+        Args:
+            include_findings: Format the human-readable key findings; sweeps
+                that only consume analysis_results can pass False to skip it
+                
+        Returns:
+            Summary dict with dataset info, key findings and analysis results
+        """
+        self._log_info("Generating summary report...")
         
-        if 'victim_impact' not in self.results:
-            self.analyze_victim_impact()
+        # Run all analyses (each returns its stored result if the data is unchanged)
+        self.analyze_mev_performance()
+        self.analyze_victim_impact()
         
-        if 'total_latency_ms' in self.data.columns and 'latency_impact' not in self.results:
+        if 'total_latency_ms' in self.data.columns:
             self.analyze_latency_impact()
         
-        if 'statistical_tests' not in self.results:
-            self.run_statistical_tests()
+        self.run_statistical_tests()
         
         # Compile summary
         summary = {
             'dataset_info': {
                 'total_records': len(self.data),
                 'columns': list(self.data.columns),
-                'data_quality': {
-                    'missing_values': self.data.isnull().sum().to_dict(),
-                    'duplicate_records': self.data.duplicated().sum()
-                }
+                'data_quality': self._data_quality()
             },
-            'key_findings': self._extract_key_findings(),
+            'key_findings': self._extract_key_findings() if include_findings else [],
             'analysis_results': self.results
         }
         
         return summary
     
+    def _data_quality(self) -> Dict[str, Any]:
+        """Missing-value and duplicate counts, computed once per version of the data"""
+        signature = self._data_signature()
+        if self._quality_cache is None or self._quality_signature != signature:
+            self._quality_cache = {
+                'missing_values': {c: int(self.data[c].isna().to_numpy().sum()) for c in self.data.columns},
+                'duplicate_records': int(self.data.duplicated().sum())
+            }
+            self._quality_signature = signature
+        return self._quality_cache
+    
     def _extract_key_findings(self) -> List[str]:
-        """Extract key findings from analysis results"""
+        """Extract key findings from analysis results (formatted once per set of results)"""
+        sources = tuple(self.results.get(name) for name in ('mev_performance', 'victim_impact', 'statistical_tests'))
+        if self._findings_cache is not None and all(a is b for a, b in zip(self._findings_cache[0], sources)):
+            return list(self._findings_cache[1])
+        
         findings = []
         
         if 'mev_performance' in self.results:
@@ -259,11 +780,13 @@ class MEVAnalyzer:
                 profit_test = tests['profitability_test']
                 findings.append(f"MEV profitability: {profit_test['conclusion']}")
         
-        return findings
+        self._findings_cache = (sources, findings)
+        return list(findings)
     
     def export_to_csv(self, output_path: str) -> None:
         """Export analysis results to CSV"""
-        summary = self.generate_summary_report()
+        # Only the MEV performance figures are exported; skip the full report
+        self.analyze_mev_performance()
         
         # Create summary DataFrame
         summary_data = []
@@ -279,7 +802,7 @@ class MEVAnalyzer:
         
         summary_df = pd.DataFrame(summary_data, columns=['Metric', 'Value'])
         summary_df.to_csv(output_path, index=False)
-        logger.info(f"Analysis exported to {output_path}")
+        self._log_info(f"Analysis exported to {output_path}")
 
 
 # Example usage
@@ -13,11 +13,17 @@ This module simulates the real-world latency factors that affect MEV bot perform
 import asyncio
 import random
 import time
+from collections import deque
 from dataclasses import dataclass
-from typing import Dict, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Any
 from enum import Enum
 import logging
 
+import numpy as np
+
+from .monte_carlo import simulate_rounds
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,7 +36,13 @@ class LatencyType(Enum):
     NETWORK_SUBMISSION = "network_submission"
 
 
-@dataclass
+# Fixed iteration order and names for per-type arrays
+_LATENCY_TYPES = tuple(LatencyType)
+_TYPE_NAMES = tuple(lt.value for lt in _LATENCY_TYPES)
+_TYPE_INDEX = {lt: i for i, lt in enumerate(_LATENCY_TYPES)}
+
+
+@dataclass(slots=True, frozen=True)
 class LatencyProfile:
     """Latency profile for a specific MEV bot infrastructure"""
     block_detection: float      # Block detection latency (ms)
@@ -59,9 +71,76 @@ class LatencyProfile:
         }
 
 
+@dataclass(slots=True)
+class _RunningStats:
+    """Online count/mean/variance/min/max (Welford's algorithm)"""
+    count: int = 0
+    mean: float = 0.0
+    M2: float = 0.0
+    min: float = float('inf')
+    max: float = float('-inf')
+    
+    def add(self, x: float) -> None:
+        """Fold one sample into the running statistics"""
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.M2 += delta * (x - self.mean)
+        if x < self.min:
+            self.min = x
+        if x > self.max:
+            self.max = x
+    
+    def add_batch(self, values: np.ndarray) -> None:
+        """Fold an array of samples in at once (Chan et al. parallel combine)"""
+        n = values.size
+        if n == 0:
+            return
+        batch_mean = float(values.mean())
+        batch_M2 = float(((values - batch_mean) ** 2).sum())
+        total = self.count + n
+        delta = batch_mean - self.mean
+        self.mean += delta * n / total
+        self.M2 += batch_M2 + delta * delta * self.count * n / total
+        self.count = total
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+    
+    def to_dict(self) -> Dict[str, float]:
+        """Statistics in the get_statistics format (population std)"""
+        if self.count == 0:
+            return {'count': 0, 'mean': 0, 'min': 0, 'max': 0, 'std': 0}
+        return {
+            'count': self.count,
+            'mean': self.mean,
+            'min': self.min,
+            'max': self.max,
+            'std': (self.M2 / self.count) ** 0.5
+        }
+
+
+@lru_cache(maxsize=64)
+def _derive_profile(profile: LatencyProfile) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Per-type base latencies and jitter ranges for a profile, in _LATENCY_TYPES order
+    
+    Cached per profile value, so bots sharing a profile (e.g. the PROFILES
+    tiers) share the same read-only arrays. The cache is bounded because
+    every custom or sweep-generated profile is a new key.
+    """
+    base = np.array([getattr(profile, name) for name in _TYPE_NAMES], dtype=np.float64)
+    scale = base * profile.jitter
+    base.flags.writeable = False
+    scale.flags.writeable = False
+    return base, scale
+
+
 class LatencySimulator:
     """Simulates realistic network latency for MEV bots"""
     
+    # Default raw samples kept per latency type (older samples are overwritten)
+    HISTORY_SIZE = 1024
+    
     # Predefined latency profiles for different infrastructure tiers
     PROFILES = {
         "high_performance": LatencyProfile(
@@ -98,61 +177,146 @@ class LatencySimulator:
         )
     }
     
-    def __init__(self, bot_id: str, profile: Optional[LatencyProfile] = None):
+    def __init__(self, bot_id: str, profile: Optional[LatencyProfile] = None,
+                 seed: Optional[int] = None):
         """
         Initialize latency simulator
         
         Args:
             bot_id: Unique identifier for the bot
             profile: Custom latency profile, or None to use default
+            seed: Seed for this bot's jitter RNG (None for nondeterministic)
         """
         self.bot_id = bot_id
         self.profile = profile or self.PROFILES["medium_performance"]
-        self.latency_history: Dict[LatencyType, list] = {
-            lt: [] for lt in LatencyType
-        }
+        
+        # Own RNG per bot: reproducible when seeded, no shared module state
+        self._rand = random.Random(seed)
+        self._uniform = self._rand.uniform
+        
+        # Per-type state is held in lists indexed by _TYPE_INDEX, so a sample
+        # costs one enum hash and then plain list indexing
+        
+        # Fixed-size float32 ring buffers of recent raw samples; stats are online
+        self._history_size = self.HISTORY_SIZE
+        self._ring = np.empty((len(_LATENCY_TYPES), self._history_size), dtype=np.float32)
+        self._ring_idx: List[int] = [0] * len(_LATENCY_TYPES)
+        self._stats: List[_RunningStats] = [_RunningStats() for _ in _LATENCY_TYPES]
+        self._total_stats = _RunningStats()
+        
+        # Resolve per-type base latencies and jitter ranges once instead of per sample
+        base, scale = _derive_profile(self.profile)
+        self._base_by_type: List[float] = base.tolist()
+        self._jitter_scale_by_type: List[float] = scale.tolist()
         
     @classmethod
-    def from_config(cls, bot_id: str, config: Dict[str, float]) -> "LatencySimulator":
+    def from_config(cls, bot_id: str, config: Dict[str, float],
+                    seed: Optional[int] = None) -> "LatencySimulator":
         """Create latency simulator from configuration dictionary"""
         profile = LatencyProfile(**config)
-        return cls(bot_id, profile)
+        return cls(bot_id, profile, seed=seed)
     
     def apply_jitter(self, base_latency: float) -> float:
         """Apply random jitter to base latency"""
         jitter_range = base_latency * self.profile.jitter
-        jitter = (random.random() - 0.5) * 2 * jitter_range
+        jitter = (self._rand.random() - 0.5) * 2 * jitter_range
         return max(0, base_latency + jitter)
     
-    async def simulate_latency(self, latency_type: LatencyType) -> float:
+    def sample_latency(self, latency_type: LatencyType) -> float:
         """
-        Simulate latency for a specific operation type
+        Draw and record a jittered latency without waiting for it
         
         Args:
             latency_type: Type of operation to simulate
             
         Returns:
-            Actual latency experienced (in milliseconds)
+            Sampled latency (in milliseconds)
         """
-        # Get base latency for this operation type
-        base_latency = getattr(self.profile, latency_type.value)
+        i = _TYPE_INDEX[latency_type]
         
-        # Apply jitter
-        actual_latency = self.apply_jitter(base_latency)
+        # Apply jitter with the precomputed +/- range for this operation type
+        scale = self._jitter_scale_by_type[i]
+        actual_latency = self._base_by_type[i] + self._uniform(-scale, scale)
+        if actual_latency < 0.0:
+            actual_latency = 0.0
         
+        self._record(i, actual_latency)
+        return actual_latency
+    
+    def record_latency(self, latency_type: LatencyType, actual_latency: float) -> None:
+        """
+        Record a latency sample drawn elsewhere (e.g. a batched draw)
+        
+        Args:
+            latency_type: Type of operation the sample belongs to
+            actual_latency: Jittered latency (in milliseconds)
+        """
+        self._record(_TYPE_INDEX[latency_type], actual_latency)
+    
+    def _record(self, i: int, actual_latency: float) -> None:
+        """Record a sample for the latency type at index i"""
         # Record for analytics
-        self.latency_history[latency_type].append(actual_latency)
+        idx = self._ring_idx[i]
+        self._ring[i, idx % self._history_size] = actual_latency
+        self._ring_idx[i] = idx + 1
+        self._stats[i].add(actual_latency)
+        self._total_stats.add(actual_latency)
         
-        # Log the latency
-        logger.debug(
-            f"🕐 [{self.bot_id}] {latency_type.value}: {actual_latency:.1f}ms"
-        )
+        # Log the latency (skip formatting entirely when DEBUG is off)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "🕐 [%s] %s: %.1fms", self.bot_id, _TYPE_NAMES[i], actual_latency
+            )
+    
+    def record_batch(self, latency_type: LatencyType, samples: np.ndarray) -> None:
+        """
+        Fold many samples into the running statistics (raw history is not kept)
+        
+        Args:
+            latency_type: Type of operation the samples belong to
+            samples: Jittered latencies (in milliseconds)
+        """
+        self._stats[_TYPE_INDEX[latency_type]].add_batch(samples)
+        self._total_stats.add_batch(samples)
+    
+    async def simulate_latency(self, latency_type: LatencyType) -> float:
+        """
+        Simulate latency for a specific operation type
+        
+        Args:
+            latency_type: Type of operation to simulate
+            
+        Returns:
+            Actual latency experienced (in milliseconds)
+        """
+        actual_latency = self.sample_latency(latency_type)
         
         # Actually sleep for the latency duration
         await asyncio.sleep(actual_latency / 1000.0)  # Convert ms to seconds
         
         return actual_latency
     
+    async def composite_delay(self, *latency_types: LatencyType) -> float:
+        """
+        Simulate consecutive operations with a single sleep
+        
+        Each stage is sampled and recorded separately, so per-type statistics
+        are unchanged; only the event-loop wait is merged.
+        
+        Args:
+            *latency_types: Operation types run back to back
+            
+        Returns:
+            Total latency experienced (in milliseconds)
+        """
+        total_latency = 0.0
+        for latency_type in latency_types:
+            total_latency += self.sample_latency(latency_type)
+        
+        await asyncio.sleep(total_latency / 1000.0)
+        
+        return total_latency
+    
     async def block_detection_delay(self) -> float:
         """Simulate block detection latency"""
         return await self.simulate_latency(LatencyType.BLOCK_DETECTION)
@@ -175,47 +339,54 @@ class LatencySimulator:
     
     def get_statistics(self) -> Dict[str, Dict[str, float]]:
         """Get latency statistics for analysis"""
-        stats = {}
-        
-        for latency_type, history in self.latency_history.items():
-            if not history:
-                stats[latency_type.value] = {
-                    'count': 0,
-                    'mean': 0,
-                    'min': 0,
-                    'max': 0,
-                    'std': 0
-                }
-                continue
-                
-            stats[latency_type.value] = {
-                'count': len(history),
-                'mean': sum(history) / len(history),
-                'min': min(history),
-                'max': max(history),
-                'std': (sum((x - sum(history) / len(history))**2 for x in history) / len(history))**0.5
-            }
+        # Per-type stats are maintained online as samples arrive
+        stats = {
+            name: running.to_dict()
+            for name, running in zip(_TYPE_NAMES, self._stats)
+        }
         
-        # Add total statistics
-        all_latencies = []
-        for history in self.latency_history.values():
-            all_latencies.extend(history)
-            
-        if all_latencies:
-            stats['total'] = {
-                'count': len(all_latencies),
-                'mean': sum(all_latencies) / len(all_latencies),
-                'min': min(all_latencies),
-                'max': max(all_latencies),
-                'std': (sum((x - sum(all_latencies) / len(all_latencies))**2 for x in all_latencies) / len(all_latencies))**0.5
-            }
+        # Total across all operation types, also maintained online
+        if self._total_stats.count:
+            stats['total'] = self._total_stats.to_dict()
         
         return stats
     
+    def get_recent_latencies(self, latency_type: LatencyType) -> np.ndarray:
+        """
+        Get the most recent raw samples for a latency type, oldest first
+        
+        Args:
+            latency_type: Type of operation
+            
+        Returns:
+            Up to the buffer size (HISTORY_SIZE unless preallocated) samples, in ms
+        """
+        i = _TYPE_INDEX[latency_type]
+        buf = self._ring[i]
+        idx = self._ring_idx[i]
+        if idx <= self._history_size:
+            return buf[:idx].copy()
+        start = idx % self._history_size
+        return np.concatenate((buf[start:], buf[:start]))
+    
+    def preallocate(self, n_samples: int) -> None:
+        """
+        Size the raw-sample buffers so a run of n_samples per type is kept whole
+        
+        Clears the raw samples; running statistics are unaffected.
+        
+        Args:
+            n_samples: Expected samples per latency type (e.g. number of rounds)
+        """
+        self._history_size = max(n_samples, 1)
+        self._ring = np.empty((len(_LATENCY_TYPES), self._history_size), dtype=np.float32)
+        self._ring_idx = [0] * len(_LATENCY_TYPES)
+    
     def reset_history(self) -> None:
         """Reset latency history for new simulation run"""
-        for latency_type in LatencyType:
-            self.latency_history[latency_type] = []
+        self._ring_idx = [0] * len(_LATENCY_TYPES)
+        self._stats = [_RunningStats() for _ in _LATENCY_TYPES]
+        self._total_stats = _RunningStats()
     
     def compare_with(self, other: "LatencySimulator") -> Dict[str, float]:
         """
@@ -224,26 +395,25 @@ class LatencySimulator:
         Returns:
             Dictionary with comparison metrics
         """
-        self_stats = self.get_statistics()
-        other_stats = other.get_statistics()
-        
-        comparison = {}
+        self_means, self_counts = self._means_and_counts()
+        other_means, other_counts = other._means_and_counts()
         
-        for latency_type in LatencyType:
-            type_name = latency_type.value
-            
-            if (type_name in self_stats and type_name in other_stats and
-                self_stats[type_name]['count'] > 0 and other_stats[type_name]['count'] > 0):
-                
-                self_mean = self_stats[type_name]['mean']
-                other_mean = other_stats[type_name]['mean']
-                
-                comparison[type_name] = {
-                    'advantage_ms': other_mean - self_mean,
-                    'advantage_pct': ((other_mean - self_mean) / other_mean) * 100 if other_mean > 0 else 0
-                }
+        # All types at once; only types both simulators have sampled are reported
+        diff = other_means - self_means
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pct = np.where(other_means > 0, diff / other_means * 100, 0.0)
+        sampled = (self_counts > 0) & (other_counts > 0)
         
-        return comparison
+        return {
+            _TYPE_NAMES[i]: {'advantage_ms': float(diff[i]), 'advantage_pct': float(pct[i])}
+            for i in np.flatnonzero(sampled)
+        }
+    
+    def _means_and_counts(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Per-type running means and sample counts in _LATENCY_TYPES order"""
+        means = np.array([stats.mean for stats in self._stats])
+        counts = np.array([stats.count for stats in self._stats])
+        return means, counts
     
     def __str__(self) -> str:
         """String representation of latency simulator"""
@@ -258,15 +428,50 @@ class LatencySimulator:
 class CompetitionLatencyManager:
     """Manages latency simulation for multiple competing MEV bots"""
     
-    def __init__(self):
+    # Recent rounds kept in competition_history (aggregates cover every round)
+    HISTORY_ROUNDS = 1000
+    
+    def __init__(self, fast_mode: bool = True, seed: Optional[int] = None):
+        """
+        Initialize competition manager
+        
+        Args:
+            fast_mode: Sample every bot's latency up front and sleep once for
+                the slowest; False runs one sleeping task per bot
+            seed: Seed for the vectorized jitter draws (None for nondeterministic)
+        """
         self.simulators: Dict[str, LatencySimulator] = {}
-        self.competition_history: list = []
+        self.competition_history: deque = deque(maxlen=self.HISTORY_ROUNDS)
+        self.fast_mode = fast_mode
+        
+        # Running per-bot aggregates so stats don't rescan every round
+        self._total_rounds = 0
+        self._bot_agg: Dict[str, Dict[str, float]] = {}
+        
+        # Per-bot arrays (insertion order) for vectorized jitter draws
+        self._rng = np.random.default_rng(seed)
+        self._bot_ids: list = []
+        self._base_latencies: Dict[LatencyType, np.ndarray] = {}
+        self._jitters = np.empty(0)
     
-    def add_bot(self, bot_id: str, profile: LatencyProfile) -> None:
-        """Add a bot with its latency profile"""
-        self.simulators[bot_id] = LatencySimulator(bot_id, profile)
+    def add_bot(self, bot_id: str, profile: LatencyProfile, seed: Optional[int] = None) -> None:
+        """Add a bot with its latency profile (seed applies to its per-task jitter)"""
+        self.simulators[bot_id] = LatencySimulator(bot_id, profile, seed=seed)
+        self._rebuild_latency_arrays()
         logger.info(f"Added bot {bot_id} with latency profile: {profile}")
     
+    def _rebuild_latency_arrays(self) -> None:
+        """Rebuild the per-bot base latency and jitter arrays"""
+        simulators = list(self.simulators.values())
+        self._bot_ids = list(self.simulators.keys())
+        bases = np.array(
+            [_derive_profile(sim.profile)[0] for sim in simulators], dtype=np.float64
+        ).reshape(len(simulators), len(_LATENCY_TYPES))
+        self._base_latencies = {
+            lt: np.ascontiguousarray(bases[:, i]) for i, lt in enumerate(_LATENCY_TYPES)
+        }
+        self._jitters = np.array([sim.profile.jitter for sim in simulators], dtype=np.float64)
+    
     def get_simulator(self, bot_id: str) -> Optional[LatencySimulator]:
         """Get latency simulator for a specific bot"""
         return self.simulators.get(bot_id)
@@ -278,28 +483,57 @@ class CompetitionLatencyManager:
         Returns:
             Dictionary mapping bot_id to (rank, latency) tuples
         """
-        # Start all bots simultaneously
-        tasks = {}
-        start_time = time.time()
-        
-        for bot_id, simulator in self.simulators.items():
-            task = asyncio.create_task(simulator.simulate_latency(operation_type))
-            tasks[bot_id] = task
-        
-        # Wait for all to complete and collect results
-        results = {}
-        for bot_id, task in tasks.items():
-            latency = await task
-            completion_time = time.time() - start_time
-            results[bot_id] = (completion_time * 1000, latency)  # Convert to ms
-        
-        # Rank bots by completion time
-        sorted_results = sorted(results.items(), key=lambda x: x[1][0])
-        ranked_results = {}
+        if self.fast_mode:
+            return await self._simulate_round_batched(operation_type)
+        
+        # Start all bots simultaneously. Only the sleeps are awaited, so bots
+        # finish in latency order and the completion time is the latency.
+        bot_ids = list(self.simulators.keys())
+        latencies = await asyncio.gather(
+            *(self.simulators[bot_id].simulate_latency(operation_type) for bot_id in bot_ids)
+        )
         
-        for rank, (bot_id, (completion_time, latency)) in enumerate(sorted_results, 1):
-            ranked_results[bot_id] = (rank, completion_time, latency)
+        return self._rank_round(operation_type, dict(zip(bot_ids, latencies)))
+    
+    async def _simulate_round_batched(self, operation_type: LatencyType) -> Dict[str, Tuple[str, float]]:
+        """
+        Competition round with one sleep instead of one task per bot
+        
+        All bots start together and nothing else runs while they wait, so
+        the outcome is fixed by the sampled latencies. The round still takes
+        as long as the slowest bot.
+        """
+        # One vectorized draw for every bot's jitter
+        base = self._base_latencies.get(operation_type)
+        if base is None or base.size == 0:
+            return {}
+        deltas = self._rng.uniform(-1.0, 1.0, size=base.size) * base * self._jitters
+        actual = np.maximum(0.0, base + deltas).tolist()
+        
+        latencies = dict(zip(self._bot_ids, actual))
+        for bot_id, latency in latencies.items():
+            self.simulators[bot_id].record_latency(operation_type, latency)
+        
+        await asyncio.sleep(max(actual) / 1000.0)
+        
+        return self._rank_round(operation_type, latencies)
+    
+    def _rank_round(self, operation_type: LatencyType, latencies: Dict[str, float]) -> Dict[str, Tuple[str, float]]:
+        """Rank bots by latency (= completion time) and record the round"""
+        ranked_results = {}
+        for rank, (bot_id, latency) in enumerate(sorted(latencies.items(), key=lambda x: x[1]), 1):
+            ranked_results[bot_id] = (rank, latency, latency)
             
+            agg = self._bot_agg.get(bot_id)
+            if agg is None:
+                agg = self._bot_agg[bot_id] = {'rank_sum': 0, 'rank_count': 0, 'wins': 0, 'time_sum': 0.0}
+            agg['rank_sum'] += rank
+            agg['rank_count'] += 1
+            agg['wins'] += rank == 1
+            agg['time_sum'] += latency
+        
+        self._total_rounds += 1
+        
         # Record competition history
         self.competition_history.append({
             'operation': operation_type.value,
@@ -309,41 +543,97 @@ class CompetitionLatencyManager:
         
         return ranked_results
     
+    async def run_rounds(self, n_rounds: int, operation_type: LatencyType) -> Dict[str, Any]:
+        """
+        Run a known number of competition rounds with preallocated histories
+        
+        Args:
+            n_rounds: Number of rounds to run
+            operation_type: Operation the bots compete on
+            
+        Returns:
+            Competition statistics after the rounds
+        """
+        for simulator in self.simulators.values():
+            simulator.preallocate(n_rounds)
+        
+        for _ in range(n_rounds):
+            await self.simulate_competition_round(operation_type)
+        
+        return self.get_competition_stats()
+    
+    def run_monte_carlo(self, n_rounds: int, operation_type: LatencyType) -> Dict[str, Any]:
+        """
+        Simulate many competition rounds at once without real-time pacing
+        
+        Use this for statistical studies; simulate_competition_round is only
+        needed when rounds must take wall-clock time. Samples feed each bot's
+        latency statistics but are not added to competition_history.
+        
+        Args:
+            n_rounds: Number of rounds to simulate
+            operation_type: Operation the bots compete on
+            
+        Returns:
+            Dictionary with per-bot avg_rank, win_rate and avg_completion_time
+        """
+        if not self.simulators or n_rounds <= 0:
+            return {}
+        
+        ranks, latencies = simulate_rounds(
+            self._base_latencies[operation_type], self._jitters, n_rounds, self._rng
+        )
+        
+        avg_ranks = ranks.mean(axis=0)
+        win_rates = (ranks == 1).mean(axis=0)
+        avg_times = latencies.mean(axis=0)
+        
+        stats = {
+            'total_rounds': n_rounds,
+            'operation': operation_type.value,
+            'bot_performance': {}
+        }
+        for i, bot_id in enumerate(self._bot_ids):
+            self.simulators[bot_id].record_batch(operation_type, latencies[:, i])
+            stats['bot_performance'][bot_id] = {
+                'avg_rank': float(avg_ranks[i]),
+                'win_rate': float(win_rates[i]),
+                'avg_completion_time': float(avg_times[i]),
+                'total_rounds': n_rounds
+            }
+        
+        return stats
+    
     def get_competition_stats(self) -> Dict[str, Any]:
         """Get comprehensive competition statistics"""
-        if not self.competition_history:
+        if not self._total_rounds:
             return {}
         
         stats = {
-            'total_rounds': len(self.competition_history),
+            'total_rounds': self._total_rounds,
             'bot_performance': {},
             'operation_analysis': {}
         }
         
-        # Analyze per-bot performance
+        # Per-bot performance from the running aggregates
         for bot_id in self.simulators.keys():
-            bot_ranks = []
-            bot_times = []
-            
-            for round_data in self.competition_history:
-                if bot_id in round_data['results']:
-                    rank, completion_time, _ = round_data['results'][bot_id]
-                    bot_ranks.append(rank)
-                    bot_times.append(completion_time)
-            
-            if bot_ranks:
+            agg = self._bot_agg.get(bot_id)
+            if agg:
+                count = agg['rank_count']
                 stats['bot_performance'][bot_id] = {
-                    'avg_rank': sum(bot_ranks) / len(bot_ranks),
-                    'win_rate': sum(1 for r in bot_ranks if r == 1) / len(bot_ranks),
-                    'avg_completion_time': sum(bot_times) / len(bot_times),
-                    'total_rounds': len(bot_ranks)
+                    'avg_rank': agg['rank_sum'] / count,
+                    'win_rate': agg['wins'] / count,
+                    'avg_completion_time': agg['time_sum'] / count,
+                    'total_rounds': count
                 }
         
         return stats
     
     def reset_competition(self) -> None:
         """Reset competition history and bot latency history"""
-        self.competition_history = []
+        self.competition_history.clear()
+        self._total_rounds = 0
+        self._bot_agg = {}
         for simulator in self.simulators.values():
             simulator.reset_history()
 
@@ -11,17 +11,71 @@ This module implements intelligent MEV bots capable of:
 
 import asyncio
 import time
+from collections import ChainMap, deque
 from dataclasses import dataclass, field
+from itertools import islice
+from operator import itemgetter
 from typing import Dict, List, Optional, Tuple, Any
 from enum import Enum
 import logging
 from abc import ABC, abstractmethod
 import random
 
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # Optional: profit estimates fall back to NumPy
+    numba = None
+
 from .latency_simulator import LatencySimulator, LatencyType
 
 logger = logging.getLogger(__name__)
 
+# Simplified sandwich gas estimate: frontrun + victim + backrun at a typical DEX
+# swap's 150k gas each, priced at the Arc testnet gas price of 300 gwei
+_SANDWICH_GAS_PER_TX = 150000
+_GAS_PRICE_GWEI = 300
+_SANDWICH_GAS_COST = (_SANDWICH_GAS_PER_TX * 3 * _GAS_PRICE_GWEI) / 1e9 / 1e18  # Convert to ETH
+
+# Victim tx fields copied into an opportunity, read in one C-level call
+_TX_FIELDS = itemgetter('hash', 'pool_address', 'token_in', 'token_out', 'amount_in')
+_TX_DEFAULTS = {'hash': None, 'pool_address': None, 'token_in': None, 'token_out': None, 'amount_in': 0}
+
+# Simplified sandwich profit model
+_BASE_PROFIT_RATE = 0.003  # 0.3% base profit
+_MIN_SANDWICH_PROFIT = 0.001  # Minimum profit threshold
+
+
+if numba is not None:
+    @numba.njit(fastmath=True, cache=True)
+    def _sandwich_profit_kernel(amount_in):
+        """Fused per-swap profit estimate (single pass, no temporaries)"""
+        out = np.empty_like(amount_in)
+        for i in range(amount_in.size):
+            a = amount_in[i]
+            profit = a * _BASE_PROFIT_RATE * np.sqrt(a / 100.0)
+            out[i] = profit if profit > _MIN_SANDWICH_PROFIT else _MIN_SANDWICH_PROFIT
+        return out
+
+
+def _estimate_sandwich_profits(amount_in: np.ndarray) -> np.ndarray:
+    """
+    Estimate potential sandwich profit for a batch of victim swaps
+    
+    Profit is roughly proportional to the square root of trade size
+    (diminishing returns due to slippage).
+    
+    Args:
+        amount_in: Victim swap sizes (float64)
+        
+    Returns:
+        Estimated profit per swap, floored at the minimum profit threshold
+    """
+    if numba is not None:
+        return _sandwich_profit_kernel(amount_in)
+    return np.maximum(_MIN_SANDWICH_PROFIT, amount_in * _BASE_PROFIT_RATE * np.sqrt(amount_in / 100.0))
+
 
 class BotStrategy(Enum):
     """MEV bot strategy types"""
@@ -32,7 +86,7 @@ class BotStrategy(Enum):
     BACKRUN_ARBITRAGE = "backrun_arbitrage"  # Price correction bot
 
 
-@dataclass
+@dataclass(slots=True)
 class MEVOpportunity:
     """Represents a detected MEV opportunity"""
     opportunity_id: str
@@ -49,7 +103,7 @@ class MEVOpportunity:
     expiry_at: float
     
 
-@dataclass
+@dataclass(slots=True)
 class AttackResult:
     """Result of an executed MEV attack"""
     opportunity_id: str
@@ -77,9 +131,84 @@ class AttackResult:
     pool_price_impact: float = 0.0
     
 
+# Per-attack record produced by simulate_attacks_batch (AttackResult's numeric fields)
+ATTACK_BATCH_DTYPE = np.dtype([
+    ('success', np.bool_),
+    ('gross_profit', np.float64),
+    ('gas_costs', np.float64),
+    ('net_profit', np.float64),
+    ('victim_loss', np.float64),
+    ('slippage_caused', np.float64),
+    ('pool_price_impact', np.float64),
+])
+
+
+def simulate_attacks_batch(estimated_profit: np.ndarray,
+                           gas_cost: Any,
+                           frontrun_ratio: Any,
+                           rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """
+    Simulate many sandwich executions at once for round-level statistics
+    
+    Vectorized form of the outcome model in MEVBot._execute_sandwich_attack,
+    without latency, logging or tx hashes. Use the scalar path when a
+    strategy needs per-attack feedback.
+    
+    Args:
+        estimated_profit: Estimated profit per attack
+        gas_cost: Estimated gas cost (scalar or one per attack)
+        frontrun_ratio: Frontrun size as a share of the victim swap (scalar or one per attack)
+        rng: NumPy generator (a fresh default_rng when None)
+        
+    Returns:
+        Structured array of ATTACK_BATCH_DTYPE, one record per attack
+    """
+    estimated_profit = np.ravel(np.asarray(estimated_profit, dtype=np.float64))
+    n = estimated_profit.size
+    if rng is None:
+        rng = np.random.default_rng()
+    
+    u = rng.random((4, n))
+    success = u[0] > 0.2  # 80% success rate
+    gas_cost = np.broadcast_to(np.asarray(gas_cost, dtype=np.float64), (n,))
+    
+    # Failed attacks pay the estimated gas and move nothing
+    gross_profit = np.where(success, estimated_profit * (0.8 + 0.4 * u[1]), 0.0)
+    gas_costs = np.where(success, gas_cost * (0.9 + 0.4 * u[2]), gas_cost)
+    slippage = np.where(success, np.asarray(frontrun_ratio, dtype=np.float64) * 0.02, 0.0)
+    
+    out = np.empty(n, dtype=ATTACK_BATCH_DTYPE)
+    out['success'] = success
+    out['gross_profit'] = gross_profit
+    out['gas_costs'] = gas_costs
+    out['net_profit'] = gross_profit - gas_costs
+    out['victim_loss'] = gross_profit * (1.1 + 0.4 * u[3])  # Victim loses more than bot gains
+    out['slippage_caused'] = slippage
+    out['pool_price_impact'] = slippage * 0.5
+    return out
+
+
 class BotStrategyEngine(ABC):
     """Abstract base class for bot strategy implementations"""
     
+    # Lowest estimated_profit / gas_cost ratio should_execute_attack can ever accept
+    MIN_PROFIT_RATIO = 0.0
+    
+    @property
+    def bid_percentage(self) -> float:
+        """Share of the estimated profit to bid (percent)"""
+        return self._bid_percentage
+    
+    @bid_percentage.setter
+    def bid_percentage(self, value: float) -> None:
+        # Keep the fraction used by calculate_bid_amount in step with the percentage
+        self._bid_percentage = value
+        self._bid_frac = value / 100.0
+    
+    def fast_reject(self, estimated_profit: float, gas_cost: float) -> bool:
+        """Profit-ratio pre-check: True if should_execute_attack is certain to reject"""
+        return estimated_profit <= gas_cost * self.MIN_PROFIT_RATIO
+    
     @abstractmethod
     def calculate_bid_amount(self, opportunity: MEVOpportunity, competition_level: float) -> float:
         """Calculate how much to bid for this opportunity"""
@@ -104,11 +233,13 @@ class BotStrategyEngine(ABC):
 class AggressiveStrategy(BotStrategyEngine):
     """Aggressive high-frequency strategy"""
     
+    MIN_PROFIT_RATIO = 2.0
+    
     def __init__(self, bid_percentage: float = 85.0):
         self.bid_percentage = bid_percentage
-        
+    
     def calculate_bid_amount(self, opportunity: MEVOpportunity, competition_level: float) -> float:
-        base_bid = opportunity.estimated_profit * (self.bid_percentage / 100.0)
+        base_bid = opportunity.estimated_profit * self._bid_frac
         # Increase bid based on competition
         competition_multiplier = 1.0 + (competition_level * 0.5)
         return base_bid * competition_multiplier
@@ -131,12 +262,14 @@ class AggressiveStrategy(BotStrategyEngine):
 class ConservativeStrategy(BotStrategyEngine):
     """Conservative steady-profit strategy"""
     
+    MIN_PROFIT_RATIO = 3.0
+    
     def __init__(self, bid_percentage: float = 60.0):
         self.bid_percentage = bid_percentage
-        
+    
     def calculate_bid_amount(self, opportunity: MEVOpportunity, competition_level: float) -> float:
         # Conservative: lower, stable bids
-        base_bid = opportunity.estimated_profit * (self.bid_percentage / 100.0)
+        base_bid = opportunity.estimated_profit * self._bid_frac
         return base_bid  # Don't increase much for competition
     
     def should_execute_attack(self, opportunity: MEVOpportunity, competition_data: Dict) -> bool:
@@ -159,11 +292,69 @@ class ConservativeStrategy(BotStrategyEngine):
 class AdaptiveStrategy(BotStrategyEngine):
     """Learning strategy that adapts to competition"""
     
+    # Floor of the learned profit ratio in should_execute_attack
+    MIN_PROFIT_RATIO = 1.5
+    
+    # Capacity of the net-profit ring buffer (reads only look at the last 10)
+    PERFORMANCE_HISTORY_SIZE = 64
+    
+    # Competition levels kept for bid prediction (bids use the last 5)
+    COMPETITION_HISTORY_SIZE = 32
+    
     def __init__(self, initial_bid_percentage: float = 70.0):
         self.bid_percentage = initial_bid_percentage
         self.learning_rate = 0.1
-        self.competition_history: List[float] = []
-        self.performance_history: List[float] = []
+        self.competition_history: deque = deque(maxlen=self.COMPETITION_HISTORY_SIZE)
+        
+        # Net-profit history as a fixed ring buffer: no list growth or truncation copies
+        self._perf_buf = np.empty(self.PERFORMANCE_HISTORY_SIZE, dtype=np.float64)
+        self._perf_idx = 0  # Next write position
+        self._perf_len = 0  # Number of valid entries
+    
+    @property
+    def performance_history(self) -> np.ndarray:
+        """Recorded net profits, oldest first"""
+        if self._perf_len < self._perf_buf.size:
+            return self._perf_buf[:self._perf_len].copy()
+        return np.roll(self._perf_buf, -self._perf_idx)
+    
+    @property
+    def learning_rate(self) -> float:
+        """Multiplicative step applied to the bid per result"""
+        return self._learning_rate
+    
+    @learning_rate.setter
+    def learning_rate(self, value: float) -> None:
+        self._learning_rate = value
+        self._lr_up = 1 + value
+        self._lr_dn = 1 - value
+    
+    def _recent_performance(self, n: int) -> float:
+        """Mean of the last n recorded net profits (n is capped at the entries available)"""
+        n = min(n, self._perf_len)
+        start = self._perf_idx - n
+        if start >= 0:
+            return float(self._perf_buf[start:self._perf_idx].sum()) / n
+        # Window wraps around the end of the buffer
+        return float(self._perf_buf[start:].sum() + self._perf_buf[:self._perf_idx].sum()) / n
+    
+    def _push_performance(self, profits: np.ndarray) -> None:
+        """Append net profits to the ring buffer with at most two slice copies"""
+        size = self._perf_buf.size
+        if profits.size > size:
+            profits = profits[-size:]
+        n = profits.size
+        end = self._perf_idx + n
+        
+        if end <= size:
+            self._perf_buf[self._perf_idx:end] = profits
+        else:
+            split = size - self._perf_idx
+            self._perf_buf[self._perf_idx:] = profits[:split]
+            self._perf_buf[:end - size] = profits[split:]
+        
+        self._perf_idx = end % size
+        self._perf_len = min(size, self._perf_len + n)
         
     def calculate_bid_amount(self, opportunity: MEVOpportunity, competition_level: float) -> float:
         # Adaptive: adjust based on learned competition patterns
@@ -171,20 +362,20 @@ class AdaptiveStrategy(BotStrategyEngine):
         
         # Use recent competition history to predict optimal bid
         if len(self.competition_history) > 5:
-            avg_competition = sum(self.competition_history[-5:]) / 5
+            avg_competition = sum(islice(reversed(self.competition_history), 5)) / 5
             adaptive_multiplier = 1.0 + (avg_competition * 0.7)
         else:
             adaptive_multiplier = 1.0 + (competition_level * 0.4)
             
-        base_bid = opportunity.estimated_profit * (self.bid_percentage / 100.0)
+        base_bid = opportunity.estimated_profit * self._bid_frac
         return base_bid * adaptive_multiplier
     
     def should_execute_attack(self, opportunity: MEVOpportunity, competition_data: Dict) -> bool:
         # Adaptive: learn from past success rates
         min_profit_ratio = 2.5  # Default
         
-        if self.performance_history:
-            recent_performance = sum(self.performance_history[-10:]) / min(10, len(self.performance_history))
+        if self._perf_len:
+            recent_performance = self._recent_performance(10)
             if recent_performance > 0:
                 min_profit_ratio = max(1.5, min_profit_ratio * 0.9)  # Be more aggressive
             else:
@@ -196,8 +387,8 @@ class AdaptiveStrategy(BotStrategyEngine):
         # Adaptive: adjust frontrun size based on success patterns
         base_ratio = 0.4  # 40% default
         
-        if len(self.performance_history) > 3:
-            recent_avg = sum(self.performance_history[-3:]) / 3
+        if self._perf_len > 3:
+            recent_avg = self._recent_performance(3)
             if recent_avg > 0:
                 base_ratio = min(0.6, base_ratio * 1.1)  # Increase if profitable
             else:
@@ -207,23 +398,43 @@ class AdaptiveStrategy(BotStrategyEngine):
     
     def adapt_to_results(self, recent_results: List[AttackResult]) -> None:
         # Learn from all results
-        for result in recent_results:
-            self.performance_history.append(result.net_profit)
-            
-            # Adjust bid percentage based on success
-            if result.success and result.net_profit > 0:
-                self.bid_percentage = min(90.0, self.bid_percentage * (1 + self.learning_rate))
-            elif not result.success or result.net_profit <= 0:
-                self.bid_percentage = max(30.0, self.bid_percentage * (1 - self.learning_rate))
+        n = len(recent_results)
+        if not n:
+            return
         
-        # Keep history manageable
-        if len(self.performance_history) > 50:
-            self.performance_history = self.performance_history[-30:]
+        profits = np.fromiter((r.net_profit for r in recent_results), dtype=np.float64, count=n)
+        successes = np.fromiter((r.success for r in recent_results), dtype=np.bool_, count=n)
+        
+        # Multiplicative update in closed form: grow per profitable win, shrink otherwise
+        wins = int(np.count_nonzero(successes & (profits > 0)))
+        losses = n - wins
+        updated = self.bid_percentage * self._lr_up ** wins * self._lr_dn ** losses
+        self.bid_percentage = min(90.0, max(30.0, updated))
+        
+        self._push_performance(profits)
+
+
+# Strategy engine class and default bid percentage per strategy type
+_STRATEGY_MAP = {
+    BotStrategy.AGGRESSIVE: (AggressiveStrategy, 85.0),
+    BotStrategy.CONSERVATIVE: (ConservativeStrategy, 60.0),
+    BotStrategy.ADAPTIVE: (AdaptiveStrategy, 70.0),
+    BotStrategy.SLOW: (ConservativeStrategy, 40.0),
+}
 
 
 class MEVBot:
     """Intelligent MEV bot with configurable strategy and latency simulation"""
     
+    # Most recent attack results kept as objects (totals live in the arrays below)
+    ATTACK_HISTORY_SIZE = 1000
+    
+    # Initial capacity of the per-attack profit/success arrays (doubled when full)
+    RESULT_BUFFER_SIZE = 1024
+    
+    # Smallest victim swap worth sandwiching
+    SANDWICH_MIN_AMOUNT = 10.0
+    
     def __init__(self, 
                  bot_id: str,
                  strategy_type: BotStrategy,
@@ -231,7 +442,9 @@ class MEVBot:
                  wallet_address: str,
                  wallet_private_key: str,
                  initial_balance: float,
-                 strategy_params: Optional[Dict[str, Any]] = None):
+                 strategy_params: Optional[Dict[str, Any]] = None,
+                 seed: Optional[int] = None,
+                 record_tx_hashes: bool = False):
         """
         Initialize MEV bot
         
@@ -243,6 +456,8 @@ class MEVBot:
             wallet_private_key: Private key for signing transactions
             initial_balance: Starting balance in USDC
             strategy_params: Strategy-specific parameters
+            seed: Seed for the bot's confidence and execution outcome RNG (None for random)
+            record_tx_hashes: Generate simulated frontrun/backrun tx hashes for results
         """
         self.bot_id = bot_id
         self.strategy_type = strategy_type
@@ -252,31 +467,42 @@ class MEVBot:
         self.initial_balance = initial_balance
         self.current_balance = initial_balance
         
+        # PCG64 generator for opportunity confidence, execution outcomes and simulated tx hashes
+        self._rng = np.random.default_rng(seed)
+        self.record_tx_hashes = record_tx_hashes
+        
         # Initialize strategy engine
         self.strategy_engine = self._create_strategy_engine(strategy_type, strategy_params or {})
         
         # Performance tracking
-        self.attack_history: List[AttackResult] = []
+        self.attack_history: deque = deque(maxlen=self.ATTACK_HISTORY_SIZE)
         self.opportunities_seen: List[MEVOpportunity] = []
         self.active_attacks: Dict[str, MEVOpportunity] = {}
         
+        # Column copies of attack_history for NumPy reductions
+        self._profit_arr = np.empty(self.RESULT_BUFFER_SIZE, dtype=np.float64)
+        self._success_arr = np.empty(self.RESULT_BUFFER_SIZE, dtype=np.bool_)
+        self._n = 0
+        
+        # Per-bot sequence number for opportunity ids
+        self._opp_counter = 0
+        
+        # Running totals so get_performance_stats is O(1)
+        self._total_profit = 0.0
+        self._success_count = 0
+        
         # Competition analysis
         self.competitor_data: Dict[str, Dict] = {}
         
-        logger.info(f"Initialized MEV bot {bot_id} with {strategy_type.value} strategy")
+        logger.info("Initialized MEV bot %s with %s strategy", bot_id, strategy_type.value)
     
     def _create_strategy_engine(self, strategy_type: BotStrategy, params: Dict[str, Any]) -> BotStrategyEngine:
         """Create appropriate strategy engine"""
-        if strategy_type == BotStrategy.AGGRESSIVE:
-            return AggressiveStrategy(params.get('bid_percentage', 85.0))
-        elif strategy_type == BotStrategy.CONSERVATIVE:
-            return ConservativeStrategy(params.get('bid_percentage', 60.0))
-        elif strategy_type == BotStrategy.ADAPTIVE:
-            return AdaptiveStrategy(params.get('bid_percentage', 70.0))
-        elif strategy_type == BotStrategy.SLOW:
-            return ConservativeStrategy(params.get('bid_percentage', 40.0))
-        else:
-            raise ValueError(f"Unknown strategy type: {strategy_type}")
+        try:
+            engine_cls, default_bid = _STRATEGY_MAP[strategy_type]
+        except KeyError:
+            raise ValueError(f"Unknown strategy type: {strategy_type}") from None
+        return engine_cls(params.get('bid_percentage', default_bid))
     
     async def detect_mev_opportunity(self, block_data: Dict) -> List[MEVOpportunity]:
         """
@@ -288,90 +514,90 @@ class MEVBot:
         Returns:
             List of detected MEV opportunities
         """
-        # Simulate block detection latency
-        await self.latency_simulator.block_detection_delay()
-        
         opportunities = []
         
-        # Analyze pending transactions for sandwich opportunities
-        pending_txs = block_data.get('pending_transactions', [])
+        # Sandwich targets: large swaps (filtered before any per-block latency)
+        min_amount = self.SANDWICH_MIN_AMOUNT
+        candidates = [tx for tx in block_data.get('pending_transactions', [])
+                      if tx.get('type') == 'swap' and tx.get('amount_in', 0) > min_amount]
         
-        for tx in pending_txs:
-            # Simulate market data update latency
-            await self.latency_simulator.market_update_delay()
+        if candidates:
+            # Simulate block detection plus one market data refresh for the whole block
+            await self.latency_simulator.composite_delay(
+                LatencyType.BLOCK_DETECTION, LatencyType.MARKET_UPDATE
+            )
             
-            # Check if this is a profitable sandwich target
-            if self._is_sandwich_target(tx):
-                opportunity = self._create_sandwich_opportunity(tx)
+            # Estimate every candidate's profit in one vectorized call
+            amounts = np.fromiter((tx['amount_in'] for tx in candidates),
+                                  dtype=np.float64, count=len(candidates))
+            profits = _estimate_sandwich_profits(amounts).tolist()
+            
+            fast_reject = self.strategy_engine.fast_reject
+            
+            for tx, estimated_profit in zip(candidates, profits):
+                # Skip building opportunities our strategy can never execute
+                if fast_reject(estimated_profit, _SANDWICH_GAS_COST):
+                    continue
+                opportunity = self._create_sandwich_opportunity(tx, estimated_profit)
                 if opportunity:
                     opportunities.append(opportunity)
                     self.opportunities_seen.append(opportunity)
+        else:
+            # Simulate block detection latency
+            await self.latency_simulator.block_detection_delay()
         
-        logger.debug(f"[{self.bot_id}] Detected {len(opportunities)} MEV opportunities")
+        logger.debug("[%s] Detected %d MEV opportunities", self.bot_id, len(opportunities))
         return opportunities
     
-    def _is_sandwich_target(self, tx: Dict) -> bool:
-        """Check if transaction is a good sandwich attack target"""
-        # Simple heuristic: large swaps are good targets
-        if tx.get('type') == 'swap':
-            amount = tx.get('amount_in', 0)
-            return amount > 10.0  # Threshold for profitable sandwich
-        return False
-    
-    def _create_sandwich_opportunity(self, tx: Dict) -> Optional[MEVOpportunity]:
-        """Create MEVOpportunity from target transaction"""
+    def _create_sandwich_opportunity(self, tx: Dict, estimated_profit: float) -> Optional[MEVOpportunity]:
+        """Create MEVOpportunity from target transaction and its estimated profit"""
         try:
+            try:
+                victim_tx_hash, pool_address, token_in, token_out, amount_in = _TX_FIELDS(tx)
+            except KeyError:
+                # Partial tx dict: fall back to defaults for the missing fields
+                victim_tx_hash, pool_address, token_in, token_out, amount_in = _TX_FIELDS(
+                    ChainMap(tx, _TX_DEFAULTS)
+                )
+            
+            self._opp_counter += 1
+            now = time.time()
             opportunity = MEVOpportunity(
-                opportunity_id=f"{self.bot_id}_{int(time.time() * 1000)}",
+                opportunity_id=f"{self.bot_id}_{self._opp_counter}",
                 type="sandwich",
-                victim_tx_hash=tx.get('hash'),
-                pool_address=tx.get('pool_address'),
-                token_in=tx.get('token_in'),
-                token_out=tx.get('token_out'),
-                victim_amount_in=tx.get('amount_in', 0),
-                estimated_profit=self._estimate_sandwich_profit(tx),
-                gas_cost=self._estimate_gas_cost(),
-                confidence_score=random.uniform(0.6, 0.95),  # Simulated confidence
-                detected_at=time.time(),
-                expiry_at=time.time() + 30.0  # 30 second window
+                victim_tx_hash=victim_tx_hash,
+                pool_address=pool_address,
+                token_in=token_in,
+                token_out=token_out,
+                victim_amount_in=amount_in,
+                estimated_profit=estimated_profit,
+                gas_cost=_SANDWICH_GAS_COST,
+                confidence_score=float(self._rng.uniform(0.6, 0.95)),  # Simulated confidence
+                detected_at=now,
+                expiry_at=now + 30.0  # 30 second window
             )
             return opportunity
             
         except Exception as e:
-            logger.error(f"Failed to create opportunity: {e}")
+            logger.error("Failed to create opportunity: %s", e)
             return None
     
-    def _estimate_sandwich_profit(self, tx: Dict) -> float:
-        """Estimate potential profit from sandwich attack"""
-        # Simplified profit estimation
-        amount_in = tx.get('amount_in', 0)
-        
-        # Profit roughly proportional to square root of trade size
-        # (diminishing returns due to slippage)
-        base_profit_rate = 0.003  # 0.3% base profit
-        size_factor = (amount_in / 100.0) ** 0.5
-        
-        estimated_profit = amount_in * base_profit_rate * size_factor
-        return max(0.001, estimated_profit)  # Minimum profit threshold
+    @staticmethod
+    def derive_competition_level(competition_data: Dict) -> float:
+        """Normalized competition level for a round (active bot count / 10)"""
+        return len(competition_data.get('active_bots', ())) / 10.0
     
-    def _estimate_gas_cost(self) -> float:
-        """Estimate gas cost for sandwich attack (3 transactions)"""
-        # Simplified gas estimation: frontrun + victim + backrun
-        gas_per_tx = 150000  # Typical DEX swap gas
-        gas_price_gwei = 300  # Arc testnet gas price
-        
-        total_gas = gas_per_tx * 3  # 3 transactions
-        gas_cost_eth = (total_gas * gas_price_gwei) / 1e9 / 1e18  # Convert to ETH
-        
-        return gas_cost_eth
-    
-    async def evaluate_and_execute(self, opportunity: MEVOpportunity, competition_data: Dict) -> Optional[AttackResult]:
+    async def evaluate_and_execute(self, opportunity: MEVOpportunity,
+                                   competition_data: Optional[Dict] = None,
+                                   competition_level: Optional[float] = None) -> Optional[AttackResult]:
         """
         Evaluate opportunity and execute if profitable
         
         Args:
             opportunity: The MEV opportunity to evaluate
             competition_data: Information about competing bots
+            competition_level: Precomputed competition level for the round
+                (derived from competition_data when None)
             
         Returns:
             AttackResult if executed, None if skipped
@@ -379,18 +605,22 @@ class MEVBot:
         # Simulate calculation latency
         await self.latency_simulator.calculation_delay()
         
+        if competition_data is None:
+            competition_data = {}
+        
         # Check if we should execute this attack
         if not self.strategy_engine.should_execute_attack(opportunity, competition_data):
-            logger.debug(f"[{self.bot_id}] Skipping opportunity {opportunity.opportunity_id}")
+            logger.debug("[%s] Skipping opportunity %s", self.bot_id, opportunity.opportunity_id)
             return None
         
         # Calculate our bid
-        competition_level = len(competition_data.get('active_bots', []))  / 10.0  # Normalize
+        if competition_level is None:
+            competition_level = self.derive_competition_level(competition_data)
         bid_amount = self.strategy_engine.calculate_bid_amount(opportunity, competition_level)
         
         # Check if we have enough balance
         if bid_amount > self.current_balance:
-            logger.warning(f"[{self.bot_id}] Insufficient balance for bid: {bid_amount} > {self.current_balance}")
+            logger.warning("[%s] Insufficient balance for bid: %s > %s", self.bot_id, bid_amount, self.current_balance)
             return None
         
         # Execute the attack
@@ -402,90 +632,104 @@ class MEVBot:
         else:
             self.current_balance -= result.gas_costs
             
-        self.attack_history.append(result)
+        self._record_result(result)
         
         # Adapt strategy based on results
         if len(self.attack_history) >= 5:
-            recent_results = self.attack_history[-5:]
+            recent_results = [self.attack_history[i] for i in range(-5, 0)]
             self.strategy_engine.adapt_to_results(recent_results)
         
         return result
     
+    def _record_result(self, result: AttackResult) -> None:
+        """Append an attack result to the history and the profit/success arrays"""
+        self.attack_history.append(result)
+        
+        if self._n == self._profit_arr.size:
+            self._profit_arr = np.resize(self._profit_arr, 2 * self._n)
+            self._success_arr = np.resize(self._success_arr, 2 * self._n)
+        
+        self._profit_arr[self._n] = result.net_profit
+        self._success_arr[self._n] = result.success
+        self._n += 1
+        
+        self._total_profit += result.net_profit
+        self._success_count += bool(result.success)
+    
     async def _execute_sandwich_attack(self, opportunity: MEVOpportunity, bid_amount: float) -> AttackResult:
         """Execute a sandwich attack"""
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
+        
+        # Failed-attack outcome: the bot pays gas and earns nothing
+        success = False
+        gas_costs = opportunity.gas_cost
+        net_profit = -gas_costs
+        gross_profit = victim_loss = slippage_caused = 0.0
+        frontrun_tx_hash = victim_tx_hash = backrun_tx_hash = None
         
         try:
-            # Simulate bundle creation latency
-            await self.latency_simulator.bundle_creation_delay()
-            
             # Calculate frontrun amount
             frontrun_amount = self.strategy_engine.calculate_frontrun_amount(opportunity)
             
-            # Simulate network submission latency
-            await self.latency_simulator.network_submission_delay()
+            # Simulate bundle creation and network submission latency (one wait)
+            await self.latency_simulator.composite_delay(
+                LatencyType.BUNDLE_CREATION, LatencyType.NETWORK_SUBMISSION
+            )
             
-            # Simulate attack execution (simplified)
-            execution_success = random.random() > 0.2  # 80% success rate
+            # Simulate attack execution (simplified): one draw covers every random outcome
+            u = self._rng.random(4)
+            execution_success = u[0] > 0.2  # 80% success rate
             
             if execution_success:
                 # Calculate realistic results
-                gross_profit = opportunity.estimated_profit * random.uniform(0.8, 1.2)
-                gas_costs = opportunity.gas_cost * random.uniform(0.9, 1.3)
+                gross_profit = opportunity.estimated_profit * (0.8 + 0.4 * u[1])
+                gas_costs = opportunity.gas_cost * (0.9 + 0.4 * u[2])
                 net_profit = gross_profit - gas_costs
-                victim_loss = gross_profit * random.uniform(1.1, 1.5)  # Victim loses more than bot gains
+                victim_loss = gross_profit * (1.1 + 0.4 * u[3])  # Victim loses more than bot gains
                 slippage_caused = frontrun_amount / opportunity.victim_amount_in * 0.02  # 2% per unit
                 
-                result = AttackResult(
-                    opportunity_id=opportunity.opportunity_id,
-                    bot_id=self.bot_id,
-                    attack_type="sandwich",
-                    success=True,
-                    frontrun_tx_hash=f"0x{random.randint(10**63, 10**64-1):064x}",
-                    victim_tx_hash=opportunity.victim_tx_hash,
-                    backrun_tx_hash=f"0x{random.randint(10**63, 10**64-1):064x}",
-                    gross_profit=gross_profit,
-                    gas_costs=gas_costs,
-                    net_profit=net_profit,
-                    victim_loss=victim_loss,
-                    slippage_caused=slippage_caused,
-                    pool_price_impact=slippage_caused * 0.5,
-                    total_latency_ms=(time.time() - start_time) * 1000
-                )
+                victim_tx_hash = opportunity.victim_tx_hash
+                if self.record_tx_hashes:
+                    # Simulated hashes are only for inspection; skip them unless asked
+                    frontrun_tx_hash = "0x" + self._rng.bytes(32).hex()
+                    backrun_tx_hash = "0x" + self._rng.bytes(32).hex()
+                success = True
                 
-                logger.info(f"[{self.bot_id}] Successful sandwich attack: {net_profit:.6f} USDC profit")
+                logger.info("[%s] Successful sandwich attack: %.6f USDC profit", self.bot_id, net_profit)
                 
             else:
-                # Failed attack
-                result = AttackResult(
-                    opportunity_id=opportunity.opportunity_id,
-                    bot_id=self.bot_id,
-                    attack_type="sandwich",
-                    success=False,
-                    gas_costs=opportunity.gas_cost,
-                    net_profit=-opportunity.gas_cost,
-                    total_latency_ms=(time.time() - start_time) * 1000
-                )
-                
-                logger.warning(f"[{self.bot_id}] Failed sandwich attack: -{opportunity.gas_cost:.6f} USDC loss")
+                logger.warning("[%s] Failed sandwich attack: -%.6f USDC loss", self.bot_id, opportunity.gas_cost)
                 
-            return result
-            
         except Exception as e:
-            logger.error(f"[{self.bot_id}] Attack execution failed: {e}")
-            return AttackResult(
-                opportunity_id=opportunity.opportunity_id,
-                bot_id=self.bot_id,
-                attack_type="sandwich",
-                success=False,
-                gas_costs=opportunity.gas_cost,
-                net_profit=-opportunity.gas_cost,
-                total_latency_ms=(time.time() - start_time) * 1000
-            )
+            logger.error("[%s] Attack execution failed: %s", self.bot_id, e)
+            # Anything computed before the error is discarded: report a failed attack
+            success = False
+            gas_costs = opportunity.gas_cost
+            net_profit = -gas_costs
+            gross_profit = victim_loss = slippage_caused = 0.0
+            frontrun_tx_hash = victim_tx_hash = backrun_tx_hash = None
+        
+        return AttackResult(
+            opportunity_id=opportunity.opportunity_id,
+            bot_id=self.bot_id,
+            attack_type="sandwich",
+            success=success,
+            frontrun_tx_hash=frontrun_tx_hash,
+            victim_tx_hash=victim_tx_hash,
+            backrun_tx_hash=backrun_tx_hash,
+            gross_profit=gross_profit,
+            gas_costs=gas_costs,
+            net_profit=net_profit,
+            victim_loss=victim_loss,
+            slippage_caused=slippage_caused,
+            pool_price_impact=slippage_caused * 0.5,
+            total_latency_ms=(time.monotonic_ns() - start_ns) / 1e6
+        )
     
     def get_performance_stats(self) -> Dict[str, Any]:
         """Get comprehensive performance statistics"""
-        if not self.attack_history:
+        n = self._n
+        if not n:
             return {
                 'total_attacks': 0,
                 'success_rate': 0,
@@ -494,19 +738,19 @@ class MEVBot:
                 'roi': 0
             }
         
-        successful_attacks = [r for r in self.attack_history if r.success]
-        total_profit = sum(r.net_profit for r in self.attack_history)
+        successful_attacks = self._success_count
+        total_profit = self._total_profit
         
         stats = {
-            'total_attacks': len(self.attack_history),
-            'successful_attacks': len(successful_attacks),
-            'success_rate': len(successful_attacks) / len(self.attack_history),
+            'total_attacks': n,
+            'successful_attacks': successful_attacks,
+            'success_rate': successful_attacks / n,
             'total_profit': total_profit,
-            'avg_profit_per_attack': total_profit / len(self.attack_history),
+            'avg_profit_per_attack': total_profit / n,
             'current_balance': self.current_balance,
             'roi': (self.current_balance - self.initial_balance) / self.initial_balance,
             'opportunities_seen': len(self.opportunities_seen),
-            'conversion_rate': len(self.attack_history) / max(1, len(self.opportunities_seen))
+            'conversion_rate': n / max(1, len(self.opportunities_seen))
         }
         
         # Add latency statistics
@@ -514,10 +758,47 @@ class MEVBot:
         
         return stats
     
+    @classmethod
+    def fleet_stats(cls, bots: List["MEVBot"]) -> Dict[str, Any]:
+        """
+        Aggregate attack statistics across several bots in one reduction
+        
+        Args:
+            bots: Bots to aggregate
+            
+        Returns:
+            Dictionary with fleet-wide attack counts, success rate and profit
+        """
+        profits = np.concatenate([b._profit_arr[:b._n] for b in bots]) if bots else np.empty(0)
+        successes = np.concatenate([b._success_arr[:b._n] for b in bots]) if bots else np.empty(0, dtype=np.bool_)
+        
+        n = profits.size
+        if not n:
+            return {
+                'bot_count': len(bots),
+                'total_attacks': 0,
+                'successful_attacks': 0,
+                'success_rate': 0,
+                'total_profit': 0,
+                'avg_profit_per_attack': 0
+            }
+        
+        successful_attacks = int(np.count_nonzero(successes))
+        total_profit = float(profits.sum())
+        
+        return {
+            'bot_count': len(bots),
+            'total_attacks': n,
+            'successful_attacks': successful_attacks,
+            'success_rate': successful_attacks / n,
+            'total_profit': total_profit,
+            'avg_profit_per_attack': total_profit / n
+        }
+    
     def __str__(self) -> str:
         """String representation of MEV bot"""
         return (f"MEVBot(id='{self.bot_id}', strategy='{self.strategy_type.value}', "
-                f"balance={self.current_balance:.6f}, attacks={len(self.attack_history)})")
+                f"balance={self.current_balance:.6f}, attacks={self._n})")
     
     def __repr__(self) -> str:
         return self.__str__()
@@ -542,7 +823,9 @@ def create_bot_from_config(bot_id: str, config: Dict[str, Any]) -> MEVBot:
         latency_simulator=latency_simulator,
         wallet_address=config.get('wallet_address', f'0x{random.randint(10**39, 10**40-1):040x}'),
         initial_balance=config.get('initial_balance_eth', 1.0),
-        strategy_params=config.get('strategy_params', {})
+        strategy_params=config.get('strategy_params', {}),
+        seed=config.get('seed'),
+        record_tx_hashes=config.get('record_tx_hashes', False)
     )
     
     return bot
@@ -595,16 +878,25 @@ if __name__ == "__main__":
                 ]
             }
             
-            # Each bot analyzes opportunities
-            all_results = []
-            for bot in bots:
-                opportunities = await bot.detect_mev_opportunity(block_data)
-                
+            # Bots analyze the block concurrently
+            all_opportunities = await asyncio.gather(
+                *(bot.detect_mev_opportunity(block_data) for bot in bots)
+            )
+            competition_level = len(bots) / 10.0
+            
+            async def execute_opportunities(bot, opportunities):
+                # One bot's attacks stay sequential: each depends on its updated balance
+                results = []
                 for opportunity in opportunities:
-                    competition_data = {'active_bots': [b.bot_id for b in bots]}
-                    result = await bot.evaluate_and_execute(opportunity, competition_data)
+                    result = await bot.evaluate_and_execute(opportunity, competition_level=competition_level)
                     if result:
-                        all_results.append(result)
+                        results.append(result)
+                return results
+            
+            per_bot_results = await asyncio.gather(
+                *(execute_opportunities(bot, opps) for bot, opps in zip(bots, all_opportunities))
+            )
+            all_results = [result for results in per_bot_results for result in results]
             
             # Show results for this round
             if all_results:
@@ -622,8 +914,9 @@ if __name__ == "__main__":
             print(f"  ROI: {stats['roi']:+.1%}")
             print(f"  Final Balance: {stats['current_balance']:.6f} USDC")
     
-    # Run the test
-    asyncio.run(test_mev_bot())
+    # Run the test (on uvloop when installed)
+    from ..utils.helpers import run_async
+    run_async(test_mev_bot())
 
 
 class BackrunBot:
@@ -648,7 +941,7 @@ class BackrunBot:
         self.total_profit = 0.0
         self.trade_history = []
         
-        logger.info(f"BackrunBot {bot_id} initialized: target={target_price_ratio}, threshold={deviation_threshold}")
+        logger.info("BackrunBot %s initialized: target=%s, threshold=%s", bot_id, target_price_ratio, deviation_threshold)
     
     async def monitor_and_rebalance(self, pool_key: str) -> Optional[AttackResult]:
         """Monitor pool price and execute arbitrage if deviation detected"""
@@ -671,7 +964,8 @@ class BackrunBot:
             if deviation < self.deviation_threshold:
                 return None
             
-            logger.info(f"{self.bot_id}: Price deviation {deviation:.2%} detected (current={current_ratio:.4f}, target={self.target_price_ratio})")
+            logger.info("%s: Price deviation %.2f%% detected (current=%.4f, target=%s)",
+                        self.bot_id, deviation * 100, current_ratio, self.target_price_ratio)
             
             # Determine trade direction to restore price
             if current_ratio > self.target_price_ratio:
@@ -709,7 +1003,7 @@ class BackrunBot:
             return result
             
         except Exception as e:
-            logger.error(f"{self.bot_id}: Error in monitor_and_rebalance: {e}")
+            logger.error("%s: Error in monitor_and_rebalance: %s", self.bot_id, e)
             return None
     
     async def _execute_arbitrage(self,
@@ -725,7 +1019,8 @@ class BackrunBot:
         start_time = time.time()
         
         try:
-            # Simulate trade execution
+            # Simulate trade execution against the pool's on-chain state
+            await self.pool_manager.refresh_pool_states([pool_key])
             swap_result = await self.pool_manager.simulate_swap(
                 pool_key=pool_key,
                 token_in=token_in,
@@ -734,7 +1029,7 @@ class BackrunBot:
             )
             
             if not swap_result['success']:
-                logger.warning(f"{self.bot_id}: Arbitrage trade failed: {swap_result.get('error')}")
+                logger.warning("%s: Arbitrage trade failed: %s", self.bot_id, swap_result.get('error'))
                 return AttackResult(
                     opportunity_id=f"backrun_{int(time.time()*1000)}",
                     bot_id=self.bot_id,
@@ -778,8 +1073,9 @@ class BackrunBot:
                 slippage_caused=0.0
             )
             
-            logger.info(f"{self.bot_id}: Arbitrage {direction} - profit={net_profit:.4f} USDC, "
-                       f"price: {pre_trade_ratio:.4f} -> {post_trade_ratio:.4f} (target={self.target_price_ratio})")
+            logger.info("%s: Arbitrage %s - profit=%.4f USDC, price: %.4f -> %.4f (target=%s)",
+                        self.bot_id, direction, net_profit, pre_trade_ratio, post_trade_ratio,
+                        self.target_price_ratio)
             
             self.trade_history.append({
                 'timestamp': time.time(),
@@ -793,7 +1089,7 @@ class BackrunBot:
             return result
             
         except Exception as e:
-            logger.error(f"{self.bot_id}: Error executing arbitrage: {e}")
+            logger.error("%s: Error executing arbitrage: %s", self.bot_id, e)
             return AttackResult(
                 opportunity_id=f"backrun_{int(time.time()*1000)}",
                 bot_id=self.bot_id,
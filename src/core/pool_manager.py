@@ -11,21 +11,29 @@ This module handles:
 """
 
 import asyncio
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple, Any
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
 import logging
 from web3 import Web3
 from web3.contract import Contract
 from eth_account import Account
+import hashlib
 import json
 import math
+import struct
+import sys
 import time
 
+from eth_abi import decode as abi_decode, encode as abi_encode
+
+from ..utils.blockchain import GasEstimateCache, wait_for_receipt_backoff, sign_transaction_async
+from ..deployment.contract_cache import get_contract
+
 # Import Uniswap V3 ABIs
 try:
     from ..deployment.uniswap_v3_abis import (
         UNISWAP_V3_FACTORY_ABI, UNISWAP_V3_POOL_ABI, POSITION_MANAGER_ABI,
-        SWAP_ROUTER_ABI, QUOTER_V2_ABI, ERC20_ABI
+        SWAP_ROUTER_ABI, QUOTER_V2_ABI, ERC20_ABI, MULTICALL3_ABI
     )
 except ImportError:
     # Fallback if import fails
@@ -36,11 +44,76 @@ except ImportError:
     SWAP_ROUTER_ABI = []
     QUOTER_V2_ABI = []
     ERC20_ABI = []
+    MULTICALL3_ABI = []
+
+T = TypeVar('T')
+
+# Multicall3 is deployed at the same address on most EVM chains
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+# Calldata (function selectors) for the pool-state reads batched through Multicall3
+SLOT0_CALLDATA = bytes.fromhex("3850c7bd")      # slot0()
+LIQUIDITY_CALLDATA = bytes.fromhex("1a686502")  # liquidity()
+
+# Function selectors for transactions whose calldata add_liquidity encodes directly
+APPROVE_SELECTOR = Web3.keccak(text="approve(address,uint256)")[:4]
+MINT_SELECTOR = Web3.keccak(
+    text="mint((address,address,uint24,int24,int24,uint256,uint256,uint256,uint256,address,uint256))"
+)[:4]
+_MINT_PARAMS_TYPE = '(address,address,uint24,int24,int24,uint256,uint256,uint256,uint256,address,uint256)'
+
+# 2**192: scale of sqrtPriceX96 squared
+_Q192 = 1 << 192
+
+# Uniswap V3 tick spacing per fee tier (hundredths of a bip)
+_TICK_SPACING: Dict[int, int] = {100: 1, 500: 10, 3000: 60, 10000: 200}
+
+# Wei per whole unit of an 18-decimal amount (pool liquidity is tracked at this scale)
+_E18 = 10 ** 18
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _swap_price(pool_info: 'PoolInfo', token_in_symbol: str) -> float:
+    """Output tokens per input token for a swap in the given direction (1:2 default for uninitialized pools)"""
+    price_ratio = pool_info.get_price_ratio()
+    if token_in_symbol == pool_info.token0.symbol:
+        return price_ratio if price_ratio else 2.0
+    return 1 / price_ratio if price_ratio else 0.5
+
+
+def _optimal_arb_amount(liquidity_buy: int, price_buy: float,
+                        liquidity_sell: int, price_sell: float,
+                        max_impact: float) -> float:
+    """
+    Input size maximizing buy-then-sell profit under the simulate_swap model
+    
+    Each leg returns amount * price * (1 - k * amount), k = 0.01 * 1e18 / liquidity.
+    Dropping the k_buy * k_sell cross terms, profit is the concave quadratic
+    (P - 1) x - P (k_buy + k_sell * price_buy) x**2 with P = price_buy * price_sell,
+    maximized at x* = (P - 1) / (2 P (k_buy + k_sell * price_buy)).
+    
+    Args:
+        liquidity_buy: Liquidity of the pool bought in (18-decimal base units)
+        price_buy: Output tokens per input token in the buy pool
+        liquidity_sell: Liquidity of the pool sold in
+        price_sell: Output tokens per input token in the sell pool
+        max_impact: Largest per-leg price impact simulate_swap accepts
+        
+    Returns:
+        Optimal input amount, capped so neither leg exceeds max_impact; 0.0 if no size is profitable
+    """
+    gross = price_buy * price_sell
+    if gross <= 1.0:
+        return 0.0
+    
+    k_buy = 0.01 * _E18 / liquidity_buy
+    k_sell = 0.01 * _E18 / liquidity_sell
+    amount = (gross - 1.0) / (2.0 * gross * (k_buy + k_sell * price_buy))
+    return min(amount, max_impact / k_buy, max_impact / (k_sell * price_buy))
+
+
+@dataclass(slots=True)
 class TokenInfo:
     """Information about an ERC20 token"""
     address: str
@@ -48,34 +121,57 @@ class TokenInfo:
     symbol: str
     decimals: int
     total_supply: int
+    # 10**decimals, for converting whole-token amounts to base units
+    scale: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.scale = 10 ** self.decimals
 
 
-@dataclass  
+@dataclass(slots=True)
 class PoolInfo:
     """Information about a Uniswap V3 pool"""
     address: str
     token0: TokenInfo
     token1: TokenInfo
     fee: int
-    tick_spacing: int
     current_tick: int
     sqrt_price_x96: int
     liquidity: int
+    key: str  # Pool identifier in PoolManager.created_pools
+    # Derived from fee and the tokens, which never change after creation
+    tick_spacing: int = field(init=False)
+    _tokens_by_symbol: Tuple[TokenInfo, TokenInfo] = field(init=False, repr=False, compare=False)
+    # Memoized get_price_ratio(); change the price through update_state so it is reset
+    _price_ratio: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.tick_spacing = _TICK_SPACING.get(self.fee, 200)
+        if self.token0.symbol < self.token1.symbol:
+            self._tokens_by_symbol = (self.token0, self.token1)
+        else:
+            self._tokens_by_symbol = (self.token1, self.token0)
     
     def get_price_ratio(self) -> float:
         """Calculate token0/token1 price ratio"""
-        # Convert sqrt_price_x96 to actual price
-        price = (self.sqrt_price_x96 / (2 ** 96)) ** 2
-        return price
+        if self._price_ratio is None:
+            # price = (sqrtPriceX96 / 2**96)**2, as one exact int product and one division
+            self._price_ratio = (self.sqrt_price_x96 * self.sqrt_price_x96) / _Q192
+        return self._price_ratio
+    
+    def update_state(self, sqrt_price_x96: int, tick: int, liquidity: int) -> None:
+        """Replace price, tick and liquidity with freshly read values, dropping the memoized price ratio"""
+        self.sqrt_price_x96 = sqrt_price_x96
+        self.current_tick = tick
+        self.liquidity = liquidity
+        self._price_ratio = None
     
     def get_tokens_by_symbol(self) -> Tuple[TokenInfo, TokenInfo]:
         """Get tokens ordered by symbol (for consistent ordering)"""
-        if self.token0.symbol < self.token1.symbol:
-            return self.token0, self.token1
-        return self.token1, self.token0
+        return self._tokens_by_symbol
 
 
-@dataclass
+@dataclass(slots=True)
 class SwapResult:
     """Result of a swap transaction"""
     tx_hash: str
@@ -92,6 +188,15 @@ class SwapResult:
 class PoolManager:
     """Manages Uniswap V3 pools and token operations"""
     
+    # EIP-1559 fee caps (wei) for trader approve/swap transactions
+    APPROVE_MAX_FEE = 400 * 10**9
+    APPROVE_PRIORITY_FEE = 80 * 10**9
+    SWAP_MAX_FEE = 350 * 10**9
+    SWAP_PRIORITY_FEE = 70 * 10**9
+    
+    # Default maximum slippage accepted by simulate_swap
+    SLIPPAGE_TOLERANCE = 0.005
+    
     # Standard ERC20 ABI (simplified)
     ERC20_ABI = [
         {
@@ -156,16 +261,26 @@ class PoolManager:
         self.swap_router = network_config['contracts']['uniswap_v3_router']
         self.position_manager = network_config['contracts']['position_manager']
         self.quoter = network_config['contracts']['quoter_v2']
+        self.multicall3 = network_config['contracts'].get('multicall3', MULTICALL3_ADDRESS)
         
         # Deployed contracts tracking
         self.deployed_tokens: Dict[str, TokenInfo] = {}
         self.created_pools: Dict[str, PoolInfo] = {}
-        self.token_contracts: Dict[str, Any] = {}  # Store actual contract instances
+        self.token_contracts: Dict[str, Any] = {}  # Store actual contract instances (by symbol)
         self.pool_contracts: Dict[str, Any] = {}   # Store pool contract instances
         
         # Optional real deployer for actual blockchain deployment
         self.deployer = None
         
+        # Gas limits estimated once per (contract, method, sender)
+        self.gas_cache = GasEstimateCache()
+        
+        # Multicall3 contract, built on first batched pool-state read
+        self._multicall_contract: Optional[Contract] = None
+        
+        # Chain id for directly encoded transactions, read once
+        self._chain_id: Optional[int] = None
+        
         logger.info(f"Initialized PoolManager with deployer: {self.deployer_address}")
     
     async def deploy_token(self, 
@@ -187,7 +302,7 @@ class PoolManager:
         """
         try:
             # Use the real deployer if available
-            if hasattr(self, 'deployer') and self.deployer:
+            if self.deployer is not None:
                 contract = await self.deployer.deploy_erc20_token(name, symbol, decimals, total_supply)
                 
                 token_info = TokenInfo(
@@ -235,7 +350,7 @@ class PoolManager:
         Args:
             token0_symbol: First token symbol
             token1_symbol: Second token symbol
-            fee_tier: Pool fee tier (500, 3000, 10000)
+            fee_tier: Pool fee tier (100, 500, 3000, 10000)
             initial_price_ratio: Initial price ratio as "token0:token1"
             
         Returns:
@@ -246,21 +361,30 @@ class PoolManager:
             token0_info = self.deployed_tokens[token0_symbol]
             token1_info = self.deployed_tokens[token1_symbol]
             
-            # Ensure proper token ordering (token0 < token1)
-            if int(token0_info.address, 16) > int(token1_info.address, 16):
+            # Parse the "token0:token1" ratio once
+            try:
+                ratio0_str, ratio1_str = initial_price_ratio.split(':', 1)
+                ratio0, ratio1 = float(ratio0_str), float(ratio1_str)
+            except ValueError:
+                raise ValueError(f"Invalid price ratio {initial_price_ratio!r}, expected 'token0:token1'")
+            
+            # Ensure proper token ordering (token0 < token1); equal-length hex
+            # strings compare lexicographically in the same order as their values
+            if token0_info.address.lower() > token1_info.address.lower():
                 token0_info, token1_info = token1_info, token0_info
                 token0_symbol, token1_symbol = token1_symbol, token0_symbol
                 # Flip the price ratio
-                ratio_parts = initial_price_ratio.split(':')
-                initial_price_ratio = f"{ratio_parts[1]}:{ratio_parts[0]}"
+                ratio0, ratio1 = ratio1, ratio0
+            
+            # Pool identifier, built once and interned for the dict lookups that use it
+            pool_key = sys.intern(f"{token0_symbol}_{token1_symbol}_{fee_tier}")
             
             # Calculate initial sqrt price
-            ratio_parts = initial_price_ratio.split(':')
-            price_ratio = float(ratio_parts[1]) / float(ratio_parts[0])  # token1/token0
-            sqrt_price_x96 = int(math.sqrt(price_ratio) * (2 ** 96))
+            price_ratio = ratio1 / ratio0  # token1/token0
+            sqrt_price_x96 = math.isqrt(int(price_ratio * _Q192))  # exact integer sqrt in Q64.96
             
             # Use real deployer to create Uniswap V3 pool
-            if hasattr(self, 'deployer') and self.deployer:
+            if self.deployer is not None:
                 pool_contract = await self.deployer.create_uniswap_v3_pool(
                     token0_info.address, 
                     token1_info.address,
@@ -270,12 +394,11 @@ class PoolManager:
                 pool_address = pool_contract.address
                 
                 # Store contract instance
-                pool_key = f"{token0_symbol}_{token1_symbol}_{fee_tier}"
                 self.pool_contracts[pool_key] = pool_contract
                 
                 # Get actual pool state
                 try:
-                    slot0 = pool_contract.functions.slot0().call()
+                    slot0 = await self._rpc(pool_contract.functions.slot0().call)
                     actual_sqrt_price = slot0[0]
                     current_tick = slot0[1]
                     unlocked = slot0[6]
@@ -302,13 +425,12 @@ class PoolManager:
                 token0=token0_info,
                 token1=token1_info,
                 fee=fee_tier,
-                tick_spacing=60 if fee_tier == 3000 else (10 if fee_tier == 500 else 200),
                 current_tick=current_tick,
                 sqrt_price_x96=actual_sqrt_price,
-                liquidity=0  # Will be updated when liquidity is added
+                liquidity=0,  # Will be updated when liquidity is added
+                key=pool_key
             )
             
-            pool_key = f"{token0_symbol}_{token1_symbol}_{fee_tier}"
             self.created_pools[pool_key] = pool_info
             
             logger.info(f"Created Uniswap V3 pool {pool_key} at {pool_address}")
@@ -346,57 +468,32 @@ class PoolManager:
                 lower_tick, upper_tick = price_range
             
             # Convert amounts to wei
-            amount0_wei = int(amount0 * (10 ** pool_info.token0.decimals))
-            amount1_wei = int(amount1 * (10 ** pool_info.token1.decimals))
+            amount0_wei = int(amount0 * pool_info.token0.scale)
+            amount1_wei = int(amount1 * pool_info.token1.scale)
             
             # Use real deployer to add liquidity if available
-            if hasattr(self, 'deployer') and self.deployer:
+            if self.deployer is not None:
                 try:
-                    # Get position manager contract
-                    position_manager = self.web3.eth.contract(
-                        address=self.position_manager,
-                        abi=POSITION_MANAGER_ABI
-                    )
+                    # Approve tokens
+                    nonce, gas_price = await self._get_nonce_and_gas_price()
+                    if self._chain_id is None:
+                        self._chain_id = await self._rpc(lambda: self.web3.eth.chain_id)
                     
-                    # Get token contracts
-                    token0_contract = self.web3.eth.contract(
-                        address=pool_info.token0.address,
-                        abi=ERC20_ABI
+                    # Both approvals are sent back to back with consecutive nonces;
+                    # the mint follows only once they have succeeded
+                    approve_tx0 = self._deployer_tx(
+                        pool_info.token0.address,
+                        APPROVE_SELECTOR + abi_encode(['address', 'uint256'], [self.position_manager, amount0_wei]),
+                        nonce, 100000, gas_price
                     )
-                    token1_contract = self.web3.eth.contract(
-                        address=pool_info.token1.address,
-                        abi=ERC20_ABI
+                    approve_tx1 = self._deployer_tx(
+                        pool_info.token1.address,
+                        APPROVE_SELECTOR + abi_encode(['address', 'uint256'], [self.position_manager, amount1_wei]),
+                        nonce + 1, 100000, gas_price
                     )
                     
-                    # Approve tokens
-                    nonce = await self._get_nonce()
-                    gas_price = await self._get_gas_price()
-                    
-                    # Approve token0
-                    approve_tx0 = token0_contract.functions.approve(
-                        self.position_manager, amount0_wei
-                    ).build_transaction({
-                        'from': self.deployer_address,
-                        'nonce': nonce,
-                        'gas': 100000,
-                        'gasPrice': gas_price
-                    })
-                    await self._send_transaction(approve_tx0)
-                    
-                    # Approve token1
-                    nonce += 1
-                    approve_tx1 = token1_contract.functions.approve(
-                        self.position_manager, amount1_wei
-                    ).build_transaction({
-                        'from': self.deployer_address,
-                        'nonce': nonce,
-                        'gas': 100000,
-                        'gasPrice': gas_price
-                    })
-                    await self._send_transaction(approve_tx1)
-                    
                     # Add liquidity via Position Manager
-                    nonce += 1
+                    nonce += 2
                     deadline = int(time.time()) + 300  # 5 minutes
                     
                     mint_params = (
@@ -413,14 +510,17 @@ class PoolManager:
                         deadline                   # deadline
                     )
                     
-                    mint_tx = position_manager.functions.mint(mint_params).build_transaction({
-                        'from': self.deployer_address,
-                        'nonce': nonce,
-                        'gas': 500000,
-                        'gasPrice': gas_price
-                    })
+                    mint_tx = self._deployer_tx(
+                        self.position_manager,
+                        MINT_SELECTOR + abi_encode([_MINT_PARAMS_TYPE], [mint_params]),
+                        nonce, 500000, gas_price
+                    )
+                    
+                    approve_receipts = await self._send_transactions([approve_tx0, approve_tx1])
+                    if any(receipt['status'] != 1 for receipt in approve_receipts):
+                        raise ValueError("Approve transaction failed")
                     
-                    tx_receipt = await self._send_transaction(mint_tx)
+                    tx_receipt, = await self._send_transactions([mint_tx])
                     
                     # Parse mint result from logs (simplified)
                     liquidity_amount = amount0_wei + amount1_wei  # Simplified calculation
@@ -446,9 +546,13 @@ class PoolManager:
                     raise
             else:
                 # Mock implementation
-                liquidity_amount = int(math.sqrt(amount0 * amount1) * (10 ** 18))
+                liquidity_amount = int(math.sqrt(amount0 * amount1) * _E18)
                 pool_info.liquidity += liquidity_amount
                 
+                # Deterministic 256-bit mock hash of the call arguments
+                tx_digest = hashlib.blake2b(pool_key.encode(), digest_size=32)
+                tx_digest.update(struct.pack('<dd', amount0, amount1))
+                
                 result = {
                     'pool_address': pool_info.address,
                     'amount0_added': amount0,
@@ -456,7 +560,7 @@ class PoolManager:
                     'liquidity_minted': liquidity_amount,
                     'lower_tick': lower_tick,
                     'upper_tick': upper_tick,
-                    'tx_hash': f"0x{hash(f'addliq_{pool_key}_{amount0}_{amount1}'):064x}"[2:66]
+                    'tx_hash': tx_digest.hexdigest()
                 }
             
             logger.info(f"Added liquidity to {pool_key}: {amount0} + {amount1}")
@@ -466,26 +570,149 @@ class PoolManager:
             logger.error(f"Failed to add liquidity to {pool_key}: {e}")
             raise
     
+    def _deployer_tx(self, to: str, data: bytes, nonce: int, gas: int, gas_price: int) -> Dict[str, Any]:
+        """Build a legacy deployer transaction around already-encoded calldata"""
+        return {
+            'from': self.deployer_address,
+            'to': to,
+            'data': data,
+            'value': 0,
+            'nonce': nonce,
+            'gas': gas,
+            'gasPrice': gas_price,
+            'chainId': self._chain_id
+        }
+    
+    async def _rpc(self, fn: Callable[..., T], *args) -> T:
+        """
+        Run a blocking web3 call in the default executor
+        
+        The provider is synchronous; running its round-trips off the event
+        loop lets concurrently gathered tasks overlap their network latency.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, fn, *args)
+    
     async def _get_nonce(self) -> int:
         """Get current nonce for deployer account"""
-        return self.web3.eth.get_transaction_count(self.deployer_address)
+        return await self._rpc(self.web3.eth.get_transaction_count, self.deployer_address)
     
     async def _get_gas_price(self) -> int:
         """Get current gas price"""
-        return self.web3.eth.gas_price
+        return await self._rpc(lambda: self.web3.eth.gas_price)
+    
+    async def _get_nonce_and_gas_price(self) -> Tuple[int, int]:
+        """Get deployer nonce and gas price in one JSON-RPC batch (separate calls before web3 v7)"""
+        batch_requests = getattr(self.web3, 'batch_requests', None)
+        if batch_requests is None:
+            nonce, gas_price = await asyncio.gather(self._get_nonce(), self._get_gas_price())
+            return nonce, gas_price
+        
+        def fetch() -> Tuple[int, int]:
+            with batch_requests() as batch:
+                batch.add(self.web3.eth.get_transaction_count(self.deployer_address))
+                batch.add(self.web3.eth.gas_price)
+                nonce, gas_price = batch.execute()
+            return nonce, gas_price
+        
+        return await self._rpc(fetch)
+    
+    async def _send_transactions(self, transactions: List[Dict]) -> List[Dict]:
+        """
+        Sign and send deployer transactions back to back, then wait for all receipts
+        
+        Transactions must carry consecutive nonces so the chain executes them in
+        order. Sends and receipt polling run off the event loop, so waiting never
+        blocks other tasks.
+        
+        Args:
+            transactions: Transaction dictionaries in nonce order
+            
+        Returns:
+            Transaction receipts in the same order
+        """
+        signed_txns = await asyncio.gather(*(
+            sign_transaction_async(self.web3, transaction, self.deployer_account.key)
+            for transaction in transactions
+        ))
+        tx_hashes = []
+        for signed_txn in signed_txns:
+            raw_tx = getattr(signed_txn, 'rawTransaction', None) or getattr(signed_txn, 'raw_transaction', signed_txn)
+            tx_hashes.append(await self._rpc(self.web3.eth.send_raw_transaction, raw_tx))
+        
+        return await asyncio.gather(*(
+            wait_for_receipt_backoff(self.web3, tx_hash, timeout=120)
+            for tx_hash in tx_hashes
+        ))
+    
+    async def _multicall_pool_state(self, pool_keys: List[str]) -> Dict[str, Tuple[int, int, int]]:
+        """
+        Read slot0 and liquidity of several pools in a single eth_call via Multicall3
+        
+        Args:
+            pool_keys: Pool identifiers; pools without a contract instance are skipped
+            
+        Returns:
+            Dictionary mapping pool key to (sqrt_price_x96, tick, liquidity) for every pool whose reads succeeded
+        """
+        keys = [key for key in pool_keys if key in self.pool_contracts]
+        if not keys:
+            return {}
+        
+        calls = []
+        for key in keys:
+            pool_address = self.pool_contracts[key].address
+            calls.append((pool_address, True, SLOT0_CALLDATA))
+            calls.append((pool_address, True, LIQUIDITY_CALLDATA))
+        
+        if self._multicall_contract is None:
+            self._multicall_contract = self.web3.eth.contract(
+                address=Web3.to_checksum_address(self.multicall3), abi=MULTICALL3_ABI
+            )
+        results = await self._rpc(self._multicall_contract.functions.aggregate3(calls).call)
+        
+        states = {}
+        for i, key in enumerate(keys):
+            (slot0_ok, slot0_data), (liquidity_ok, liquidity_data) = results[2 * i], results[2 * i + 1]
+            if not (slot0_ok and liquidity_ok):
+                logger.warning(f"Multicall pool-state read failed for {key}")
+                continue
+            
+            sqrt_price_x96, tick = abi_decode(['uint160', 'int24'], slot0_data[:64])
+            (liquidity,) = abi_decode(['uint128'], liquidity_data)
+            states[key] = (sqrt_price_x96, tick, liquidity)
+        
+        return states
     
-    async def _send_transaction(self, transaction: Dict) -> Dict:
-        """Sign and send transaction"""
-        signed_txn = self.web3.eth.account.sign_transaction(transaction, self.deployer_account.key)
-        raw_tx = getattr(signed_txn, 'rawTransaction', None) or getattr(signed_txn, 'raw_transaction', signed_txn)
-        tx_hash = self.web3.eth.send_raw_transaction(raw_tx)
-        return self.web3.eth.wait_for_transaction_receipt(tx_hash)
+    async def refresh_pool_states(self, pool_keys: List[str]) -> None:
+        """
+        Update stored price, tick and liquidity of pools from the blockchain
+        
+        Pools without a contract instance, or whose on-chain liquidity is zero,
+        keep their stored values.
+        
+        Args:
+            pool_keys: Pool identifiers to refresh
+        """
+        try:
+            states = await self._multicall_pool_state(pool_keys)
+        except Exception as e:
+            logger.warning(f"Could not read blockchain pool state for {pool_keys}: {e}")
+            return
+        
+        for key, (sqrt_price_x96, tick, liquidity) in states.items():
+            if liquidity == 0:
+                logger.warning(f"Pool {key} has no liquidity on blockchain")
+                continue
+            
+            self.created_pools[key].update_state(sqrt_price_x96, tick, liquidity)
+            logger.debug(f"Updated {key} state: liquidity={liquidity}, tick={tick}")
     
     async def simulate_swap(self,
                            pool_key: str,
                            token_in_symbol: str,
                            amount_in: float,
-                           slippage_tolerance: float = 0.005) -> Dict[str, Any]:
+                           slippage_tolerance: float = SLIPPAGE_TOLERANCE) -> Dict[str, Any]:
         """
         Simulate a swap to get expected output
         
@@ -504,56 +731,35 @@ class PoolManager:
             # Determine swap direction
             is_token0_in = (token_in_symbol == pool_info.token0.symbol)
             
-            # Check if we have a real pool contract and update liquidity
-            if hasattr(self, 'pool_contracts') and pool_key in self.pool_contracts:
-                try:
-                    pool_contract = self.pool_contracts[pool_key]
-                    real_liquidity = pool_contract.functions.liquidity().call()
-                    
-                    if real_liquidity > 0:
-                        pool_info.liquidity = real_liquidity
-                        logger.debug(f"Updated {pool_key} liquidity: {real_liquidity}")
-                    else:
-                        raise ValueError(f"Pool {pool_key} has no liquidity on blockchain")
-                        
-                except Exception as e:
-                    logger.warning(f"Could not read blockchain liquidity for {pool_key}: {e}")
-                    # Continue with stored liquidity value
-            
+            # Uses the stored liquidity; callers refresh it from the chain with
+            # refresh_pool_states (one Multicall3 read for all pools involved)
             if pool_info.liquidity == 0:
                 raise ValueError(f"Pool {pool_key} has no liquidity stored")
             
             # Simplified constant product formula (x * y = k)
             # In real implementation, would use Uniswap V3 concentrated liquidity math
-            
-            if is_token0_in:
-                # Swapping token0 for token1
-                current_price = pool_info.get_price_ratio()
-                if current_price == 0:
-                    # Use default 1:2 ratio (1 TOKEN1 = 2 TOKEN2)
-                    current_price = 2.0
-                amount_out_ideal = amount_in * current_price
-                
-                # Apply slippage based on trade size relative to liquidity
-                liquidity_ratio = amount_in / (pool_info.liquidity / 10**18)
-                slippage_impact = liquidity_ratio * 0.01  # 1% slippage per liquidity unit
-                
-                amount_out = amount_out_ideal * (1 - slippage_impact)
-                
-            else:
-                # Swapping token1 for token0
-                price_ratio = pool_info.get_price_ratio()
-                if price_ratio == 0:
-                    # Use default 1:2 ratio (1 TOKEN1 = 2 TOKEN2, so 2 TOKEN2 = 0.5 TOKEN1)
-                    current_price = 0.5
+            token_in, token_out = ((pool_info.token0, pool_info.token1) if is_token0_in
+                                   else (pool_info.token1, pool_info.token0))
+            sqrt_price_x96 = pool_info.sqrt_price_x96
+            
+            if sqrt_price_x96:
+                # Q64.96 fixed point, as on-chain: price (token1 per token0) = sqrtPriceX96**2 / 2**192
+                amount_in_wei = int(amount_in * token_in.scale)
+                price_x192 = sqrt_price_x96 * sqrt_price_x96
+                if is_token0_in:
+                    amount_out_ideal_wei = (amount_in_wei * price_x192) >> 192
                 else:
-                    current_price = 1 / price_ratio
-                amount_out_ideal = amount_in * current_price
-                
-                liquidity_ratio = amount_in / (pool_info.liquidity / 10**18)
-                slippage_impact = liquidity_ratio * 0.01
-                
-                amount_out = amount_out_ideal * (1 - slippage_impact)
+                    amount_out_ideal_wei = (amount_in_wei << 192) // price_x192
+                amount_out_ideal = amount_out_ideal_wei / token_out.scale
+            else:
+                # Use default 1:2 ratio (1 TOKEN1 = 2 TOKEN2, so 2 TOKEN2 = 0.5 TOKEN1)
+                amount_out_ideal = amount_in * (2.0 if is_token0_in else 0.5)
+            
+            # Apply slippage based on trade size relative to liquidity
+            liquidity_ratio = amount_in / (pool_info.liquidity / _E18)
+            slippage_impact = liquidity_ratio * 0.01  # 1% slippage per liquidity unit
+            
+            amount_out = amount_out_ideal * (1 - slippage_impact)
             
             # Calculate actual slippage
             if amount_out_ideal > 0:
@@ -572,7 +778,7 @@ class PoolManager:
                 'slippage': actual_slippage,
                 'price_impact': slippage_impact,
                 'token_in': token_in_symbol,
-                'token_out': pool_info.token1.symbol if is_token0_in else pool_info.token0.symbol
+                'token_out': token_out.symbol
             }
             
             return result
@@ -603,12 +809,6 @@ class PoolManager:
             SwapResult with execution details
         """
         try:
-            # First simulate to get expected results
-            simulation = await self.simulate_swap(pool_key, token_in_symbol, amount_in)
-            
-            if simulation['amount_out'] < min_amount_out:
-                raise ValueError(f"Slippage {simulation['slippage']*100:.3f}% exceeds tolerance")
-            
             pool_info = self.created_pools[pool_key]
             
             # Determine token in/out
@@ -616,47 +816,55 @@ class PoolManager:
             token_in_address = self.deployer.w3.to_checksum_address(pool_info.token0.address if is_token0_in else pool_info.token1.address)
             token_out_address = self.deployer.w3.to_checksum_address(pool_info.token1.address if is_token0_in else pool_info.token0.address)
             
-            # Convert to wei
-            token_in_decimals = pool_info.token0.decimals if is_token0_in else pool_info.token1.decimals
-            amount_in_wei = int(amount_in * (10 ** token_in_decimals))
-            min_amount_out_wei = int(min_amount_out * (10 ** token_in_decimals))
-            
             # Get swap router
             swap_router_address = self.network_config.get('contracts', {}).get('uniswap_v3_router')
             if not swap_router_address:
                 raise ValueError("Swap router address not found in config")
             swap_router_address = self.deployer.w3.to_checksum_address(swap_router_address)
             
-            # Step 1: Approve token
-            token_contract = self.deployer.w3.eth.contract(address=token_in_address, abi=ERC20_ABI)
+            token_contract = get_contract(self.deployer.w3, token_in_address, "erc20")
+            
+            # Pool state, current allowance and trader nonce are independent reads
+            _, current_allowance, nonce = await asyncio.gather(
+                self.refresh_pool_states([pool_key]),
+                self._rpc(token_contract.functions.allowance(trader_address, swap_router_address).call),
+                self._rpc(self.deployer.w3.eth.get_transaction_count, trader_address)
+            )
+            
+            # Simulate against the refreshed on-chain state to get expected results
+            simulation = await self.simulate_swap(pool_key, token_in_symbol, amount_in)
             
-            # Check current allowance
-            current_allowance = token_contract.functions.allowance(trader_address, swap_router_address).call()
+            if simulation['amount_out'] < min_amount_out:
+                raise ValueError(f"Slippage {simulation['slippage']*100:.3f}% exceeds tolerance")
+            
+            # Convert to wei
+            token_in_scale = pool_info.token0.scale if is_token0_in else pool_info.token1.scale
+            amount_in_wei = int(amount_in * token_in_scale)
+            min_amount_out_wei = int(min_amount_out * token_in_scale)
             
+            # Step 1: Approve token
             if current_allowance < amount_in_wei:
                 logger.info(f"Approving {amount_in} {token_in_symbol}...")
                 
-                nonce = self.deployer.w3.eth.get_transaction_count(trader_address)
-                approve_tx = token_contract.functions.approve(
-                    swap_router_address,
-                    amount_in_wei
-                ).build_transaction({
+                approve_fn = token_contract.functions.approve(swap_router_address, amount_in_wei)
+                approve_tx = approve_fn.build_transaction({
                     'from': trader_address,
                     'nonce': nonce,
-                    'gas': 100000,
-                    'maxFeePerGas': self.deployer.w3.to_wei(400, 'gwei'),
-                    'maxPriorityFeePerGas': self.deployer.w3.to_wei(80, 'gwei'),
+                    'gas': self.gas_cache.get_gas_limit(approve_fn, trader_address, 100000),
+                    'maxFeePerGas': self.APPROVE_MAX_FEE,
+                    'maxPriorityFeePerGas': self.APPROVE_PRIORITY_FEE,
                 })
                 
-                signed_approve = self.deployer.w3.eth.account.sign_transaction(approve_tx, trader_private_key)
-                approve_hash = self.deployer.w3.eth.send_raw_transaction(signed_approve.raw_transaction)
-                approve_receipt = self.deployer.w3.eth.wait_for_transaction_receipt(approve_hash, timeout=120)
+                signed_approve = await sign_transaction_async(self.deployer.w3, approve_tx, trader_private_key)
+                approve_hash = await self._rpc(self.deployer.w3.eth.send_raw_transaction, signed_approve.raw_transaction)
+                approve_receipt = await wait_for_receipt_backoff(self.deployer.w3, approve_hash, timeout=120)
                 
                 if approve_receipt['status'] != 1:
                     raise ValueError("Approve transaction failed")
+                nonce += 1
             
             # Step 2: Execute swap
-            swap_router = self.deployer.w3.eth.contract(address=swap_router_address, abi=SWAP_ROUTER_ABI)
+            swap_router = get_contract(self.deployer.w3, swap_router_address, "router")
             
             swap_params = {
                 'tokenIn': token_in_address,
@@ -668,22 +876,22 @@ class PoolManager:
                 'sqrtPriceLimitX96': 0
             }
             
-            nonce = self.deployer.w3.eth.get_transaction_count(trader_address)
-            swap_tx = swap_router.functions.exactInputSingle(swap_params).build_transaction({
+            swap_fn = swap_router.functions.exactInputSingle(swap_params)
+            swap_tx = swap_fn.build_transaction({
                 'from': trader_address,
                 'nonce': nonce,
-                'gas': 800000,
-                'maxFeePerGas': self.deployer.w3.to_wei(350, 'gwei'),
-                'maxPriorityFeePerGas': self.deployer.w3.to_wei(70, 'gwei'),
+                'gas': self.gas_cache.get_gas_limit(swap_fn, trader_address, 800000),
+                'maxFeePerGas': self.SWAP_MAX_FEE,
+                'maxPriorityFeePerGas': self.SWAP_PRIORITY_FEE,
             })
             
-            signed_swap = self.deployer.w3.eth.account.sign_transaction(swap_tx, trader_private_key)
-            swap_hash = self.deployer.w3.eth.send_raw_transaction(signed_swap.raw_transaction)
+            signed_swap = await sign_transaction_async(self.deployer.w3, swap_tx, trader_private_key)
+            swap_hash = await self._rpc(self.deployer.w3.eth.send_raw_transaction, signed_swap.raw_transaction)
             tx_hash = swap_hash.hex()
             
             logger.info(f"Swap TX submitted: {tx_hash[:10]}...")
             
-            swap_receipt = self.deployer.w3.eth.wait_for_transaction_receipt(swap_hash, timeout=120)
+            swap_receipt = await wait_for_receipt_backoff(self.deployer.w3, swap_hash, timeout=120)
             
             if swap_receipt['status'] != 1:
                 raise ValueError("Swap transaction failed")
@@ -716,28 +924,26 @@ class PoolManager:
     
     def get_pool_state(self, pool_key: str) -> Dict[str, Any]:
         """Get current pool state information"""
-        try:
-            pool_info = self.created_pools[pool_key]
-            
-            return {
-                'address': pool_info.address,
-                'token0': {
-                    'symbol': pool_info.token0.symbol,
-                    'address': pool_info.token0.address
-                },
-                'token1': {
-                    'symbol': pool_info.token1.symbol,
-                    'address': pool_info.token1.address
-                },
-                'fee': pool_info.fee,
-                'liquidity': pool_info.liquidity,
-                'sqrt_price_x96': pool_info.sqrt_price_x96,
-                'current_price_ratio': pool_info.get_price_ratio(),
-                'tick': pool_info.current_tick
-            }
-            
-        except KeyError:
+        pool_info = self.created_pools.get(pool_key)
+        if pool_info is None:
             raise ValueError(f"Pool {pool_key} not found")
+        
+        return {
+            'address': pool_info.address,
+            'token0': {
+                'symbol': pool_info.token0.symbol,
+                'address': pool_info.token0.address
+            },
+            'token1': {
+                'symbol': pool_info.token1.symbol,
+                'address': pool_info.token1.address
+            },
+            'fee': pool_info.fee,
+            'liquidity': pool_info.liquidity,
+            'sqrt_price_x96': pool_info.sqrt_price_x96,
+            'current_price_ratio': pool_info.get_price_ratio(),
+            'tick': pool_info.current_tick
+        }
     
     def list_pools(self) -> List[str]:
         """List all created pools"""
@@ -759,7 +965,7 @@ class PoolManager:
                 return 1.0  # 100% price impact if no liquidity
             
             # Simplified price impact calculation
-            liquidity_depth = pool_info.liquidity / 10**18
+            liquidity_depth = pool_info.liquidity / _E18
             impact_ratio = amount_in / liquidity_depth
             
             # Non-linear price impact (square root relationship)
@@ -787,6 +993,9 @@ class PoolManager:
             Optimal arbitrage amount or None if no arbitrage opportunity
         """
         try:
+            # Refresh both pools from the chain in one Multicall3 read
+            await self.refresh_pool_states([pool_key1, pool_key2])
+            
             # Get pool states
             pool1_state = self.get_pool_state(pool_key1)
             pool2_state = self.get_pool_state(pool_key2)
@@ -801,30 +1010,24 @@ class PoolManager:
             if price_diff < 0.001:
                 return None
             
-            # Simple optimization: try different amounts and find maximum profit
-            best_profit = 0
-            best_amount = 0
+            # Buy in the cheaper pool, sell in the other
+            if price1 < price2:
+                buy_pool, sell_pool = self.created_pools[pool_key1], self.created_pools[pool_key2]
+            else:
+                buy_pool, sell_pool = self.created_pools[pool_key2], self.created_pools[pool_key1]
             
-            for amount in [10, 25, 50, 100, 200]:
-                try:
-                    # Simulate buying in cheaper pool
-                    if price1 < price2:
-                        buy_sim = await self.simulate_swap(pool_key1, token_symbol, amount)
-                        sell_sim = await self.simulate_swap(pool_key2, buy_sim['token_out'], buy_sim['amount_out'])
-                    else:
-                        buy_sim = await self.simulate_swap(pool_key2, token_symbol, amount)
-                        sell_sim = await self.simulate_swap(pool_key1, buy_sim['token_out'], buy_sim['amount_out'])
-                    
-                    profit = sell_sim['amount_out'] - amount
-                    
-                    if profit > best_profit:
-                        best_profit = profit
-                        best_amount = amount
-                        
-                except:
-                    continue  # Skip if simulation fails
+            if buy_pool.liquidity == 0 or sell_pool.liquidity == 0:
+                return None
             
-            return best_amount if best_profit > 0 else None
+            token_out_symbol = (buy_pool.token1.symbol if token_symbol == buy_pool.token0.symbol
+                                else buy_pool.token0.symbol)
+            
+            amount = _optimal_arb_amount(
+                buy_pool.liquidity, _swap_price(buy_pool, token_symbol),
+                sell_pool.liquidity, _swap_price(sell_pool, token_out_symbol),
+                self.SLIPPAGE_TOLERANCE
+            )
+            return amount if amount > 0 else None
             
         except Exception as e:
             logger.error(f"Failed to calculate optimal arbitrage: {e}")
@@ -836,9 +1039,10 @@ def create_pool_manager_from_config(config: Dict[str, Any],
                                   deployer_private_key: str) -> PoolManager:
     """Create PoolManager from network configuration"""
     from web3 import Web3
+    from ..utils.blockchain import FastHTTPProvider
     
     # Connect to network
-    web3 = Web3(Web3.HTTPProvider(config['rpc_url']))
+    web3 = Web3(FastHTTPProvider(config['rpc_url']))
     
     # Verify connection
     if not web3.is_connected():
@@ -899,20 +1103,20 @@ if __name__ == "__main__":
             
             # Add liquidity  
             print("\n💧 Adding liquidity...")
-            liq_result = await pool_manager.add_liquidity("TOKEN1_TOKEN2_3000", 1000, 2000)
+            liq_result = await pool_manager.add_liquidity(pool_info.key, 1000, 2000)
             print(f"   Added: {liq_result['amount0_added']} + {liq_result['amount1_added']}")
             print(f"   Liquidity: {liq_result['liquidity_minted']}")
             
             # Simulate swap
             print("\n🔄 Simulating swap...")
-            swap_sim = await pool_manager.simulate_swap("TOKEN1_TOKEN2_3000", "TOKEN1", 50)
+            swap_sim = await pool_manager.simulate_swap(pool_info.key, "TOKEN1", 50)
             print(f"   50 TOKEN1 -> {swap_sim['amount_out']:.6f} TOKEN2")
             print(f"   Slippage: {swap_sim['slippage']:.3%}")
             
             # Execute swap
             print("\n⚡ Executing swap...")
             swap_result = await pool_manager.execute_swap(
-                "TOKEN1_TOKEN2_3000", "TOKEN1", 30, swap_sim['amount_out'] * 0.95, 
+                pool_info.key, "TOKEN1", 30, swap_sim['amount_out'] * 0.95, 
                 "0x742d35Cc6634C0532925a3b8D7cf460000000000"
             )
             print(f"   TX: {swap_result.tx_hash}")
@@ -921,7 +1125,7 @@ if __name__ == "__main__":
             
             # Show final pool state
             print("\n📊 Final pool state:")
-            pool_state = pool_manager.get_pool_state("TOKEN1_TOKEN2_3000")
+            pool_state = pool_manager.get_pool_state(pool_info.key)
             print(f"   Price ratio: {pool_state['current_price_ratio']:.6f}")
             print(f"   Liquidity: {pool_state['liquidity']}")
             
@@ -14,7 +14,7 @@ import asyncio
 import time
 import logging
 import os
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, is_dataclass
 from typing import Dict, List, Optional, Any, Callable
 import csv
 import json
@@ -24,7 +24,7 @@ from .mev_bot import MEVBot, BotStrategy, MEVOpportunity, AttackResult, create_b
 from .victim_trader import VictimTrader, VictimTraderManager, VictimType, VictimTrade, create_victim_trader_from_config
 from .pool_manager import PoolManager, create_pool_manager_from_config
 from .latency_simulator import LatencySimulator, CompetitionLatencyManager
-from ..utils.helpers import setup_logging, format_currency
+from ..utils.helpers import setup_logging, format_currency, run_async
 
 logger = logging.getLogger(__name__)
 
@@ -165,8 +165,8 @@ class MEVSimulator:
         pool_addr = blockchain_client.w3.to_checksum_address(contracts['uniswap_pool'])
         
         self.pool_manager.deployed_tokens = {
-            'TOKEN1': type('TokenInfo', (), {'address': token1_addr, 'symbol': 'TOKEN1', 'decimals': 18})(),
-            'TOKEN2': type('TokenInfo', (), {'address': token2_addr, 'symbol': 'TOKEN2', 'decimals': 18})()
+            'TOKEN1': type('TokenInfo', (), {'address': token1_addr, 'symbol': 'TOKEN1', 'decimals': 18, 'scale': 10**18})(),
+            'TOKEN2': type('TokenInfo', (), {'address': token2_addr, 'symbol': 'TOKEN2', 'decimals': 18, 'scale': 10**18})()
         }
         
         pool_key = 'TOKEN1_TOKEN2_3000'
@@ -434,24 +434,27 @@ class MEVSimulator:
         # 2. MEV bots detect opportunities
         mev_opportunities = []
         
-        for bot in self.mev_bots.values():
-            # Create block data for opportunity detection
-            block_data = {
-                'block_number': self.current_block,
-                'pending_transactions': [
-                    {
-                        'hash': f'0x{hash(f"{trade.trade_id}_{current_time}"):064x}'[2:66],
-                        'type': 'swap',
-                        'amount_in': trade.amount_in,
-                        'pool_address': 'mock_pool_address',
-                        'token_in': trade.token_in_symbol,
-                        'token_out': trade.token_out_symbol
-                    }
-                    for trade in victim_trades
-                ]
-            }
-            
-            opportunities = await bot.detect_mev_opportunity(block_data)
+        # Create block data for opportunity detection (read-only, shared by all bots)
+        block_data = {
+            'block_number': self.current_block,
+            'pending_transactions': [
+                {
+                    'hash': f'0x{hash(f"{trade.trade_id}_{current_time}"):064x}'[2:66],
+                    'type': 'swap',
+                    'amount_in': trade.amount_in,
+                    'pool_address': 'mock_pool_address',
+                    'token_in': trade.token_in_symbol,
+                    'token_out': trade.token_out_symbol
+                }
+                for trade in victim_trades
+            ]
+        }
+        
+        # Bots scan the block concurrently so their detection latencies overlap
+        detected = await asyncio.gather(
+            *(bot.detect_mev_opportunity(block_data) for bot in self.mev_bots.values())
+        )
+        for opportunities in detected:
             mev_opportunities.extend(opportunities)
         
         round_data.mev_opportunities = mev_opportunities
@@ -466,13 +469,19 @@ class MEVSimulator:
                 'opportunities_count': len(mev_opportunities),
                 'round_number': round_data.round_number
             }
+            competition_level = MEVBot.derive_competition_level(competition_data)
             
             # Each bot tries to execute opportunities
             for opportunity in mev_opportunities:
                 competing_bots = []
                 
-                for bot in self.mev_bots.values():
-                    result = await bot.evaluate_and_execute(opportunity, competition_data)
+                # Bots evaluate concurrently; results come back in bot order
+                results = await asyncio.gather(
+                    *(bot.evaluate_and_execute(opportunity, competition_data, competition_level)
+                      for bot in self.mev_bots.values())
+                )
+                
+                for bot, result in zip(self.mev_bots.values(), results):
                     if result:
                         attack_results.append(result)
                         competing_bots.append(bot.bot_id)
@@ -648,15 +657,22 @@ class MEVSimulator:
     async def _export_json(self, file_path: Path) -> None:
         """Export results to JSON format"""
         # Convert dataclasses to dictionaries for JSON serialization
+        def attributes(obj):
+            # Slotted dataclasses (MEVOpportunity, AttackResult) have no __dict__
+            if is_dataclass(obj) and not isinstance(obj, type):
+                return {f.name: getattr(obj, f.name) for f in fields(obj)}
+            return getattr(obj, '__dict__', None)
+        
         def serialize_dataclass(obj):
-            if hasattr(obj, '__dict__'):
+            attrs = attributes(obj)
+            if attrs is not None:
                 result = {}
-                for key, value in obj.__dict__.items():
+                for key, value in attrs.items():
                     if isinstance(value, list):
                         result[key] = [serialize_dataclass(item) for item in value]
                     elif isinstance(value, dict):
                         result[key] = {k: serialize_dataclass(v) for k, v in value.items()}
-                    elif hasattr(value, '__dict__'):
+                    elif attributes(value) is not None:
                         result[key] = serialize_dataclass(value)
                     else:
                         result[key] = value
@@ -798,5 +814,5 @@ if __name__ == "__main__":
             import traceback
             traceback.print_exc()
     
-    # Run example
-    asyncio.run(main())
+    # Run example (on uvloop when installed)
+    run_async(main())
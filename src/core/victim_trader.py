@@ -330,7 +330,8 @@ class VictimTrader:
             True if trade executed successfully
         """
         try:
-            # First simulate to get expected output
+            # First simulate to get expected output against on-chain pool state
+            await pool_manager.refresh_pool_states([trade.pool_key])
             simulation = await pool_manager.simulate_swap(
                 trade.pool_key,
                 trade.token_in_symbol, 
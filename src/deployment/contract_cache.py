@@ -0,0 +1,49 @@
+"""
+Contract Instance Cache
+
+Building a web3 contract object parses its ABI into function and event
+descriptors. Scripts that touch the same token, pool and router many times
+fetch them from here so that work is done once per (provider, address, ABI).
+The cache lives on the Web3 instance itself, so it is freed with it.
+"""
+
+from typing import Dict, Tuple
+
+from web3 import Web3
+from web3.contract import Contract
+
+from .uniswap_v3_abis import ERC20_ABI, SWAP_ROUTER_ABI, UNISWAP_V3_POOL_ABI
+
+# ABI lookup by short key
+ABIS = {
+    "erc20": ERC20_ABI,
+    "router": SWAP_ROUTER_ABI,
+    "pool": UNISWAP_V3_POOL_ABI,
+}
+
+# Attribute holding each Web3 instance's {(address, abi_key): Contract} cache
+_CACHE_ATTR = "_contract_instance_cache"
+
+
+def get_contract(w3: Web3, address: str, abi_key: str) -> Contract:
+    """
+    Get a cached contract instance
+
+    Args:
+        w3: Web3 instance the contract is bound to
+        address: Checksummed contract address
+        abi_key: One of "erc20", "router", "pool"
+
+    Returns:
+        Web3 Contract instance
+    """
+    cache: Dict[Tuple[str, str], Contract] = vars(w3).get(_CACHE_ATTR)
+    if cache is None:
+        cache = {}
+        setattr(w3, _CACHE_ATTR, cache)
+
+    contract = cache.get((address, abi_key))
+    if contract is None:
+        contract = w3.eth.contract(address=address, abi=ABIS[abi_key])
+        cache[(address, abi_key)] = contract
+    return contract
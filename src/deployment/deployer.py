@@ -292,8 +292,7 @@ class ContractDeployer:
         """Initialize Uniswap V3 pool with initial price"""
         # Calculate sqrtPriceX96 from price ratio
         # price_ratio is token1/token0 (how many token1 per token0)
-        sqrt_price = math.sqrt(price_ratio)
-        sqrt_price_x96 = int(sqrt_price * (2 ** 96))
+        sqrt_price_x96 = math.isqrt(int(price_ratio * (1 << 192)))
         
         logger.info(f"Initializing pool with price ratio {price_ratio} (sqrtPriceX96: {sqrt_price_x96})")
         
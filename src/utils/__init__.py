@@ -18,15 +18,21 @@ from .helpers import (
     wei_to_eth,
     eth_to_wei,
     format_timestamp,
-    create_output_directory
+    create_output_directory,
+    run_async
 )
 
 from .blockchain import (
     BlockchainClient,
+    FastHTTPProvider,
+    create_http_session,
+    GasEstimateCache,
     connect_to_network,
     get_block_info,
     estimate_gas_price,
-    wait_for_transaction
+    wait_for_transaction,
+    wait_for_receipt_backoff,
+    sign_transaction_async
 )
 
 __all__ = [
@@ -40,13 +46,19 @@ __all__ = [
     "eth_to_wei",
     "format_timestamp",
     "create_output_directory",
+    "run_async",
     
     # Blockchain utilities
     "BlockchainClient",
+    "FastHTTPProvider",
+    "create_http_session",
+    "GasEstimateCache",
     "connect_to_network",
     "get_block_info", 
     "estimate_gas_price",
-    "wait_for_transaction"
+    "wait_for_transaction",
+    "wait_for_receipt_backoff",
+    "sign_transaction_async"
 ]
 
 
@@ -5,19 +5,99 @@ Provides common blockchain operations and Web3 integrations.
 """
 
 import asyncio
+import json
 import time
 import logging
 from typing import Dict, Any, Optional, List, Union
 from dataclasses import dataclass
 from web3 import Web3
 from web3.contract import Contract
-from web3.exceptions import TransactionNotFound, BlockNotFound
+from web3.exceptions import TransactionNotFound, BlockNotFound, TimeExhausted
+from web3._utils.encoding import Web3JsonEncoder
 from eth_account import Account
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from .helpers import retry_with_backoff, exponential_backoff, Timer
 
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib json path in web3
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _orjson_default(obj: Any) -> Any:
+    """Serialize web3 types (HexBytes, AttributeDict, ...) that orjson does not know"""
+    return Web3JsonEncoder().default(obj)
+
+
+def create_http_session(pool_connections: int = 10,
+                        pool_maxsize: int = 20,
+                        max_retries: int = 3) -> requests.Session:
+    """
+    Create a keep-alive HTTP session for JSON-RPC traffic
+    
+    Args:
+        pool_connections: Number of per-host connection pools to cache
+        pool_maxsize: Maximum open connections kept per pool
+        max_retries: Retries on connection errors, with backoff
+        
+    Returns:
+        Configured requests.Session
+    """
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=max_retries, backoff_factor=0.5)
+    )
+    
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+class FastHTTPProvider(Web3.HTTPProvider):
+    """
+    HTTPProvider that encodes requests and decodes responses with orjson
+    
+    Receipts, logs and block payloads are decoded several times faster than
+    with the stdlib json module. Behaves exactly like HTTPProvider when orjson
+    is not installed. Unless a session is passed in, every provider owns a
+    pooled keep-alive session so TLS handshakes are paid once per connection
+    rather than once per RPC call.
+    """
+    
+    def __init__(self, endpoint_uri=None, request_kwargs=None, session=None, **kwargs):
+        if session is None:
+            session = create_http_session()
+        super().__init__(endpoint_uri, request_kwargs=request_kwargs, session=session, **kwargs)
+    
+    def encode_rpc_request(self, method, params: Any) -> bytes:
+        if orjson is None:
+            return super().encode_rpc_request(method, params)
+        
+        rpc_dict = {
+            "jsonrpc": "2.0",
+            "method": method,
+            "params": params or [],
+            "id": next(self.request_counter),
+        }
+        try:
+            return orjson.dumps(rpc_dict, default=_orjson_default)
+        except orjson.JSONEncodeError:
+            # orjson rejects integers wider than 64 bits (e.g. uint256 values
+            # in call params); encode those requests with web3's stdlib encoder
+            return json.dumps(rpc_dict, cls=Web3JsonEncoder).encode()
+    
+    def decode_rpc_response(self, raw_response: bytes):
+        if orjson is None:
+            return super().decode_rpc_response(raw_response)
+        return orjson.loads(raw_response)
+
+
 @dataclass
 class BlockInfo:
     """Block information data structure"""
@@ -44,6 +124,53 @@ class TransactionInfo:
     status: Optional[int]
     
 
+class GasEstimateCache:
+    """
+    Caches gas limits per (contract, method, sender)
+    
+    eth_estimateGas is called the first time a method is sent from an account;
+    later transactions reuse the estimate plus headroom instead of a hard-coded
+    worst-case limit.
+    """
+    
+    def __init__(self, headroom: float = 1.2):
+        """
+        Args:
+            headroom: Multiplier applied on top of the raw estimate
+        """
+        self.headroom = headroom
+        self._estimates: Dict[tuple, int] = {}
+    
+    def get_gas_limit(self, contract_function, sender: str, default: int) -> int:
+        """
+        Get gas limit for a bound contract function call
+        
+        Args:
+            contract_function: Bound web3 ContractFunction (e.g. token.functions.approve(...))
+            sender: Address the transaction will be sent from
+            default: Gas limit to use if estimation fails (not cached)
+            
+        Returns:
+            Gas limit including headroom
+        """
+        key = (contract_function.address, contract_function.fn_name, sender)
+        
+        if key not in self._estimates:
+            try:
+                estimate = contract_function.estimate_gas({'from': sender})
+            except Exception as e:
+                logger.warning(f"Gas estimation failed for {contract_function.fn_name}, using {default}: {e}")
+                return default
+            
+            self._estimates[key] = int(estimate * self.headroom)
+        
+        return self._estimates[key]
+    
+    def clear(self) -> None:
+        """Drop all cached estimates"""
+        self._estimates.clear()
+
+
 class BlockchainClient:
     """Enhanced Web3 client with MEV-specific utilities"""
     
@@ -64,7 +191,7 @@ class BlockchainClient:
         self.timeout = timeout
         
         # Initialize Web3
-        self.w3 = Web3(Web3.HTTPProvider(rpc_url, request_kwargs={'timeout': timeout}))
+        self.w3 = Web3(FastHTTPProvider(rpc_url, request_kwargs={'timeout': timeout}))
         
         # Connection state
         self.is_connected = False
@@ -412,6 +539,70 @@ def connect_to_network(network_config: Dict[str, Any]) -> BlockchainClient:
     return client
 
 
+async def sign_transaction_async(w3: Web3, transaction: Dict[str, Any], private_key: str):
+    """
+    Sign a transaction in the default thread pool
+    
+    ECDSA signing plus RLP/keccak in eth_account is CPU work; running it in an
+    executor keeps the event loop free for other traders' RPC calls.
+    
+    Args:
+        w3: Web3 instance
+        transaction: Transaction dictionary
+        private_key: Signer private key
+        
+    Returns:
+        Signed transaction
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, w3.eth.account.sign_transaction, transaction, private_key)
+
+
+async def wait_for_receipt_backoff(w3: Web3,
+                                   tx_hash,
+                                   timeout: float = 120,
+                                   base_delay: float = 0.2,
+                                   max_delay: float = 4.0):
+    """
+    Wait for a transaction receipt, polling on an exponential schedule
+    
+    Blocks on Arc land every couple of seconds, so polling at a fixed 0.1s
+    mostly returns "not found". Delays grow 0.2s, 0.4s, 0.8s, ... up to
+    max_delay, which keeps confirmation latency while cutting RPC load.
+    
+    Args:
+        w3: Web3 instance
+        tx_hash: Transaction hash
+        timeout: Maximum wait time in seconds
+        base_delay: First polling delay in seconds
+        max_delay: Upper bound for the polling delay
+        
+    Returns:
+        Transaction receipt
+        
+    Raises:
+        TimeExhausted: If the transaction is not mined within timeout
+    """
+    start_time = time.time()
+    attempt = 0
+    
+    while True:
+        try:
+            receipt = w3.eth.get_transaction_receipt(tx_hash)
+            if receipt is not None:
+                return receipt
+        except TransactionNotFound:
+            pass
+        
+        remaining = timeout - (time.time() - start_time)
+        if remaining <= 0:
+            raise TimeExhausted(f"Transaction {tx_hash!r} is not in the chain after {timeout} seconds")
+        
+        delay = exponential_backoff(attempt, base_delay, max_delay, jitter=False)
+        await asyncio.sleep(min(delay, remaining))
+        attempt += 1
+
+
 async def get_block_info(client: BlockchainClient, 
                         block_number: Union[int, str] = 'latest') -> Optional[BlockInfo]:
     """Convenience function to get block info"""
@@ -4,15 +4,23 @@ Helper utilities for MEV-Simulator
 Common utility functions used throughout the MEV simulation system.
 """
 
+import asyncio
 import logging
 import os
 import hashlib
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Union, Optional, Dict, Any
+from typing import Union, Optional, Dict, Any, Awaitable, TypeVar
 import structlog
 
+try:
+    import uvloop
+except ImportError:  # Optional: run_async falls back to the default asyncio loop
+    uvloop = None
+
+T = TypeVar("T")
+
 
 def setup_logging(level: str = "INFO", 
                  log_file: Optional[str] = None,
@@ -430,6 +438,21 @@ def setup_environment(env_file: str = ".env") -> None:
         logging.warning(f"Environment file {env_file} not found")
 
 
+def run_async(main: Awaitable[T]) -> T:
+    """
+    Run a coroutine to completion, on uvloop's event loop when it is installed
+    
+    Args:
+        main: Top-level coroutine (as passed to asyncio.run)
+        
+    Returns:
+        The coroutine's result
+    """
+    if uvloop is not None:
+        return uvloop.run(main)
+    return asyncio.run(main)
+
+
 class Timer:
     """Context manager for timing code execution"""
     
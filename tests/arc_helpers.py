@@ -0,0 +1,77 @@
+"""
+Shared constants and helpers for the Arc Testnet integration tests
+
+A plain module, so test files and their ``__main__`` blocks can import it
+directly; conftest.py builds its session fixtures on top of it.
+"""
+import os
+import sys
+
+from web3 import Web3
+from eth_account import Account
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.utils.blockchain import FastHTTPProvider
+from src.deployment.contract_cache import get_contract
+
+
+RPC_URL = "https://arc-testnet.stg.blockchain.circle.com"
+
+VICTIM_KEY = "0x4d58edafc0c6889c6f211cc842a561835015eeaf273d9f8c8ec7ee960804f7ce"
+MEV_KEY = "0x488e3ab7dc2033bc970e83bc6daf50ed83c4927e5d8f5bd5ca971df3d062cac2"
+
+TOKEN1_ADDRESS = "0x6911406ae5C9fa9314B4AEc086304c001fb3b656"
+TOKEN2_ADDRESS = "0x3eaE1139A9A19517B0dB5696073d957542886BF8"
+SWAP_ROUTER_ADDRESS = "0xe372f58a9e03c7b56b3ea9a2a08f18767b75ca67"
+POOL_ADDRESS = "0x39A9Ba5F012aB6D6fc90E563C72bD85949Ca0FF6"
+
+MAX_UINT256 = 2**256 - 1
+
+# Fee caps in wei, precomputed instead of calling w3.to_wei per transaction
+MAX_FEE = 400 * 10**9
+PRIORITY_FEE = 80 * 10**9
+SWAP_MAX_FEE = 350 * 10**9
+SWAP_PRIORITY_FEE = 70 * 10**9
+
+WEI_PER_TOKEN = 10**18
+
+
+def create_arc_web3(rpc_url: str = RPC_URL) -> Web3:
+    """Create Web3 connected to Arc Testnet"""
+    return Web3(FastHTTPProvider(rpc_url))
+
+
+def load_arc_contracts(w3: Web3) -> dict:
+    """Build contract objects for the test tokens, pool and swap router"""
+    return {
+        'token1': get_contract(w3, w3.to_checksum_address(TOKEN1_ADDRESS), "erc20"),
+        'token2': get_contract(w3, w3.to_checksum_address(TOKEN2_ADDRESS), "erc20"),
+        'swap_router': get_contract(w3, w3.to_checksum_address(SWAP_ROUTER_ADDRESS), "router"),
+        'pool': get_contract(w3, w3.to_checksum_address(POOL_ADDRESS), "pool"),
+    }
+
+
+def ensure_max_approvals(w3: Web3, contracts: dict, private_keys: list) -> None:
+    """Approve MAX_UINT256 of both tokens to the swap router for each signer (skips if already done)"""
+    router_address = contracts['swap_router'].address
+
+    for private_key in private_keys:
+        account = Account.from_key(private_key)
+
+        for token in (contracts['token1'], contracts['token2']):
+            allowance = token.functions.allowance(account.address, router_address).call()
+            if allowance >= MAX_UINT256 // 2:
+                continue
+
+            approve_tx = token.functions.approve(router_address, MAX_UINT256).build_transaction({
+                'from': account.address,
+                'nonce': w3.eth.get_transaction_count(account.address),
+                'gas': 100000,
+                'maxFeePerGas': MAX_FEE,
+                'maxPriorityFeePerGas': PRIORITY_FEE,
+            })
+
+            signed = w3.eth.account.sign_transaction(approve_tx, private_key)
+            tx_hash = w3.eth.send_raw_transaction(signed.raw_transaction)
+            w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120, poll_latency=1.0)
@@ -0,0 +1,38 @@
+"""
+Shared setup for the Arc Testnet integration tests
+
+Web3, contract objects and token approvals are created once per pytest
+session and reused by every test module. The constants and plain helper
+functions live in arc_helpers, which the tests' ``__main__`` blocks also
+use so each file still runs as a standalone script.
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from arc_helpers import RPC_URL, VICTIM_KEY, MEV_KEY, create_arc_web3, load_arc_contracts, ensure_max_approvals
+
+
+@pytest.fixture(scope="session")
+def w3():
+    """Web3 connected to Arc Testnet; skips the tests if the RPC is unreachable"""
+    web3 = create_arc_web3()
+    if not web3.is_connected():
+        pytest.skip(f"Arc Testnet RPC not reachable: {RPC_URL}")
+    return web3
+
+
+@pytest.fixture(scope="session")
+def arc_contracts(w3):
+    """Token, pool and swap router contract objects"""
+    return load_arc_contracts(w3)
+
+
+@pytest.fixture(scope="session")
+def approvals_done(w3, arc_contracts):
+    """One-time router approvals for every signer used by the tests"""
+    ensure_max_approvals(w3, arc_contracts, [VICTIM_KEY, MEV_KEY])
+    return True
@@ -10,7 +10,8 @@ from eth_account import Account
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from src.deployment.uniswap_v3_abis import ERC20_ABI, SWAP_ROUTER_ABI
+from src.utils.blockchain import FastHTTPProvider, wait_for_receipt_backoff
+from src.deployment.contract_cache import get_contract
 
 
 async def execute_victim_swap(w3, victim_key, token1_addr, token2_addr, swap_router_addr, amount_in):
@@ -18,7 +19,7 @@ async def execute_victim_swap(w3, victim_key, token1_addr, token2_addr, swap_rou
     victim_account = Account.from_key(victim_key)
     
     # Approve
-    token1 = w3.eth.contract(address=token1_addr, abi=ERC20_ABI)
+    token1 = get_contract(w3, token1_addr, "erc20")
     amount_in_wei = w3.to_wei(amount_in, 'ether')
     
     current_allowance = token1.functions.allowance(victim_account.address, swap_router_addr).call()
@@ -35,10 +36,10 @@ async def execute_victim_swap(w3, victim_key, token1_addr, token2_addr, swap_rou
         
         signed_approve = w3.eth.account.sign_transaction(approve_tx, victim_key)
         approve_hash = w3.eth.send_raw_transaction(signed_approve.raw_transaction)
-        await asyncio.sleep(2)  # Wait for confirmation
+        await wait_for_receipt_backoff(w3, approve_hash, timeout=60)
     
     # Swap
-    swap_router = w3.eth.contract(address=swap_router_addr, abi=SWAP_ROUTER_ABI)
+    swap_router = get_contract(w3, swap_router_addr, "router")
     
     swap_params = {
         'tokenIn': token1_addr,
@@ -72,7 +73,7 @@ async def execute_mev_attack(w3, mev_key, token1_addr, token2_addr, swap_router_
     # Front-run: Buy TOKEN2 (sell TOKEN1)
     print(f"   🔴 Front-run: Sell {front_run_amount} TOKEN1...")
     
-    token1 = w3.eth.contract(address=token1_addr, abi=ERC20_ABI)
+    token1 = get_contract(w3, token1_addr, "erc20")
     amount_in_wei = w3.to_wei(front_run_amount, 'ether')
     
     # Approve if needed
@@ -87,11 +88,11 @@ async def execute_mev_attack(w3, mev_key, token1_addr, token2_addr, swap_router_
             'maxPriorityFeePerGas': w3.to_wei(100, 'gwei'),
         })
         signed = w3.eth.account.sign_transaction(approve_tx, mev_key)
-        w3.eth.send_raw_transaction(signed.raw_transaction)
-        await asyncio.sleep(1)
+        approve_hash = w3.eth.send_raw_transaction(signed.raw_transaction)
+        await wait_for_receipt_backoff(w3, approve_hash, timeout=60)
     
     # Front-run swap
-    swap_router = w3.eth.contract(address=swap_router_addr, abi=SWAP_ROUTER_ABI)
+    swap_router = get_contract(w3, swap_router_addr, "router")
     nonce = w3.eth.get_transaction_count(mev_account.address)
     
     frontrun_params = {
@@ -123,7 +124,7 @@ async def execute_mev_attack(w3, mev_key, token1_addr, token2_addr, swap_router_
     # Back-run: Sell TOKEN2 (buy TOKEN1 back)
     print(f"   🔵 Back-run: Buy back TOKEN1...")
     
-    token2 = w3.eth.contract(address=token2_addr, abi=ERC20_ABI)
+    token2 = get_contract(w3, token2_addr, "erc20")
     backrun_amount_wei = w3.to_wei(back_run_amount, 'ether')
     
     # Approve TOKEN2
@@ -138,8 +139,8 @@ async def execute_mev_attack(w3, mev_key, token1_addr, token2_addr, swap_router_
             'maxPriorityFeePerGas': w3.to_wei(80, 'gwei'),
         })
         signed = w3.eth.account.sign_transaction(approve_tx, mev_key)
-        w3.eth.send_raw_transaction(signed.raw_transaction)
-        await asyncio.sleep(1)
+        approve_hash = w3.eth.send_raw_transaction(signed.raw_transaction)
+        await wait_for_receipt_backoff(w3, approve_hash, timeout=60)
     
     # Back-run swap
     nonce = w3.eth.get_transaction_count(mev_account.address)
@@ -177,7 +178,7 @@ async def test_10_simulations():
     
     # Setup
     rpc_url = "https://arc-testnet.stg.blockchain.circle.com"
-    w3 = Web3(Web3.HTTPProvider(rpc_url))
+    w3 = Web3(FastHTTPProvider(rpc_url))
     
     victim_key = "0x4d58edafc0c6889c6f211cc842a561835015eeaf273d9f8c8ec7ee960804f7ce"
     mev_key = "0x488e3ab7dc2033bc970e83bc6daf50ed83c4927e5d8f5bd5ca971df3d062cac2"
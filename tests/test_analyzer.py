@@ -0,0 +1,93 @@
+"""
+Unit tests for MEVAnalyzer caching and aggregation
+
+Run offline on synthetic frames; no RPC connection is needed.
+"""
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.analysis.analyzer import MEVAnalyzer
+
+
+def make_results(n: int, seed: int) -> pd.DataFrame:
+    """Synthetic simulation results with every column the analyses read"""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'bot_id': rng.choice(['bot_a', 'bot_b', 'bot_c'], size=n),
+        'success': rng.random(n) < 0.6,
+        'net_profit': rng.normal(5.0, 20.0, size=n),
+        'victim_loss': rng.exponential(10.0, size=n),
+        'gas_costs': rng.uniform(0.1, 1.0, size=n),
+        'total_latency_ms': rng.uniform(20.0, 300.0, size=n),
+    })
+
+
+def test_results_recomputed_after_data_replaced():
+    """Reassigning analyzer.data must not reuse columns cached from the old frame"""
+    analyzer = MEVAnalyzer(make_results(500, seed=1))
+    analyzer.analyze_mev_performance()
+    analyzer.analyze_latency_impact()
+
+    new_data = make_results(800, seed=2)
+    analyzer.data = new_data
+
+    financial = analyzer.analyze_mev_performance()['financial_metrics']
+    assert analyzer.analyze_mev_performance()['basic_stats']['total_attacks'] == 800
+    assert financial['total_mev_profit'] == pytest.approx(new_data['net_profit'].sum())
+    assert financial['total_victim_loss'] == pytest.approx(new_data['victim_loss'].sum())
+    assert financial['total_gas_costs'] == pytest.approx(new_data['gas_costs'].sum())
+
+    latency_stats = analyzer.analyze_latency_impact()['latency_stats']
+    assert latency_stats['mean'] == pytest.approx(new_data['total_latency_ms'].mean(), rel=1e-6)
+    assert latency_stats['max'] == pytest.approx(new_data['total_latency_ms'].max(), rel=1e-6)
+
+
+def test_headline_totals_match_per_bot_totals():
+    """Whole-frame financial totals equal the sums of the per-bot figures"""
+    data = make_results(5000, seed=3)
+    results = MEVAnalyzer(data).analyze_mev_performance()
+    financial = results['financial_metrics']
+    bots = results['bot_performance'].values()
+
+    assert financial['total_mev_profit'] == pytest.approx(sum(b['total_profit'] for b in bots), rel=1e-12)
+    assert financial['total_gas_costs'] == pytest.approx(sum(b['total_gas_costs'] for b in bots), rel=1e-12)
+    assert financial['total_victim_loss'] == pytest.approx(sum(b['victim_damage_caused'] for b in bots), rel=1e-12)
+    assert financial['total_mev_profit'] == pytest.approx(data['net_profit'].sum(), rel=1e-12)
+
+
+def test_latency_stats_report_exact_values():
+    """Latency extremes and median are values from the data, not rounded copies"""
+    data = make_results(1001, seed=4)
+    latency_stats = MEVAnalyzer(data).analyze_latency_impact()['latency_stats']
+
+    assert latency_stats['min'] == data['total_latency_ms'].min()
+    assert latency_stats['max'] == data['total_latency_ms'].max()
+    assert latency_stats['median'] == data['total_latency_ms'].median()
+
+
+def test_data_quality_recomputed_after_data_replaced():
+    """Missing-value counts are recomputed for a replacement frame"""
+    analyzer = MEVAnalyzer(make_results(200, seed=5))
+    assert analyzer._data_quality()['missing_values']['net_profit'] == 0
+
+    new_data = make_results(200, seed=6)
+    new_data.loc[:9, 'net_profit'] = np.nan
+    analyzer.data = new_data
+    assert analyzer._data_quality()['missing_values']['net_profit'] == 10
+
+
+def test_invalidate_after_in_place_edit():
+    """In-place edits are picked up once invalidate() is called"""
+    data = make_results(300, seed=7)
+    analyzer = MEVAnalyzer(data)
+    analyzer.analyze_mev_performance()
+
+    analyzer.data.loc[:, 'net_profit'] = 1.0
+    analyzer.invalidate()
+    assert analyzer.analyze_mev_performance()['financial_metrics']['total_mev_profit'] == pytest.approx(300.0)
@@ -5,29 +5,37 @@ Test that backrun bot restores pool price after MEV attack
 import asyncio
 import sys
 import os
+import pytest
 from web3 import Web3
 from eth_account import Account
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from src.deployment.uniswap_v3_abis import ERC20_ABI, SWAP_ROUTER_ABI, UNISWAP_V3_POOL_ABI
+from src.utils.blockchain import GasEstimateCache, wait_for_receipt_backoff, sign_transaction_async
+from src.deployment.contract_cache import get_contract
+from arc_helpers import (
+    VICTIM_KEY, MEV_KEY, MAX_FEE, PRIORITY_FEE, WEI_PER_TOKEN, create_arc_web3, load_arc_contracts
+)
+
+# Gas limits are estimated once per (contract, method, sender) and reused
+gas_cache = GasEstimateCache()
 
 
 def get_pool_price(w3, pool_addr, token1_addr, token2_addr):
-    """Get pool price by checking pool's token reserves"""
-    token1 = w3.eth.contract(address=token1_addr, abi=ERC20_ABI)
-    token2 = w3.eth.contract(address=token2_addr, abi=ERC20_ABI)
-    
-    # Get pool's reserves (how much tokens the pool holds)
-    pool_balance1 = token1.functions.balanceOf(pool_addr).call()
-    pool_balance2 = token2.functions.balanceOf(pool_addr).call()
+    """Get pool spot price (TOKEN2 per TOKEN1) from the pool's slot0"""
+    pool = get_contract(w3, pool_addr, "pool")
     
-    if pool_balance1 == 0:
+    # One eth_call; slot0 price is token1/token0 in the pool's address ordering
+    sqrt_price_x96 = pool.functions.slot0().call()[0]
+    if sqrt_price_x96 == 0:
         return 0
     
-    # Price = reserve2 / reserve1
-    price = pool_balance2 / pool_balance1
-    return price
+    price = (sqrt_price_x96 / (1 << 96)) ** 2
+    
+    # Both test tokens use 18 decimals, so only the ordering needs adjusting
+    if int(token1_addr, 16) < int(token2_addr, 16):
+        return price  # TOKEN1 is token0
+    return 1 / price
 
 
 async def execute_swap(w3, private_key, token_in_addr, token_out_addr, swap_router_addr, amount_in, label=""):
@@ -35,27 +43,28 @@ async def execute_swap(w3, private_key, token_in_addr, token_out_addr, swap_rout
     account = Account.from_key(private_key)
     
     # Approve
-    token_in = w3.eth.contract(address=token_in_addr, abi=ERC20_ABI)
-    amount_in_wei = w3.to_wei(amount_in, 'ether')
+    token_in = get_contract(w3, token_in_addr, "erc20")
+    amount_in_wei = amount_in * WEI_PER_TOKEN if isinstance(amount_in, int) else w3.to_wei(amount_in, 'ether')
     
     current_allowance = token_in.functions.allowance(account.address, swap_router_addr).call()
     
     if current_allowance < amount_in_wei:
         nonce = w3.eth.get_transaction_count(account.address)
-        approve_tx = token_in.functions.approve(swap_router_addr, amount_in_wei * 10).build_transaction({
+        approve_fn = token_in.functions.approve(swap_router_addr, amount_in_wei * 10)
+        approve_tx = approve_fn.build_transaction({
             'from': account.address,
             'nonce': nonce,
-            'gas': 100000,
-            'maxFeePerGas': w3.to_wei(400, 'gwei'),
-            'maxPriorityFeePerGas': w3.to_wei(80, 'gwei'),
+            'gas': gas_cache.get_gas_limit(approve_fn, account.address, 100000),
+            'maxFeePerGas': MAX_FEE,
+            'maxPriorityFeePerGas': PRIORITY_FEE,
         })
         
-        signed = w3.eth.account.sign_transaction(approve_tx, private_key)
-        w3.eth.send_raw_transaction(signed.raw_transaction)
-        await asyncio.sleep(3)
+        signed = await sign_transaction_async(w3, approve_tx, private_key)
+        approve_hash = w3.eth.send_raw_transaction(signed.raw_transaction)
+        await wait_for_receipt_backoff(w3, approve_hash, timeout=60)
     
     # Swap
-    swap_router = w3.eth.contract(address=swap_router_addr, abi=SWAP_ROUTER_ABI)
+    swap_router = get_contract(w3, swap_router_addr, "router")
     
     swap_params = {
         'tokenIn': token_in_addr,
@@ -68,41 +77,37 @@ async def execute_swap(w3, private_key, token_in_addr, token_out_addr, swap_rout
     }
     
     nonce = w3.eth.get_transaction_count(account.address)
-    swap_tx = swap_router.functions.exactInputSingle(swap_params).build_transaction({
+    swap_fn = swap_router.functions.exactInputSingle(swap_params)
+    swap_tx = swap_fn.build_transaction({
         'from': account.address,
         'nonce': nonce,
-        'gas': 800000,
-        'maxFeePerGas': w3.to_wei(400, 'gwei'),
-        'maxPriorityFeePerGas': w3.to_wei(80, 'gwei'),
+        'gas': gas_cache.get_gas_limit(swap_fn, account.address, 800000),
+        'maxFeePerGas': MAX_FEE,
+        'maxPriorityFeePerGas': PRIORITY_FEE,
     })
     
-    signed = w3.eth.account.sign_transaction(swap_tx, private_key)
+    signed = await sign_transaction_async(w3, swap_tx, private_key)
     tx_hash = w3.eth.send_raw_transaction(signed.raw_transaction)
     
     # Wait for transaction to be mined
-    receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=30)
+    receipt = await wait_for_receipt_backoff(w3, tx_hash, timeout=30)
     print(f"   Confirmed at block: {receipt['blockNumber']}")
     
     return tx_hash.hex()
 
 
-async def test_backrun_rebalance():
+async def run_backrun_rebalance(w3: Web3, contracts: dict, victim_key: str, mev_key: str) -> bool:
     print("=" * 70)
     print("Testing Backrun Bot Price Rebalancing")
     print("=" * 70)
     
     # Setup
-    rpc_url = "https://arc-testnet.stg.blockchain.circle.com"
-    w3 = Web3(Web3.HTTPProvider(rpc_url))
-    
-    victim_key = "0x4d58edafc0c6889c6f211cc842a561835015eeaf273d9f8c8ec7ee960804f7ce"
-    mev_key = "0x488e3ab7dc2033bc970e83bc6daf50ed83c4927e5d8f5bd5ca971df3d062cac2"
     backrun_key = mev_key  # Use same key for simplicity
     
-    token1_addr = w3.to_checksum_address("0x6911406ae5C9fa9314B4AEc086304c001fb3b656")
-    token2_addr = w3.to_checksum_address("0x3eaE1139A9A19517B0dB5696073d957542886BF8")
-    pool_addr = w3.to_checksum_address("0x39A9Ba5F012aB6D6fc90E563C72bD85949Ca0FF6")  # Correct pool address
-    swap_router_addr = w3.to_checksum_address("0xe372f58a9e03c7b56b3ea9a2a08f18767b75ca67")
+    token1_addr = contracts['token1'].address
+    token2_addr = contracts['token2'].address
+    pool_addr = contracts['pool'].address
+    swap_router_addr = contracts['swap_router'].address
     
     print(f"\n📊 Initial pool state:")
     initial_price = get_pool_price(w3, pool_addr, token1_addr, token2_addr)
@@ -123,8 +128,9 @@ async def test_backrun_rebalance():
     # No additional sleep needed - wait_for_transaction_receipt already waits
     
     price_after_frontrun = get_pool_price(w3, pool_addr, token1_addr, token2_addr)
+    pct_front = (price_after_frontrun - initial_price) / initial_price * 100
     print(f"   Price after front-run: {price_after_frontrun:.6f}")
-    print(f"   Price change: {((price_after_frontrun - initial_price) / initial_price * 100):+.2f}%")
+    print(f"   Price change: {pct_front:+.2f}%")
     
     print(f"\n{'='*70}")
     print("Step 2: Victim trades (suffers from bad price)")
@@ -136,8 +142,9 @@ async def test_backrun_rebalance():
     print(f"   TX: {victim_tx[:20]}...")
     
     price_after_victim = get_pool_price(w3, pool_addr, token1_addr, token2_addr)
+    pct_victim = (price_after_victim - initial_price) / initial_price * 100
     print(f"   Price after victim: {price_after_victim:.6f}")
-    print(f"   Price change: {((price_after_victim - initial_price) / initial_price * 100):+.2f}%")
+    print(f"   Price change: {pct_victim:+.2f}%")
     
     print(f"\n{'='*70}")
     print("Step 3: Backrun Bot Rebalances (restores price)")
@@ -164,26 +171,31 @@ async def test_backrun_rebalance():
         print(f"   TX: {rebalance_tx[:20]}...")
         
         price_after_backrun = get_pool_price(w3, pool_addr, token1_addr, token2_addr)
+        pct_back = (price_after_backrun - initial_price) / initial_price * 100
         print(f"   Price after backrun: {price_after_backrun:.6f}")
-        print(f"   Price restored to: {((price_after_backrun - initial_price) / initial_price * 100):+.2f}% of original")
+        print(f"   Price restored to: {pct_back:+.2f}% of original")
     else:
         print(f"   ℹ️  Deviation below threshold, no rebalance needed")
         price_after_backrun = price_after_victim
+        pct_back = pct_victim
     
     print(f"\n{'='*70}")
     print("📊 SUMMARY")
     print(f"{'='*70}")
-    print(f"Initial price:       {initial_price:.6f}")
-    print(f"After front-run:     {price_after_frontrun:.6f} ({((price_after_frontrun - initial_price) / initial_price * 100):+.2f}%)")
-    print(f"After victim:        {price_after_victim:.6f} ({((price_after_victim - initial_price) / initial_price * 100):+.2f}%)")
-    print(f"After backrun:       {price_after_backrun:.6f} ({((price_after_backrun - initial_price) / initial_price * 100):+.2f}%)")
     
     # Check if backrun successfully reduced deviation
-    deviation_before = abs(price_after_victim - initial_price) / initial_price
-    deviation_after = abs(price_after_backrun - initial_price) / initial_price
-    
-    print(f"\nDeviation before backrun: {deviation_before:.2%}")
-    print(f"Deviation after backrun:  {deviation_after:.2%}")
+    deviation_before = abs(pct_victim) / 100
+    deviation_after = abs(pct_back) / 100
+    
+    print(
+        f"Initial price:       {initial_price:.6f}\n"
+        f"After front-run:     {price_after_frontrun:.6f} ({pct_front:+.2f}%)\n"
+        f"After victim:        {price_after_victim:.6f} ({pct_victim:+.2f}%)\n"
+        f"After backrun:       {price_after_backrun:.6f} ({pct_back:+.2f}%)\n"
+        f"\n"
+        f"Deviation before backrun: {deviation_before:.2%}\n"
+        f"Deviation after backrun:  {deviation_after:.2%}"
+    )
     
     if deviation_after < deviation_before:
         print(f"\n✅ Backrun bot successfully reduced price deviation!")
@@ -195,9 +207,15 @@ async def test_backrun_rebalance():
         return False
 
 
+@pytest.mark.asyncio
+async def test_backrun_rebalance(w3, arc_contracts, approvals_done):
+    assert await run_backrun_rebalance(w3, arc_contracts, VICTIM_KEY, MEV_KEY)
+
+
 if __name__ == "__main__":
     try:
-        result = asyncio.run(test_backrun_rebalance())
+        w3 = create_arc_web3()
+        result = asyncio.run(run_backrun_rebalance(w3, load_arc_contracts(w3), VICTIM_KEY, MEV_KEY))
         sys.exit(0 if result else 1)
     except KeyboardInterrupt:
         print("\n\n⚠️  Test interrupted")
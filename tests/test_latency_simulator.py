@@ -0,0 +1,97 @@
+"""
+Unit tests for the latency model's numeric kernels
+
+Run offline; no RPC connection is needed.
+"""
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.latency_simulator import (
+    CompetitionLatencyManager, LatencySimulator, LatencyType, _RunningStats
+)
+from src.core.monte_carlo import simulate_rounds
+
+
+def make_manager(seed: int) -> CompetitionLatencyManager:
+    """Manager with one bot per standard profile"""
+    manager = CompetitionLatencyManager(seed=seed)
+    for name, profile in LatencySimulator.PROFILES.items():
+        manager.add_bot(name, profile, seed=seed)
+    return manager
+
+
+def test_simulate_rounds_ranks_and_clipping():
+    """Each round ranks every bot exactly once, fastest first, with no negative latency"""
+    base = np.array([10.0, 50.0, 100.0])
+    jitter = np.array([0.1, 0.5, 1.5])
+    ranks, latencies = simulate_rounds(base, jitter, 300, np.random.default_rng(0))
+
+    assert ranks.shape == latencies.shape == (300, 3)
+    assert (latencies >= 0.0).all()
+    assert (np.sort(ranks, axis=1) == np.arange(1, 4)).all()
+    fastest = np.argmin(latencies, axis=1)
+    assert (ranks[np.arange(300), fastest] == 1).all()
+
+
+def test_run_monte_carlo_reproducible_with_seed():
+    """Same seed, same results (with or without numba installed)"""
+    first = make_manager(seed=7).run_monte_carlo(500, LatencyType.CALCULATION)
+    second = make_manager(seed=7).run_monte_carlo(500, LatencyType.CALCULATION)
+    assert first == second
+    assert first != make_manager(seed=8).run_monte_carlo(500, LatencyType.CALCULATION)
+
+
+def test_running_stats_matches_numpy():
+    """Welford updates, one sample at a time, agree with NumPy's mean, variance and extremes"""
+    values = np.random.default_rng(5).normal(120.0, 30.0, 500)
+    stats = _RunningStats()
+    for x in values:
+        stats.add(float(x))
+
+    result = stats.to_dict()
+    assert result['count'] == values.size
+    assert result['mean'] == pytest.approx(values.mean(), rel=1e-12)
+    assert result['std'] ** 2 == pytest.approx(np.var(values), rel=1e-9)
+    assert result['min'] == values.min()
+    assert result['max'] == values.max()
+
+
+def test_running_stats_batch_merge_matches_numpy():
+    """Chan merges of uneven batches onto scalar Welford updates agree with np.var"""
+    values = np.random.default_rng(5).normal(120.0, 30.0, 1000)
+    stats = _RunningStats()
+    for x in values[:7]:
+        stats.add(float(x))
+    for batch in np.split(values[7:], [1, 250, 600]):
+        stats.add_batch(batch)
+    stats.add_batch(np.empty(0))
+
+    result = stats.to_dict()
+    assert result['count'] == values.size
+    assert result['mean'] == pytest.approx(values.mean(), rel=1e-12)
+    assert result['std'] ** 2 == pytest.approx(np.var(values), rel=1e-9)
+    assert result['min'] == values.min()
+    assert result['max'] == values.max()
+
+
+def test_recent_latencies_wrap_float32_ring():
+    """The raw-sample ring keeps the newest samples, oldest first, stored as float32"""
+    simulator = LatencySimulator("bot", seed=0)
+    simulator.preallocate(8)
+    samples = np.linspace(10.0, 30.0, 13)
+    for x in samples:
+        simulator.record_latency(LatencyType.CALCULATION, float(x))
+
+    recent = simulator.get_recent_latencies(LatencyType.CALCULATION)
+    assert recent.dtype == np.float32
+    np.testing.assert_array_equal(recent, samples[-8:].astype(np.float32))
+
+    # Running statistics still cover every sample, in float64
+    stats = simulator.get_statistics()['calculation']
+    assert stats['count'] == 13
+    assert stats['mean'] == pytest.approx(samples.mean(), rel=1e-12)
@@ -0,0 +1,134 @@
+"""
+Unit tests for MEV bot strategy state and batch statistics
+
+Run offline with fixed seeds; no RPC connection is needed.
+"""
+import asyncio
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.latency_simulator import LatencyProfile, LatencySimulator
+from src.core.mev_bot import (
+    AdaptiveStrategy, AttackResult, BotStrategy, MEVBot, simulate_attacks_batch
+)
+
+
+def make_results(profits) -> list:
+    """Attack results with the given net profits (positive ones count as successes)"""
+    return [
+        AttackResult(opportunity_id=f"opp_{i}", bot_id="bot", attack_type="sandwich",
+                     success=profit > 0, net_profit=profit)
+        for i, profit in enumerate(profits)
+    ]
+
+
+# Zero latency, so simulated delays don't sleep
+INSTANT = LatencyProfile(0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+
+
+def make_bot(bot_id: str, strategy: BotStrategy = BotStrategy.CONSERVATIVE, seed: int = 0) -> MEVBot:
+    return MEVBot(bot_id, strategy, LatencySimulator(bot_id, INSTANT, seed=seed),
+                  wallet_address="0x" + "00" * 20, wallet_private_key="0x" + "11" * 32,
+                  initial_balance=1e6, seed=seed)
+
+
+def test_simulate_attacks_batch_seeded():
+    """Seeded batches are reproducible and follow the sandwich outcome model"""
+    estimated_profit = np.full(20000, 10.0)
+    batch = simulate_attacks_batch(estimated_profit, 0.5, 0.4, np.random.default_rng(11))
+    again = simulate_attacks_batch(estimated_profit, 0.5, 0.4, np.random.default_rng(11))
+    np.testing.assert_array_equal(batch, again)
+
+    success = batch['success']
+    assert success.mean() == pytest.approx(0.8, abs=0.01)
+
+    # Failed attacks pay the estimated gas and move nothing
+    failed = batch[~success]
+    assert (failed['gross_profit'] == 0.0).all()
+    assert (failed['gas_costs'] == 0.5).all()
+    assert (failed['slippage_caused'] == 0.0).all()
+
+    won = batch[success]
+    assert ((won['gross_profit'] >= 8.0) & (won['gross_profit'] <= 12.0)).all()
+    assert ((won['gas_costs'] >= 0.45) & (won['gas_costs'] <= 0.65)).all()
+    assert won['slippage_caused'] == pytest.approx(0.008)
+    assert won['pool_price_impact'] == pytest.approx(0.004)
+    np.testing.assert_allclose(batch['net_profit'], batch['gross_profit'] - batch['gas_costs'])
+
+
+def test_same_seed_bots_act_identically():
+    """Bots sharing a seed draw the same confidences, decisions and outcomes"""
+    block = {'pending_transactions': [
+        {'type': 'swap', 'hash': f'0x{i:064x}', 'amount_in': 20.0 + 5.0 * i,
+         'pool_address': '0x' + '0c' * 20, 'token_in': 'TOKEN1', 'token_out': 'TOKEN2'}
+        for i in range(40)
+    ]}
+
+    async def run(bot: MEVBot) -> list:
+        opportunities = await bot.detect_mev_opportunity(block)
+        results = [await bot.evaluate_and_execute(opp, competition_level=0.3) for opp in opportunities]
+        return [(opp.confidence_score, None if r is None else (r.success, r.net_profit))
+                for opp, r in zip(opportunities, results)]
+
+    for strategy in (BotStrategy.CONSERVATIVE, BotStrategy.SLOW):
+        first = asyncio.run(run(make_bot("bot", strategy, seed=21)))
+        second = asyncio.run(run(make_bot("bot", strategy, seed=21)))
+        assert first == second
+        # The conservative confidence gate (> 0.8) skipped some opportunities and took others
+        decisions = {result is None for _, result in first}
+        assert decisions == {True, False}
+
+
+def test_adaptive_history_wraps_around_ring_buffer():
+    """History keeps the newest PERFORMANCE_HISTORY_SIZE profits, oldest first, across the wrap point"""
+    strategy = AdaptiveStrategy()
+    size = strategy.PERFORMANCE_HISTORY_SIZE
+    profits = np.arange(size + 10, dtype=np.float64)
+
+    # Uneven chunks so one push straddles the end of the buffer
+    for chunk in np.split(profits, [size - 3, size + 4]):
+        strategy.adapt_to_results(make_results(chunk))
+
+    assert strategy._perf_idx == 10
+    np.testing.assert_array_equal(strategy.performance_history, profits[-size:])
+
+
+def test_adaptive_recent_performance_across_wrap():
+    """Window means match a plain slice whether or not they straddle the wrap point"""
+    strategy = AdaptiveStrategy()
+    size = strategy.PERFORMANCE_HISTORY_SIZE
+    profits = np.random.default_rng(3).normal(0.0, 1.0, size + 5)
+    strategy.adapt_to_results(make_results(profits))
+
+    for n in (3, 5, 10, size):
+        assert strategy._recent_performance(n) == pytest.approx(profits[-n:].mean())
+
+    # A request longer than the history is capped at what is available
+    short = AdaptiveStrategy()
+    short.adapt_to_results(make_results([1.0, -3.0]))
+    assert short._recent_performance(10) == pytest.approx(-1.0)
+
+
+def test_fleet_stats_matches_per_bot_totals():
+    """Fleet aggregates equal the sums of each bot's own statistics"""
+    bots = [make_bot("bot_a"), make_bot("bot_b"), make_bot("bot_c")]
+    for bot, profits in zip(bots, ([1.0, -0.5, 2.0], [3.0], [])):
+        for result in make_results(profits):
+            bot._record_result(result)
+
+    stats = MEVBot.fleet_stats(bots)
+    per_bot = [bot.get_performance_stats() for bot in bots]
+
+    assert stats['bot_count'] == 3
+    assert stats['total_attacks'] == sum(s['total_attacks'] for s in per_bot) == 4
+    assert stats['successful_attacks'] == 3
+    assert stats['success_rate'] == pytest.approx(0.75)
+    assert stats['total_profit'] == pytest.approx(sum(s['total_profit'] for s in per_bot))
+    assert stats['avg_profit_per_attack'] == pytest.approx(5.5 / 4)
+
+    assert MEVBot.fleet_stats([])['total_attacks'] == 0
@@ -0,0 +1,101 @@
+"""
+Unit tests for PoolManager's offline swap model
+
+Pools are registered directly in created_pools, so no RPC connection or
+deployment is needed.
+"""
+import asyncio
+import math
+import os
+import sys
+
+import numpy as np
+import pytest
+from web3 import Web3
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.pool_manager import PoolInfo, PoolManager, TokenInfo, _optimal_arb_amount, _swap_price
+
+NETWORK_CONFIG = {
+    'contracts': {
+        'uniswap_v3_factory': "0x" + "01" * 20,
+        'uniswap_v3_router': "0x" + "02" * 20,
+        'position_manager': "0x" + "03" * 20,
+        'quoter_v2': "0x" + "04" * 20,
+    }
+}
+DEPLOYER_KEY = "0x" + "11" * 32
+
+
+def make_pool(key: str, price_ratio: float, liquidity_tokens: float) -> PoolInfo:
+    """TOKEN1/TOKEN2 pool at the given token1-per-token0 price"""
+    token0 = TokenInfo("0x" + "0a" * 20, "Token 1", "TOKEN1", 18, 10**27)
+    token1 = TokenInfo("0x" + "0b" * 20, "Token 2", "TOKEN2", 18, 10**27)
+    return PoolInfo(
+        address="0x" + "0c" * 20, token0=token0, token1=token1, fee=3000,
+        current_tick=0, sqrt_price_x96=math.isqrt(int(price_ratio * (1 << 192))),
+        liquidity=int(liquidity_tokens * 10**18), key=key
+    )
+
+
+def test_simulate_swap_prices_both_directions():
+    """The Q64.96 path converts token0->token1 at the price and token1->token0 at its inverse"""
+    manager = PoolManager(Web3(), NETWORK_CONFIG, DEPLOYER_KEY)
+    pool = make_pool("pool", 4.0, 1e6)
+    assert pool.sqrt_price_x96 == 2 << 96  # sqrt(4.0) = 2.0, exact in Q64.96
+    manager.created_pools = {"pool": pool}
+
+    forward = asyncio.run(manager.simulate_swap("pool", "TOKEN1", 10.0))
+    backward = asyncio.run(manager.simulate_swap("pool", "TOKEN2", 10.0))
+
+    assert forward['token_out'] == "TOKEN2" and backward['token_out'] == "TOKEN1"
+    assert forward['amount_out_ideal'] == pytest.approx(10.0 * 4.0, rel=1e-15)
+    assert backward['amount_out_ideal'] == pytest.approx(10.0 / 4.0, rel=1e-15)
+
+    # Same size-based impact in both directions: 10 tokens against 1e6 of liquidity
+    impact = 10.0 / 1e6 * 0.01
+    assert forward['amount_out'] == pytest.approx(40.0 * (1 - impact), rel=1e-12)
+    assert backward['amount_out'] == pytest.approx(2.5 * (1 - impact), rel=1e-12)
+
+
+def test_optimal_arb_amount_matches_brute_force():
+    """The closed-form size lands on the best size of a fine scan over simulate_swap"""
+    manager = PoolManager(Web3(), NETWORK_CONFIG, DEPLOYER_KEY)
+    buy_pool = make_pool("buy", 2.0, 1e6)
+    sell_pool = make_pool("sell", 1.99, 2e6)
+    manager.created_pools = {"buy": buy_pool, "sell": sell_pool}
+
+    optimum = _optimal_arb_amount(
+        buy_pool.liquidity, _swap_price(buy_pool, "TOKEN1"),
+        sell_pool.liquidity, _swap_price(sell_pool, "TOKEN2"),
+        PoolManager.SLIPPAGE_TOLERANCE
+    )
+    assert optimum > 0
+
+    async def round_trip_profits(amounts: np.ndarray) -> np.ndarray:
+        profits = np.empty(amounts.size)
+        for i, amount in enumerate(amounts):
+            bought = await manager.simulate_swap("buy", "TOKEN1", float(amount), slippage_tolerance=1.0)
+            sold = await manager.simulate_swap("sell", "TOKEN2", bought['amount_out'], slippage_tolerance=1.0)
+            profits[i] = sold['amount_out'] - amount
+        return profits
+
+    amounts = np.linspace(0.0, 2.0 * optimum, 2001)[1:]
+    profits = asyncio.run(round_trip_profits(amounts))
+    best = int(np.argmax(profits))
+
+    assert 0 < best < amounts.size - 1  # Interior maximum, not a scan edge
+    assert amounts[best] == pytest.approx(optimum, rel=0.01)
+    profit_at_optimum, = asyncio.run(round_trip_profits(np.array([optimum])))
+    assert profit_at_optimum == pytest.approx(profits[best], rel=1e-4)
+
+
+def test_optimal_arb_amount_unprofitable_and_capped():
+    """No trade without a price gap; a large gap is capped at the per-leg impact limit"""
+    assert _optimal_arb_amount(10**24, 2.0, 10**24, 0.5, 0.005) == 0.0
+
+    liquidity = 10**24
+    amount = _optimal_arb_amount(liquidity, 2.0, liquidity, 0.6, 0.005)
+    k_buy = 0.01 * 10**18 / liquidity
+    assert amount == pytest.approx(0.005 / (k_buy * 2.0))
@@ -6,6 +6,7 @@ Tests that victim can execute swaps on actual blockchain
 import asyncio
 import sys
 import os
+import pytest
 import yaml
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -14,7 +15,7 @@ from src.core.simulator import MEVSimulator
 from src.utils.helpers import setup_logging
 
 
-async def test_simple_victim_trades():
+async def run_simple_victim_trades() -> bool:
     print("=" * 70)
     print("Simple Victim Trading Test (Blockchain)")
     print("=" * 70)
@@ -100,9 +101,15 @@ async def test_simple_victim_trades():
     return successful_trades > 0
 
 
+@pytest.mark.asyncio
+async def test_simple_victim_trades(w3):
+    # The simulator opens its own connection; the w3 fixture only skips when Arc is unreachable
+    assert await run_simple_victim_trades()
+
+
 if __name__ == "__main__":
     try:
-        result = asyncio.run(test_simple_victim_trades())
+        result = asyncio.run(run_simple_victim_trades())
         sys.exit(0 if result else 1)
     except KeyboardInterrupt:
         print("\n\n⚠️  Simulation interrupted by user")
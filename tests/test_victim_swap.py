@@ -5,6 +5,7 @@ Simple test to verify victim can execute a swap transaction on Arc Testnet
 import asyncio
 import sys
 import os
+import pytest
 from web3 import Web3
 from eth_account import Account
 
@@ -12,25 +13,28 @@ from eth_account import Account
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from src.deployment.deployer import ContractDeployer
-from src.deployment.uniswap_v3_abis import ERC20_ABI, SWAP_ROUTER_ABI
+from src.utils.blockchain import GasEstimateCache, wait_for_receipt_backoff
+from arc_helpers import (
+    VICTIM_KEY, MAX_FEE, PRIORITY_FEE, SWAP_MAX_FEE, SWAP_PRIORITY_FEE, WEI_PER_TOKEN,
+    create_arc_web3, load_arc_contracts
+)
 
+# Gas limits are estimated once per (contract, method, sender) and reused
+gas_cache = GasEstimateCache()
 
-async def test_victim_swap():
+
+async def run_victim_swap(w3: Web3, contracts: dict, victim_key: str) -> bool:
     print("=" * 60)
     print("Testing Victim Swap Transaction")
     print("=" * 60)
     
-    # Configuration
-    rpc_url = "https://arc-testnet.stg.blockchain.circle.com"
-    victim_key = "0x4d58edafc0c6889c6f211cc842a561835015eeaf273d9f8c8ec7ee960804f7ce"
-    
-    # Setup Web3 first to use to_checksum_address
-    w3 = Web3(Web3.HTTPProvider(rpc_url))
+    token1 = contracts['token1']
+    token2 = contracts['token2']
+    swap_router = contracts['swap_router']
     
-    token1_address = w3.to_checksum_address("0x6911406ae5C9fa9314B4AEc086304c001fb3b656")
-    token2_address = w3.to_checksum_address("0x3eaE1139A9A19517B0dB5696073d957542886BF8")
-    swap_router_address = w3.to_checksum_address("0xe372f58a9e03c7b56b3ea9a2a08f18767b75ca67")
-    pool_address = w3.to_checksum_address("0x39A9Ba5F012aB6D6fc90E563C72bD85949Ca0FF6")
+    token1_address = token1.address
+    token2_address = token2.address
+    swap_router_address = swap_router.address
     
     victim_account = Account.from_key(victim_key)
     
@@ -39,9 +43,6 @@ async def test_victim_swap():
     print(f"📦 Tx Count: {w3.eth.get_transaction_count(victim_account.address)}")
     
     # Check token balances
-    token1 = w3.eth.contract(address=token1_address, abi=ERC20_ABI)
-    token2 = w3.eth.contract(address=token2_address, abi=ERC20_ABI)
-    
     token1_balance = token1.functions.balanceOf(victim_account.address).call()
     token2_balance = token2.functions.balanceOf(victim_account.address).call()
     
@@ -49,7 +50,7 @@ async def test_victim_swap():
     print(f"💎 TOKEN2 Balance: {w3.from_wei(token2_balance, 'ether')}")
     
     # Prepare swap: 50 TOKEN1 -> TOKEN2
-    amount_in = w3.to_wei(50, 'ether')
+    amount_in = 50 * WEI_PER_TOKEN
     
     print(f"\n🔄 Executing swap: 50 TOKEN1 -> TOKEN2")
     
@@ -59,30 +60,26 @@ async def test_victim_swap():
     
     if current_allowance < amount_in:
         nonce = w3.eth.get_transaction_count(victim_account.address)
-        approve_tx = token1.functions.approve(
-            swap_router_address,
-            amount_in
-        ).build_transaction({
+        approve_fn = token1.functions.approve(swap_router_address, amount_in)
+        approve_tx = approve_fn.build_transaction({
             'from': victim_account.address,
             'nonce': nonce,
-            'gas': 100000,
-            'maxFeePerGas': w3.to_wei(400, 'gwei'),
-            'maxPriorityFeePerGas': w3.to_wei(80, 'gwei'),
+            'gas': gas_cache.get_gas_limit(approve_fn, victim_account.address, 100000),
+            'maxFeePerGas': MAX_FEE,
+            'maxPriorityFeePerGas': PRIORITY_FEE,
         })
         
         signed_approve = w3.eth.account.sign_transaction(approve_tx, victim_key)
         approve_hash = w3.eth.send_raw_transaction(signed_approve.raw_transaction)
         print(f"Approve TX: {approve_hash.hex()}")
         
-        approve_receipt = w3.eth.wait_for_transaction_receipt(approve_hash, timeout=120)
+        approve_receipt = await wait_for_receipt_backoff(w3, approve_hash, timeout=120)
         print(f"✅ Approved at block {approve_receipt['blockNumber']}")
     else:
         print(f"✅ Already approved (allowance: {w3.from_wei(current_allowance, 'ether')})")
     
     # Step 2: Swap
     print("\nStep 2: Executing swap...")
-    swap_router = w3.eth.contract(address=swap_router_address, abi=SWAP_ROUTER_ABI)
-    
     swap_params = {
         'tokenIn': token1_address,
         'tokenOut': token2_address,
@@ -94,19 +91,20 @@ async def test_victim_swap():
     }
     
     nonce = w3.eth.get_transaction_count(victim_account.address)
-    swap_tx = swap_router.functions.exactInputSingle(swap_params).build_transaction({
+    swap_fn = swap_router.functions.exactInputSingle(swap_params)
+    swap_tx = swap_fn.build_transaction({
         'from': victim_account.address,
         'nonce': nonce,
-        'gas': 800000,
-        'maxFeePerGas': w3.to_wei(350, 'gwei'),
-        'maxPriorityFeePerGas': w3.to_wei(70, 'gwei'),
+        'gas': gas_cache.get_gas_limit(swap_fn, victim_account.address, 800000),
+        'maxFeePerGas': SWAP_MAX_FEE,
+        'maxPriorityFeePerGas': SWAP_PRIORITY_FEE,
     })
     
     signed_swap = w3.eth.account.sign_transaction(swap_tx, victim_key)
     swap_hash = w3.eth.send_raw_transaction(signed_swap.raw_transaction)
     print(f"Swap TX: {swap_hash.hex()}")
     
-    swap_receipt = w3.eth.wait_for_transaction_receipt(swap_hash, timeout=120)
+    swap_receipt = await wait_for_receipt_backoff(w3, swap_hash, timeout=120)
     
     if swap_receipt['status'] == 1:
         print(f"✅ Swap successful at block {swap_receipt['blockNumber']}")
@@ -134,7 +132,13 @@ async def test_victim_swap():
     return True
 
 
+@pytest.mark.asyncio
+async def test_victim_swap(w3, arc_contracts, approvals_done):
+    assert await run_victim_swap(w3, arc_contracts, VICTIM_KEY)
+
+
 if __name__ == "__main__":
-    result = asyncio.run(test_victim_swap())
+    w3 = create_arc_web3()
+    result = asyncio.run(run_victim_swap(w3, load_arc_contracts(w3), VICTIM_KEY))
     sys.exit(0 if result else 1)
 